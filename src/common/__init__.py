@@ -2,13 +2,12 @@
 
 This module provides shared types, configuration, logging, and exceptions
 that all other modules depend on.
+
+Submodules are imported lazily on first attribute access, so importing e.g.
+``src.common.exceptions`` does not pull in pandas, pydantic or structlog.
 """
 
-from . import types
-from . import config
-from . import logging
-from . import exceptions
-from . import utils
+import importlib
 
 __all__ = [
     "types",
@@ -17,3 +16,15 @@ __all__ = [
     "exceptions",
     "utils",
 ]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
@@ -1,10 +1,58 @@
 """Configuration loader for YAML files."""
 
+import functools
+import os
+
 import yaml
 from pathlib import Path
 from typing import Optional, Union
 
-from .schemas import PipelineConfig
+from . import schemas_fast
+from .schemas import DataSourceConfig, PipelineConfig
+
+# Prefer the libyaml-backed C loader/dumper; fall back to the pure-Python ones
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeDumper as _SafeDumper
+    from yaml import SafeLoader as _SafeLoader
+
+# Default configuration, validated once at import and copied on each use
+_DEFAULT_CONFIG = PipelineConfig(
+    name="data_wrangler",
+    version="1.0.0",
+    data_source=DataSourceConfig(type="csv", path=None),
+)
+
+
+# Opt-in switch for validating through msgspec instead of pydantic
+FAST_CONFIG_ENV_VAR = "DATA_WRANGLER_FAST_CONFIG"
+
+
+def _fast_config_enabled() -> bool:
+    """Check whether the msgspec fast path is requested and available."""
+    flag = os.environ.get(FAST_CONFIG_ENV_VAR, "").strip().lower()
+    return schemas_fast.HAS_MSGSPEC and flag in ("1", "true", "yes")
+
+
+@functools.lru_cache(maxsize=32)
+def _load_cached(path_str: str, mtime_ns: int, size: int, fast: bool = False) -> PipelineConfig:
+    """Parse and validate a config file.
+
+    The modification time and size are part of the cache key only, so that an
+    edited file is re-parsed instead of served from the cache.
+    """
+    # Hand the raw bytes to the loader so decoding happens inside libyaml
+    with open(path_str, "rb") as f:
+        config_dict = yaml.load(f, Loader=_SafeLoader)
+
+    if config_dict is None:
+        raise ValueError(f"Empty configuration file: {path_str}")
+
+    if fast:
+        return schemas_fast.convert(config_dict)
+    return PipelineConfig.model_validate(config_dict)
 
 
 class ConfigLoader:
@@ -14,6 +62,12 @@ class ConfigLoader:
     def load(config_path: Union[str, Path]) -> PipelineConfig:
         """Load configuration from a YAML file.
 
+        Parsed configurations are cached per file and invalidated when the
+        file changes on disk. Each call returns an independent copy.
+
+        Setting the DATA_WRANGLER_FAST_CONFIG environment variable validates
+        through msgspec instead of pydantic when msgspec is installed.
+
         Args:
             config_path: Path to the YAML configuration file
 
@@ -28,13 +82,16 @@ class ConfigLoader:
         if not path.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-        with open(path, "r") as f:
-            config_dict = yaml.safe_load(f)
+        stat = path.stat()
+        config = _load_cached(
+            str(path.resolve()), stat.st_mtime_ns, stat.st_size, _fast_config_enabled()
+        )
+        return config.model_copy(deep=True)
 
-        if config_dict is None:
-            raise ValueError(f"Empty configuration file: {config_path}")
-
-        return PipelineConfig(**config_dict)
+    @staticmethod
+    def clear_cache() -> None:
+        """Clear the cache of parsed configuration files."""
+        _load_cached.cache_clear()
 
     @staticmethod
     def load_or_default(config_path: Optional[Union[str, Path]] = None) -> PipelineConfig:
@@ -48,11 +105,7 @@ class ConfigLoader:
         """
         if config_path is None:
             # Return default configuration
-            return PipelineConfig(
-                name="data_wrangler",
-                version="1.0.0",
-                data_source={"type": "csv", "path": None},
-            )
+            return _DEFAULT_CONFIG.model_copy(deep=True)
 
         return ConfigLoader.load(config_path)
 
@@ -67,5 +120,12 @@ class ConfigLoader:
         path = Path(config_path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(path, "w") as f:
-            yaml.dump(config.model_dump(), f, default_flow_style=False, sort_keys=False)
+        # Emit the whole document in one C call, then write it once
+        path.write_text(
+            yaml.dump(
+                config.model_dump(mode="python"),
+                Dumper=_SafeDumper,
+                default_flow_style=False,
+                sort_keys=False,
+            )
+        )
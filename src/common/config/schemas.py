@@ -1,10 +1,17 @@
 """Configuration schemas using Pydantic."""
 
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 
 
-class DataSourceConfig(BaseModel):
+class _ConfigModel(BaseModel):
+    """Base for configuration schemas: immutable once loaded, extras dropped."""
+
+    model_config = ConfigDict(frozen=True, extra="ignore", validate_default=False)
+
+
+class DataSourceConfig(_ConfigModel):
     """Configuration for a data source."""
 
     type: str = Field(description="Type of data source (e.g., 'csv', 'parquet', 'database')")
@@ -13,7 +20,7 @@ class DataSourceConfig(BaseModel):
     options: dict = Field(default_factory=dict, description="Additional options")
 
 
-class ProfilingConfig(BaseModel):
+class ProfilingConfig(_ConfigModel):
     """Configuration for data profiling."""
 
     enabled: bool = True
@@ -22,7 +29,7 @@ class ProfilingConfig(BaseModel):
     compute_correlations: bool = False
 
 
-class TransformationConfig(BaseModel):
+class TransformationConfig(_ConfigModel):
     """Configuration for transformations."""
 
     max_candidates: int = Field(default=100, description="Maximum number of transformation candidates")
@@ -38,7 +45,8 @@ class TransformationConfig(BaseModel):
     )
 
 
-class ValidationConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ValidationConfig:
     """Configuration for validation."""
 
     strict_mode: bool = False
@@ -46,10 +54,11 @@ class ValidationConfig(BaseModel):
     check_constraints: bool = True
 
 
-class ScoringConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ScoringConfig:
     """Configuration for quality scoring."""
 
-    weights: dict[str, float] = Field(
+    weights: dict[str, float] = field(
         default_factory=lambda: {
             "completeness": 0.3,
             "consistency": 0.2,
@@ -59,23 +68,30 @@ class ScoringConfig(BaseModel):
     )
 
 
-class RankingConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class RankingConfig:
     """Configuration for ranking transformations."""
 
     enabled: bool = True
-    top_k: int = Field(default=10, description="Number of top transformations to return")
+    top_k: int = 10  # Number of top transformations to return
 
 
-class LoggingConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class LoggingConfig:
     """Configuration for logging."""
 
-    level: str = Field(default="INFO", description="Log level")
-    format: str = Field(default="json", description="Log format (json or console)")
-    output: str = Field(default="stdout", description="Output destination")
+    level: str = "INFO"  # Log level
+    format: str = "json"  # Log format (json or console)
+    output: str = "stdout"  # Output destination
+
 
+class PipelineConfig(_ConfigModel):
+    """Main pipeline configuration.
 
-class PipelineConfig(BaseModel):
-    """Main pipeline configuration."""
+    The validation, scoring, ranking and logging sections are plain slotted
+    dataclasses; pydantic still builds and type-checks them from the loaded
+    mapping here, so this model remains the single validation boundary.
+    """
 
     name: str = "data_wrangler"
     version: str = "1.0.0"
@@ -0,0 +1,132 @@
+"""msgspec mirrors of the configuration schemas.
+
+msgspec is an optional dependency. When it is installed, a loaded mapping can
+be decoded into ``PipelineConfigFast`` at C speed and then adapted to the
+regular ``PipelineConfig`` without running the pydantic validators a second
+time. ``ConfigLoader`` only takes this path when ``DATA_WRANGLER_FAST_CONFIG``
+is set.
+"""
+
+from typing import Any, Optional
+
+from .schemas import (
+    DataSourceConfig,
+    LoggingConfig,
+    PipelineConfig,
+    ProfilingConfig,
+    RankingConfig,
+    ScoringConfig,
+    TransformationConfig,
+    ValidationConfig,
+)
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - exercised when msgspec is absent
+    msgspec = None
+
+
+HAS_MSGSPEC = msgspec is not None
+
+
+if HAS_MSGSPEC:
+
+    class DataSourceConfigFast(msgspec.Struct, frozen=True):
+        type: str
+        path: Optional[str] = None
+        connection_string: Optional[str] = None
+        options: dict = msgspec.field(default_factory=dict)
+
+    class ProfilingConfigFast(msgspec.Struct, frozen=True):
+        enabled: bool = True
+        sample_size: Optional[int] = None
+        compute_stats: bool = True
+        compute_correlations: bool = False
+
+    class TransformationConfigFast(msgspec.Struct, frozen=True):
+        max_candidates: int = 100
+        allowed_types: list[str] = msgspec.field(
+            default_factory=lambda: list(TransformationConfig().allowed_types)
+        )
+
+    class ValidationConfigFast(msgspec.Struct, frozen=True):
+        strict_mode: bool = False
+        check_schema: bool = True
+        check_constraints: bool = True
+
+    class ScoringConfigFast(msgspec.Struct, frozen=True):
+        weights: dict[str, float] = msgspec.field(
+            default_factory=lambda: dict(ScoringConfig().weights)
+        )
+
+    class RankingConfigFast(msgspec.Struct, frozen=True):
+        enabled: bool = True
+        top_k: int = 10
+
+    class LoggingConfigFast(msgspec.Struct, frozen=True):
+        level: str = "INFO"
+        format: str = "json"
+        output: str = "stdout"
+
+    class PipelineConfigFast(msgspec.Struct, frozen=True):
+        """msgspec mirror of PipelineConfig."""
+
+        data_source: DataSourceConfigFast
+        name: str = "data_wrangler"
+        version: str = "1.0.0"
+        max_iterations: int = 10
+        timeout_seconds: int = 300
+        profiling: ProfilingConfigFast = msgspec.field(default_factory=ProfilingConfigFast)
+        transformation: TransformationConfigFast = msgspec.field(
+            default_factory=TransformationConfigFast
+        )
+        validation: ValidationConfigFast = msgspec.field(default_factory=ValidationConfigFast)
+        scoring: ScoringConfigFast = msgspec.field(default_factory=ScoringConfigFast)
+        ranking: RankingConfigFast = msgspec.field(default_factory=RankingConfigFast)
+        logging: LoggingConfigFast = msgspec.field(default_factory=LoggingConfigFast)
+
+        def to_pydantic(self) -> PipelineConfig:
+            """Adapt to a PipelineConfig without re-running validation.
+
+            Returns:
+                PipelineConfig: Equivalent pydantic configuration
+            """
+            fields = msgspec.structs.asdict
+            return PipelineConfig.model_construct(
+                name=self.name,
+                version=self.version,
+                max_iterations=self.max_iterations,
+                timeout_seconds=self.timeout_seconds,
+                data_source=DataSourceConfig.model_construct(**fields(self.data_source)),
+                profiling=ProfilingConfig.model_construct(**fields(self.profiling)),
+                transformation=TransformationConfig.model_construct(
+                    **fields(self.transformation)
+                ),
+                validation=ValidationConfig(**fields(self.validation)),
+                scoring=ScoringConfig(**fields(self.scoring)),
+                ranking=RankingConfig(**fields(self.ranking)),
+                logging=LoggingConfig(**fields(self.logging)),
+            )
+
+
+def convert(config_dict: dict[str, Any]) -> PipelineConfig:
+    """Validate a loaded mapping with msgspec and return a PipelineConfig.
+
+    Args:
+        config_dict: Mapping parsed from a configuration file
+
+    Returns:
+        PipelineConfig: Validated pipeline configuration
+
+    Raises:
+        ImportError: If msgspec is not installed
+        ValueError: If the mapping does not match the schema
+    """
+    if not HAS_MSGSPEC:
+        raise ImportError("msgspec is required for the fast config path")
+
+    try:
+        fast = msgspec.convert(config_dict, PipelineConfigFast)
+    except msgspec.ValidationError as e:
+        raise ValueError(str(e)) from e
+    return fast.to_pydantic()
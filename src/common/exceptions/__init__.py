@@ -1,12 +1,25 @@
 """Exceptions module for the data wrangler."""
 
-from .base import DataWranglerError
-from .profiling import ProfilingError
-from .transformation import TransformationError
-from .validation import ValidationError
-from .scoring import ScoringError
-from .ranking import RankingError
-from .orchestration import OrchestrationError
+from .base import DataWranglerError, _make_error
+
+ProfilingError = _make_error(
+    "ProfilingError", "Exception raised during data profiling operations."
+)
+TransformationError = _make_error(
+    "TransformationError", "Exception raised during data transformation operations."
+)
+ValidationError = _make_error(
+    "ValidationError", "Exception raised during data validation operations."
+)
+ScoringError = _make_error(
+    "ScoringError", "Exception raised during quality scoring operations."
+)
+RankingError = _make_error(
+    "RankingError", "Exception raised during transformation ranking operations."
+)
+OrchestrationError = _make_error(
+    "OrchestrationError", "Exception raised during pipeline orchestration operations."
+)
 
 __all__ = [
     "DataWranglerError",
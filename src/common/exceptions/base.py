@@ -7,6 +7,8 @@ class DataWranglerError(Exception):
     All custom exceptions in the data wrangler should inherit from this class.
     """
 
+    __slots__ = ("message", "details")
+
     def __init__(self, message: str, details: dict | None = None):
         """Initialize the exception.
 
@@ -18,9 +20,26 @@ class DataWranglerError(Exception):
         self.message = message
         self.details = details or {}
 
+    def __reduce__(self):
+        """Support pickling, which does not capture slot attributes by default."""
+        return (self.__class__, (self.message, self.details))
+
     def __str__(self) -> str:
         """Return string representation of the error."""
         if self.details:
-            details_str = ", ".join(f"{k}={v}" for k, v in self.details.items())
+            details_str = ", ".join([f"{k}={v}" for k, v in self.details.items()])
             return f"{self.message} ({details_str})"
         return self.message
+
+
+def _make_error(name: str, doc: str) -> type[DataWranglerError]:
+    """Create a DataWranglerError subclass with the given name and docstring.
+
+    Args:
+        name: Class name of the exception
+        doc: Docstring of the exception class
+
+    Returns:
+        The new exception class
+    """
+    return type(name, (DataWranglerError,), {"__doc__": doc, "__module__": "src.common.exceptions"})
@@ -1,31 +1,34 @@
 """Structured logging setup using structlog."""
 
+import functools
 import logging
 import sys
 from typing import Any, Optional
 
 import structlog
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
 
-def setup_logging(
-    level: str = "INFO",
-    format_type: str = "json",
-    output: str = "stdout",
-) -> structlog.BoundLogger:
-    """Setup structured logging with structlog.
 
-    Args:
-        level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-        format_type: Output format ('json' or 'console')
-        output: Output destination ('stdout', 'stderr', or file path)
+def _orjson_dumps(obj: Any, default: Any = None, **_kwargs: Any) -> str:
+    """json.dumps-compatible serializer backed by orjson.
 
-    Returns:
-        A configured structlog logger
+    Returns ``str`` rather than ``bytes`` because the print-based logger
+    factory writes text.
     """
-    # Configure logging level
-    log_level = getattr(logging, level.upper(), logging.INFO)
+    return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+
 
-    # Configure processors
+# (level, format_type, stream) of the last setup_logging call
+_last_key: Optional[tuple[str, str, Any]] = None
+
+
+@functools.lru_cache(maxsize=None)
+def _build_processors(format_type: str) -> tuple:
+    """Build the structlog processor chain for an output format."""
     processors = [
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
@@ -36,7 +39,10 @@ def setup_logging(
 
     # Add format processor based on format_type
     if format_type == "json":
-        processors.append(structlog.processors.JSONRenderer())
+        if orjson is not None:
+            processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps))
+        else:
+            processors.append(structlog.processors.JSONRenderer())
     else:
         # Console format - use a more readable format
         processors.append(
@@ -45,24 +51,53 @@ def setup_logging(
             )
         )
 
+    return tuple(processors)
+
+
+def setup_logging(
+    level: str = "INFO",
+    format_type: str = "json",
+    output: str = "stdout",
+) -> structlog.BoundLogger:
+    """Setup structured logging with structlog.
+
+    Args:
+        level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        format_type: Output format ('json' or 'console')
+        output: Output destination ('stdout', 'stderr', or file path)
+
+    Returns:
+        A configured structlog logger
+    """
+    # Configuring structlog resets its cached bound loggers, so skip it when
+    # nothing changed since the last call. The stream object itself is part of
+    # the key because sys.stdout/sys.stderr may have been replaced since.
+    global _last_key
+    stream = sys.stdout if output == "stdout" else sys.stderr
+    key = (level, format_type, stream)
+    if key == _last_key and structlog.is_configured():
+        return structlog.get_logger()
+
+    # Configure logging level
+    log_level = getattr(logging, level.upper(), logging.INFO)
+
     # Configure structlog
     structlog.configure(
-        processors=processors,
+        processors=list(_build_processors(format_type)),
         wrapper_class=structlog.make_filtering_bound_logger(log_level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(
-            file=sys.stdout if output == "stdout" else sys.stderr
-        ),
+        logger_factory=structlog.PrintLoggerFactory(file=stream),
         cache_logger_on_first_use=True,
     )
 
     # Also configure the standard library logging
     logging.basicConfig(
         format="%(message)s",
-        stream=sys.stdout if output == "stdout" else sys.stderr,
+        stream=stream,
         level=log_level,
     )
 
+    _last_key = key
     return structlog.get_logger()
 
 
@@ -1,6 +1,6 @@
 """Common types for the data wrangler."""
 
-from .data_profile import DataProfile, ColumnProfile
+from .data_profile import DataProfile, ColumnProfile, ColumnProfileTable
 from .transformation import Transformation, TransformationType, TransformationResult
 from .validation import ValidationResult, ValidationIssue
 from .quality import QualityMetrics, QualityDelta
@@ -11,6 +11,7 @@ __all__ = [
     # Data profile types
     "DataProfile",
     "ColumnProfile",
+    "ColumnProfileTable",
     # Transformation types
     "Transformation",
     "TransformationType",
@@ -4,6 +4,8 @@ from pydantic import BaseModel
 from typing import Optional
 from datetime import datetime
 
+import numpy as np
+
 
 class ColumnProfile(BaseModel):
     """Profile information for a single column."""
@@ -12,6 +14,8 @@ class ColumnProfile(BaseModel):
     dtype: str
     null_count: int
     null_percentage: float
+    # Exact up to 100k non-null values; above that the pandas backend
+    # reports a HyperLogLog estimate (~0.8% standard error)
     unique_count: Optional[int] = None
     min_value: Optional[float] = None
     max_value: Optional[float] = None
@@ -29,3 +33,92 @@ class DataProfile(BaseModel):
     columns: dict[str, ColumnProfile]
     overall_missing_percentage: float
     duplicate_rows: int
+
+    def column_table(self) -> "ColumnProfileTable":
+        """Return the column profiles in columnar (struct-of-arrays) form."""
+        return ColumnProfileTable.from_columns(self.columns)
+
+
+class ColumnProfileTable:
+    """Column profiles stored as parallel arrays, one entry per column.
+
+    This is a columnar view of ``DataProfile.columns`` for consumers that scan
+    one metric across many columns, e.g. ``(table.null_percentages > 50).sum()``.
+    Optional numeric fields are stored as float64 with NaN for missing values.
+    """
+
+    def __init__(
+        self,
+        names: list[str],
+        dtypes: list[str],
+        inferred_types: list[str],
+        null_counts: np.ndarray,
+        null_percentages: np.ndarray,
+        unique_counts: np.ndarray,
+        min_values: np.ndarray,
+        max_values: np.ndarray,
+        means: np.ndarray,
+        stds: np.ndarray,
+    ):
+        self.names = names
+        self.dtypes = dtypes
+        self.inferred_types = np.asarray(inferred_types, dtype=object)
+        self.null_counts = null_counts
+        self.null_percentages = null_percentages
+        self.unique_counts = unique_counts
+        self.min_values = min_values
+        self.max_values = max_values
+        self.means = means
+        self.stds = stds
+        self.index = {name: i for i, name in enumerate(names)}
+
+    @classmethod
+    def from_columns(cls, columns: dict[str, ColumnProfile]) -> "ColumnProfileTable":
+        """Build a table from a mapping of column name to ColumnProfile."""
+        profiles = list(columns.values())
+
+        def optional(field: str) -> np.ndarray:
+            values = [getattr(p, field) for p in profiles]
+            return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+        return cls(
+            names=list(columns.keys()),
+            dtypes=[p.dtype for p in profiles],
+            inferred_types=[p.inferred_type for p in profiles],
+            null_counts=np.array([p.null_count for p in profiles], dtype=np.int64),
+            null_percentages=np.array([p.null_percentage for p in profiles], dtype=np.float64),
+            unique_counts=optional("unique_count"),
+            min_values=optional("min_value"),
+            max_values=optional("max_value"),
+            means=optional("mean"),
+            stds=optional("std"),
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def row(self, i: int) -> ColumnProfile:
+        """Materialize the ColumnProfile for the column at position ``i``."""
+
+        def optional(values: np.ndarray) -> Optional[float]:
+            value = values[i]
+            return None if np.isnan(value) else float(value)
+
+        unique_count = optional(self.unique_counts)
+        return ColumnProfile(
+            name=self.names[i],
+            dtype=self.dtypes[i],
+            null_count=int(self.null_counts[i]),
+            null_percentage=float(self.null_percentages[i]),
+            unique_count=None if unique_count is None else int(unique_count),
+            min_value=optional(self.min_values),
+            max_value=optional(self.max_values),
+            mean=optional(self.means),
+            std=optional(self.stds),
+            inferred_type=self.inferred_types[i],
+        )
+
+    def get(self, name: str) -> Optional[ColumnProfile]:
+        """Materialize the ColumnProfile for a column by name, if present."""
+        i = self.index.get(name)
+        return None if i is None else self.row(i)
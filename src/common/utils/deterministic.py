@@ -14,17 +14,21 @@ class DeterministicManager:
     _original_numpy_state: Optional[str] = None
 
     @classmethod
-    def set_seed(cls, seed: int) -> None:
+    def set_seed(cls, seed: int, snapshot: bool = True) -> None:
         """Set the random seed for reproducibility.
 
         Args:
             seed: The seed value to use
+            snapshot: Whether to save the current global random states so
+                that reset() can restore them. Skip this when the states
+                will never be restored; copying them is not free.
         """
         cls._seed = seed
 
         # Store original states
-        cls._original_random_state = random.getstate()
-        cls._original_numpy_state = np.random.get_state()
+        if snapshot:
+            cls._original_random_state = random.getstate()
+            cls._original_numpy_state = np.random.get_state()
 
         # Set new seeds
         random.seed(seed)
@@ -93,11 +97,9 @@ def sample_without_replacement(
     Returns:
         A list of k sampled items
     """
-    if seed is not None:
-        DeterministicManager.set_seed(seed)
-
-    try:
+    if seed is None:
         return random.sample(population, k)
-    finally:
-        if seed is not None:
-            DeterministicManager.reset()
+
+    # A private generator gives the same draw as seeding the global one,
+    # without touching (or having to restore) any global state
+    return random.Random(seed).sample(population, k)
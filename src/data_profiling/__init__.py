@@ -1,18 +1,22 @@
 """Data profiling module for analyzing and profiling DataFrames."""
 
-from .interfaces import DataProfiler
-from .schema_detector import (
-    SchemaDetector,
-    infer_column_type,
-    INFERRED_NUMERIC,
-    INFERRED_CATEGORICAL,
-    INFERRED_DATETIME,
-    INFERRED_TEXT,
-    INFERRED_BOOLEAN,
-)
-from .missing_value_analyzer import MissingValueAnalyzer
-from .statistical_summarizer import StatisticalSummarizer
-from .profiler import DataProfilerService
+import importlib
+
+# Public name -> defining submodule; resolved lazily on first access so that
+# importing the package does not import pandas until it is actually needed
+_LAZY_ATTRS = {
+    "DataProfiler": ".interfaces",
+    "SchemaDetector": ".schema_detector",
+    "infer_column_type": ".schema_detector",
+    "INFERRED_NUMERIC": ".schema_detector",
+    "INFERRED_CATEGORICAL": ".schema_detector",
+    "INFERRED_DATETIME": ".schema_detector",
+    "INFERRED_TEXT": ".schema_detector",
+    "INFERRED_BOOLEAN": ".schema_detector",
+    "MissingValueAnalyzer": ".missing_value_analyzer",
+    "StatisticalSummarizer": ".statistical_summarizer",
+    "DataProfilerService": ".profiler",
+}
 
 __all__ = [
     # Interfaces
@@ -32,3 +36,16 @@ __all__ = [
     # Main profiler service
     "DataProfilerService",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
@@ -2,18 +2,52 @@
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
+
+from ._kernels import row_missing_and_hist
 
 
 class MissingValueAnalyzer:
     """Analyzes missing values in a DataFrame."""
     
-    def analyze(self, data: pd.DataFrame) -> Dict[str, Dict[str, float]]:
+    def missing_masks(self, data: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Build the null mask and the empty-string mask for a DataFrame.
+        
+        The empty-string mask only covers object/string columns. Pass the
+        result to analyze, get_overall_missing_stats and get_missing_patterns
+        to share one pair of masks across calls on the same, unchanged frame.
+        
+        Args:
+            data: The pandas DataFrame to analyze.
+            
+        Returns:
+            Tuple of (null_mask, empty_mask)
+        """
+        null_mask = data.isna()
+        string_columns = data.select_dtypes(include=['object', 'string']).columns
+        empty_mask = data[string_columns] == ''
+        return null_mask, empty_mask
+    
+    def _missing_counts(
+        self, data: pd.DataFrame, masks: Optional[Tuple[pd.DataFrame, pd.DataFrame]]
+    ) -> Tuple[pd.Series, pd.Series]:
+        """Return per-column (null_counts, empty_string_counts)."""
+        null_mask, empty_mask = masks if masks is not None else self.missing_masks(data)
+        empty_counts = empty_mask.sum().reindex(data.columns, fill_value=0)
+        return null_mask.sum(), empty_counts
+    
+    def analyze(
+        self,
+        data: pd.DataFrame,
+        masks: Optional[Tuple[pd.DataFrame, pd.DataFrame]] = None,
+    ) -> Dict[str, Dict[str, float]]:
         """
         Analyze missing values for all columns in a DataFrame.
         
         Args:
             data: The pandas DataFrame to analyze.
+            masks: Optional (null_mask, empty_mask) from missing_masks(data).
             
         Returns:
             Dictionary mapping column names to {
@@ -25,45 +59,55 @@ class MissingValueAnalyzer:
                 'total_missing_percentage': float
             }
         """
-        results = {}
         total_rows = len(data)
         
-        for column in data.columns:
-            # Get the series
-            series = data[column]
-            
-            # Count null/NaN values
-            null_count = series.isna().sum()
-            null_percentage = (null_count / total_rows * 100) if total_rows > 0 else 0.0
-            
-            # Count empty strings (only for object/string columns)
-            if series.dtype == 'object' or pd.api.types.is_string_dtype(series):
-                empty_string_count = (series == '').sum()
-            else:
-                empty_string_count = 0
-            empty_string_percentage = (empty_string_count / total_rows * 100) if total_rows > 0 else 0.0
-            
-            # Total missing = null + empty strings
-            total_missing_count = null_count + empty_string_count
-            total_missing_percentage = (total_missing_count / total_rows * 100) if total_rows > 0 else 0.0
-            
+        # Count null/NaN values and empty strings (object/string columns only)
+        null_counts, empty_counts = self._missing_counts(data, masks)
+        null_counts = null_counts.to_numpy()
+        empty_counts = empty_counts.to_numpy()
+        
+        # Total missing = null + empty strings
+        total_counts = null_counts + empty_counts
+        
+        if total_rows > 0:
+            null_percentages = null_counts / total_rows * 100
+            empty_percentages = empty_counts / total_rows * 100
+            total_percentages = total_counts / total_rows * 100
+        else:
+            null_percentages = empty_percentages = total_percentages = np.zeros(len(data.columns))
+        
+        results = {}
+        for column, null_count, null_pct, empty_count, empty_pct, total_count, total_pct in zip(
+            data.columns,
+            null_counts.tolist(),
+            null_percentages.tolist(),
+            empty_counts.tolist(),
+            empty_percentages.tolist(),
+            total_counts.tolist(),
+            total_percentages.tolist(),
+        ):
             results[column] = {
                 'null_count': int(null_count),
-                'null_percentage': float(null_percentage),
-                'empty_string_count': int(empty_string_count),
-                'empty_string_percentage': float(empty_string_percentage),
-                'total_missing_count': int(total_missing_count),
-                'total_missing_percentage': float(total_missing_percentage)
+                'null_percentage': float(null_pct),
+                'empty_string_count': int(empty_count),
+                'empty_string_percentage': float(empty_pct),
+                'total_missing_count': int(total_count),
+                'total_missing_percentage': float(total_pct)
             }
         
         return results
     
-    def get_overall_missing_stats(self, data: pd.DataFrame) -> Dict[str, float]:
+    def get_overall_missing_stats(
+        self,
+        data: pd.DataFrame,
+        masks: Optional[Tuple[pd.DataFrame, pd.DataFrame]] = None,
+    ) -> Dict[str, float]:
         """
         Get overall missing value statistics for the entire DataFrame.
         
         Args:
             data: The pandas DataFrame to analyze.
+            masks: Optional (null_mask, empty_mask) from missing_masks(data).
             
         Returns:
             Dictionary with:
@@ -77,28 +121,15 @@ class MissingValueAnalyzer:
         total_columns = len(data.columns)
         total_cells = total_rows * total_columns
         
-        # Calculate total missing across all columns
-        total_null = data.isna().sum().sum()
-        
-        # Count empty strings for object columns
-        total_empty = 0
-        for column in data.columns:
-            if data[column].dtype == 'object' or pd.api.types.is_string_dtype(data[column]):
-                total_empty += (data[column] == '').sum()
+        # Null and empty-string counts per column, derived in a single pass
+        null_counts, empty_counts = self._missing_counts(data, masks)
+        missing_per_column = null_counts + empty_counts
         
-        total_missing = total_null + total_empty
+        total_missing = int(missing_per_column.sum())
         overall_missing_percentage = (total_missing / total_cells * 100) if total_cells > 0 else 0.0
         
         # Count columns with any missing values
-        columns_with_missing = 0
-        for column in data.columns:
-            series = data[column]
-            null_count = series.isna().sum()
-            empty_count = 0
-            if series.dtype == 'object' or pd.api.types.is_string_dtype(series):
-                empty_count = (series == '').sum()
-            if null_count + empty_count > 0:
-                columns_with_missing += 1
+        columns_with_missing = int((missing_per_column > 0).sum())
         
         columns_complete = total_columns - columns_with_missing
         
@@ -110,34 +141,35 @@ class MissingValueAnalyzer:
             'columns_complete': int(columns_complete)
         }
     
-    def get_missing_patterns(self, data: pd.DataFrame) -> pd.DataFrame:
+    def get_missing_patterns(
+        self,
+        data: pd.DataFrame,
+        masks: Optional[Tuple[pd.DataFrame, pd.DataFrame]] = None,
+    ) -> pd.DataFrame:
         """
         Analyze patterns in missing values across rows.
         
         Args:
             data: The pandas DataFrame to analyze.
+            masks: Optional (null_mask, empty_mask) from missing_masks(data).
             
         Returns:
             DataFrame with missing value pattern analysis.
         """
-        # Create a boolean mask for missing values
-        missing_mask = data.isna()
-        
-        # Add empty string detection columns
-        for column in data.columns:
-            if data[column].dtype == 'object' or pd.api.types.is_string_dtype(data[column]):
-                missing_mask[column] = missing_mask[column] | (data[column] == '')
-        
-        # Count missing values per row
-        missing_per_row = missing_mask.sum(axis=1)
+        # Combine null and empty-string masks into one missing mask
+        null_mask, empty_mask = masks if masks is not None else self.missing_masks(data)
+        missing_mask = null_mask | empty_mask.reindex(columns=data.columns, fill_value=False)
         
-        # Get unique patterns and their counts
-        pattern_counts = missing_mask.groupby(by=missing_per_row).size()
+        # Count missing values per row and bucket rows by that count
+        mask_arr = missing_mask.to_numpy(dtype=np.uint8)
+        _, hist = row_missing_and_hist(mask_arr)
+        missing_counts = np.flatnonzero(hist)
+        num_rows = hist[missing_counts]
         
         result = pd.DataFrame({
-            'missing_count': pattern_counts.index,
-            'num_rows': pattern_counts.values,
-            'percentage': (pattern_counts.values / len(data) * 100) if len(data) > 0 else 0
+            'missing_count': missing_counts,
+            'num_rows': num_rows,
+            'percentage': (num_rows / len(data) * 100) if len(data) > 0 else 0
         })
         
         return result
@@ -1,14 +1,130 @@
 """Main data profiler service."""
 
+import os
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 from src.common.types import DataProfile, ColumnProfile
-from .schema_detector import SchemaDetector, infer_column_type
+from ._kernels import HLL_MIN_ROWS, hll_nunique, numeric_stats
+from .schema_detector import SchemaDetector, infer_column_type, PARALLEL_COLUMN_THRESHOLD
 from .missing_value_analyzer import MissingValueAnalyzer
 from .statistical_summarizer import StatisticalSummarizer
 
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover - exercised when polars is absent
+    pl = None
+
+try:
+    import cudf
+except ImportError:  # pragma: no cover - exercised when cuDF is absent
+    cudf = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - exercised when pyarrow is absent
+    pa = pc = pq = None
+
+
+# Profiling backends accepted by DataProfilerService
+PROFILING_BACKENDS = ('pandas', 'polars', 'cudf')
+
+# Smaller frames stay on the CPU: the host-to-device copy would dominate
+GPU_MIN_ROWS = 1_000_000
+
+# Inferred types that get a unique count
+_UNIQUE_COUNT_TYPES = ('numeric', 'categorical', 'text', 'datetime', 'boolean')
+
+
+# Object columns below this unique ratio are profiled as category dtype
+DOWNCAST_CATEGORY_RATIO = 0.5
+
+
+def _parquet_footer_stats(metadata: Any) -> Dict[str, Dict[str, Any]]:
+    """
+    Aggregate Parquet row-group statistics per top-level column.
+    
+    A column only gets an entry for a statistic when every row group
+    records it: null counts are summed, min/max take the extremes.
+    
+    Args:
+        metadata: pyarrow.parquet.FileMetaData of the file.
+        
+    Returns:
+        Dictionary mapping column names to {'null_count', 'min', 'max'};
+        missing statistics are None.
+    """
+    footer: Dict[str, Dict[str, Any]] = {}
+    for j in range(metadata.num_columns):
+        column_meta = [metadata.row_group(i).column(j) for i in range(metadata.num_row_groups)]
+        name = column_meta[0].path_in_schema if column_meta else metadata.schema.column(j).path
+        if '.' in name:  # nested field, no top-level column statistics
+            continue
+        
+        stats = [c.statistics for c in column_meta]
+        entry = {'null_count': None, 'min': None, 'max': None}
+        if stats and all(st is not None and getattr(st, 'has_null_count', True) for st in stats):
+            entry['null_count'] = sum(st.null_count for st in stats)
+        if stats and all(st is not None and st.has_min_max for st in stats):
+            try:
+                entry['min'] = min(st.min for st in stats)
+                entry['max'] = max(st.max for st in stats)
+            except TypeError:  # values without a total order
+                pass
+        footer[name] = entry
+    return footer
+
+
+def _downcast_for_profiling(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return a shallow copy of data with narrower dtypes where that is lossless.
+    
+    Integer columns shrink to the smallest integer type that holds them,
+    float64 columns become float32 only when every value round-trips
+    exactly, and low-cardinality object columns become categoricals.
+    """
+    if not data.columns.is_unique:
+        return data
+    
+    converted = {}
+    for column in data.columns:
+        series = data[column]
+        dtype = series.dtype
+        is_numpy = isinstance(dtype, np.dtype)
+        
+        if is_numpy and dtype.kind == 'i':
+            narrowed = pd.to_numeric(series, downcast='integer')
+        elif is_numpy and dtype.kind == 'u':
+            narrowed = pd.to_numeric(series, downcast='unsigned')
+        elif dtype == np.float64:
+            narrowed = series.astype(np.float32)
+            values = series.to_numpy()
+            if not np.array_equal(narrowed.to_numpy(np.float64), values, equal_nan=True):
+                continue
+        elif dtype == object or isinstance(dtype, pd.StringDtype):
+            count = series.count()
+            if count == 0 or series.nunique() / count >= DOWNCAST_CATEGORY_RATIO:
+                continue
+            narrowed = series.astype('category')
+        else:
+            continue
+        
+        if narrowed.dtype != dtype:
+            converted[column] = narrowed
+    
+    if not converted:
+        return data
+    
+    data_opt = data.copy(deep=False)
+    for column, narrowed in converted.items():
+        data_opt[column] = narrowed
+    return data_opt
+
 
 class DataProfilerService:
     """
@@ -18,8 +134,36 @@ class DataProfilerService:
     and statistical summarization to produce a complete DataProfile.
     """
     
-    def __init__(self):
-        """Initialize the data profiler service."""
+    def __init__(self, downcast_for_profiling: bool = False, backend: str = 'pandas'):
+        """
+        Initialize the data profiler service.
+        
+        Args:
+            downcast_for_profiling: Hash, count and summarize a copy of the
+                data with narrower dtypes (see _downcast_for_profiling).
+                Schema detection, missing value analysis and the reported
+                dtypes always use the original data.
+            backend: 'pandas' (default), 'polars' or 'cudf'. The polars
+                backend computes missing/unique counts, numeric statistics
+                and duplicates in one lazy query; the cudf backend runs the
+                same reductions on the GPU for frames of at least
+                GPU_MIN_ROWS rows. Frames a backend cannot convert are
+                profiled with pandas.
+        
+        Raises:
+            ValueError: If the backend is unknown.
+            ImportError: If the polars or cudf backend is requested without
+                the library installed.
+        """
+        if backend not in PROFILING_BACKENDS:
+            raise ValueError(f"Unknown profiling backend: {backend}")
+        if backend == 'polars' and pl is None:
+            raise ImportError("The polars profiling backend requires polars")
+        if backend == 'cudf' and cudf is None:
+            raise ImportError("The cudf profiling backend requires cuDF")
+        
+        self.backend = backend
+        self.downcast_for_profiling = downcast_for_profiling
         self.schema_detector = SchemaDetector()
         self.missing_value_analyzer = MissingValueAnalyzer()
         self.statistical_summarizer = StatisticalSummarizer()
@@ -36,138 +180,459 @@ class DataProfilerService:
         Returns:
             DataProfile containing schema, missing values, and statistics.
         """
+        profile, _ = self._profile_with_intermediates(data)
+        return profile
+    
+    def _profile_with_intermediates(
+        self, data: pd.DataFrame
+    ) -> Tuple[DataProfile, Dict[str, Any]]:
+        """
+        Profile a DataFrame and keep the per-service results it was built from.
+        
+        Returns:
+            Tuple of (DataProfile, intermediates) where intermediates holds
+            'inferred_types' and, when the pandas path ran, also
+            'missing_analysis', 'overall_missing' and 'statistics'.
+        """
         row_count = len(data)
         column_count = len(data.columns)
         
         # Get inferred types for all columns (with caching)
         inferred_types = self.schema_detector.detect(data)
         
-        # Get missing value analysis for all columns
-        missing_analysis = self.missing_value_analyzer.analyze(data)
+        profile = None
+        if self.backend == 'polars':
+            profile = self._profile_polars(data, inferred_types)
+        elif self.backend == 'cudf' and row_count >= GPU_MIN_ROWS:
+            profile = self._profile_cudf(data, inferred_types)
+        if profile is not None:
+            return profile, {'inferred_types': inferred_types}
+        
+        # Get missing value analysis for all columns and overall, sharing
+        # one pair of masks within this run
+        masks = self.missing_value_analyzer.missing_masks(data)
+        missing_analysis = self.missing_value_analyzer.analyze(data, masks)
+        overall_missing = self.missing_value_analyzer.get_overall_missing_stats(data, masks)
         
-        # Get overall missing stats
-        overall_missing = self.missing_value_analyzer.get_overall_missing_stats(data)
+        # Narrower dtypes for the memory-bound hashing and reduction passes
+        data_opt = _downcast_for_profiling(data) if self.downcast_for_profiling else data
         
         # Get statistical summaries (pass inferred types to avoid redundant detection)
-        stats = self.statistical_summarizer.summarize(data, inferred_types)
+        stats = self.statistical_summarizer.summarize(data_opt, inferred_types)
         
         # Count duplicate rows with adaptive approach
         # Use hash-based approach for better accuracy
-        duplicate_rows = self._count_duplicates(data)
+        duplicate_rows = self._count_duplicates(data_opt)
         
         # Build ColumnProfile for each column
-        columns: Dict[str, ColumnProfile] = {}
+        args = [
+            (
+                column,
+                data_opt[column],
+                inferred_types[column],
+                missing_analysis[column],
+                stats[column],
+                str(data[column].dtype),
+            )
+            for column in data.columns
+        ]
+        
+        if column_count >= PARALLEL_COLUMN_THRESHOLD:
+            # Wide frame: pandas releases the GIL in most reductions
+            with ThreadPoolExecutor(max_workers=min(column_count, os.cpu_count() or 1)) as ex:
+                results = list(ex.map(lambda a: self._profile_one(*a), args))
+        else:
+            results = [self._profile_one(*a) for a in args]
+        
+        columns: Dict[str, ColumnProfile] = dict(results)
+        
+        # Create the DataProfile
+        profile = DataProfile(
+            timestamp=datetime.now(),
+            row_count=row_count,
+            column_count=column_count,
+            columns=columns,
+            overall_missing_percentage=overall_missing['overall_missing_percentage'],
+            duplicate_rows=duplicate_rows
+        )
+        
+        intermediates = {
+            'inferred_types': inferred_types,
+            'missing_analysis': missing_analysis,
+            'overall_missing': overall_missing,
+            'statistics': stats,
+        }
+        return profile, intermediates
+    
+    def _profile_polars(
+        self, data: pd.DataFrame, inferred_types: Dict[str, str]
+    ) -> Optional[DataProfile]:
+        """
+        Profile a DataFrame with a single fused polars aggregation.
+        
+        Returns:
+            The DataProfile, or None if the frame cannot be converted to
+            polars (e.g. non-string column labels or mixed object columns).
+        """
+        if not all(isinstance(column, str) for column in data.columns) or not data.columns.is_unique:
+            return None
+        
+        try:
+            frame = pl.from_pandas(data, rechunk=True)
+        except Exception:  # conversion errors vary by polars version
+            return None
+        
+        exprs = []
+        for column, dtype in frame.schema.items():
+            col = pl.col(column)
+            exprs.append(col.null_count().alias(f'{column}\0null'))
+            exprs.append(col.drop_nulls().n_unique().alias(f'{column}\0unique'))
+            if dtype == pl.Utf8:
+                exprs.append((col == '').sum().alias(f'{column}\0empty'))
+            if inferred_types[column] == 'numeric':
+                values = col.cast(pl.Float64, strict=False)
+                exprs.append(values.min().alias(f'{column}\0min'))
+                exprs.append(values.max().alias(f'{column}\0max'))
+                exprs.append(values.mean().alias(f'{column}\0mean'))
+                exprs.append(values.std(ddof=0).alias(f'{column}\0std'))
+        
+        aggregates = frame.lazy().select(exprs).collect().row(0, named=True) if exprs else {}
+        duplicate_rows = (frame.height - frame.unique().height) if frame.width else 0
+        return self._profile_from_aggregates(data, inferred_types, aggregates, duplicate_rows)
+    
+    def _profile_cudf(
+        self, data: pd.DataFrame, inferred_types: Dict[str, str]
+    ) -> Optional[DataProfile]:
+        """
+        Profile a DataFrame on the GPU with cuDF.
+        
+        Only the per-column scalar results are copied back to the host.
+        
+        Returns:
+            The DataProfile, or None if the frame cannot be moved to cuDF.
+        """
+        if not data.columns.is_unique:
+            return None
         
+        try:
+            frame = cudf.from_pandas(data)
+        except Exception:  # unsupported dtypes or mixed object columns
+            return None
+        
+        aggregates = {}
+        null_counts = frame.isna().sum().to_pandas()
+        for column in data.columns:
+            col = frame[column]
+            aggregates[f'{column}\0null'] = int(null_counts[column])
+            aggregates[f'{column}\0unique'] = int(col.nunique())
+            if col.dtype == object:
+                aggregates[f'{column}\0empty'] = int((col == '').sum())
+            if inferred_types[column] == 'numeric':
+                values = cudf.to_numeric(col, errors='coerce').astype('float64')
+                if values.notna().any():
+                    aggregates[f'{column}\0min'] = float(values.min())
+                    aggregates[f'{column}\0max'] = float(values.max())
+                    aggregates[f'{column}\0mean'] = float(values.mean())
+                    aggregates[f'{column}\0std'] = float(values.std(ddof=0))
+        
+        duplicate_rows = int(frame.duplicated().sum()) if len(data.columns) else 0
+        return self._profile_from_aggregates(data, inferred_types, aggregates, duplicate_rows)
+    
+    def _profile_from_aggregates(
+        self,
+        data: pd.DataFrame,
+        inferred_types: Dict[str, str],
+        aggregates: Dict[str, Any],
+        duplicate_rows: int,
+    ) -> DataProfile:
+        """
+        Build a DataProfile from per-column scalars computed by a backend.
+        
+        Args:
+            aggregates: Scalars keyed '<column>\\0<stat>' for the stats null,
+                unique, and optionally empty, min, max, mean and std.
+            duplicate_rows: Number of duplicate rows.
+        """
+        row_count = len(data)
+        total_missing = 0
+        columns: Dict[str, ColumnProfile] = {}
         for column in data.columns:
-            series = data[column]
             inferred_type = inferred_types[column]
-            missing_info = missing_analysis[column]
-            column_stats = stats[column]
-            
-            # Get unique count - use adaptive sampling for large columns
-            unique_count = self._get_unique_count(series, inferred_type)
-            
-            # Get min/max/mean/std for numeric columns
-            min_value = None
-            max_value = None
-            mean = None
-            std = None
+            missing = aggregates[f'{column}\0null'] + (aggregates.get(f'{column}\0empty') or 0)
+            total_missing += missing
             
-            if inferred_type == 'numeric' and column_stats:
-                min_value = column_stats.get('min')
-                max_value = column_stats.get('max')
-                mean = column_stats.get('mean')
-                std = column_stats.get('std')
-            
-            # Use total_missing_count and total_missing_percentage to include empty strings
-            column_profile = ColumnProfile(
+            columns[column] = ColumnProfile(
                 name=column,
-                dtype=str(series.dtype),
-                null_count=missing_info['total_missing_count'],
-                null_percentage=missing_info['total_missing_percentage'],
-                unique_count=unique_count,
-                min_value=min_value,
-                max_value=max_value,
-                mean=mean,
-                std=std,
+                dtype=str(data[column].dtype),
+                null_count=missing,
+                null_percentage=(missing / row_count * 100) if row_count else 0.0,
+                unique_count=(
+                    aggregates[f'{column}\0unique'] if inferred_type in _UNIQUE_COUNT_TYPES else None
+                ),
+                min_value=aggregates.get(f'{column}\0min'),
+                max_value=aggregates.get(f'{column}\0max'),
+                mean=aggregates.get(f'{column}\0mean'),
+                std=aggregates.get(f'{column}\0std'),
                 inferred_type=inferred_type
             )
-            
-            columns[column] = column_profile
         
-        # Create the DataProfile
-        profile = DataProfile(
+        total_cells = row_count * len(data.columns)
+        return DataProfile(
             timestamp=datetime.now(),
             row_count=row_count,
-            column_count=column_count,
+            column_count=len(data.columns),
             columns=columns,
-            overall_missing_percentage=overall_missing['overall_missing_percentage'],
+            overall_missing_percentage=(total_missing / total_cells * 100) if total_cells else 0.0,
             duplicate_rows=duplicate_rows
         )
+    
+    def _profile_one(
+        self,
+        column: str,
+        series: pd.Series,
+        inferred_type: str,
+        missing_info: Dict[str, Any],
+        column_stats: Dict[str, Any],
+        dtype: Optional[str] = None,
+    ) -> Tuple[str, ColumnProfile]:
+        """
+        Build the ColumnProfile for a single column.
         
-        return profile
+        Args:
+            dtype: dtype to report; defaults to the dtype of series.
+        
+        Returns:
+            Tuple of (column name, ColumnProfile).
+        """
+        # Get unique count - use adaptive sampling for large columns
+        unique_count = self._get_unique_count(series, inferred_type)
+        
+        # Get min/max/mean/std for numeric columns
+        min_value = None
+        max_value = None
+        mean = None
+        std = None
+        
+        if (
+            inferred_type == 'numeric'
+            and pd.api.types.is_numeric_dtype(series)
+            and not pd.api.types.is_bool_dtype(series)
+        ):
+            # Exact single-kernel stats over the full column
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            col_min, col_max, col_mean, col_std, count = numeric_stats(values)
+            if count:
+                min_value, max_value, mean, std = col_min, col_max, col_mean, col_std
+        elif inferred_type == 'numeric' and column_stats:
+            min_value = column_stats.get('min')
+            max_value = column_stats.get('max')
+            mean = column_stats.get('mean')
+            std = column_stats.get('std')
+        
+        # Use total_missing_count and total_missing_percentage to include empty strings
+        column_profile = ColumnProfile(
+            name=column,
+            dtype=dtype if dtype is not None else str(series.dtype),
+            null_count=missing_info['total_missing_count'],
+            null_percentage=missing_info['total_missing_percentage'],
+            unique_count=unique_count,
+            min_value=min_value,
+            max_value=max_value,
+            mean=mean,
+            std=std,
+            inferred_type=inferred_type
+        )
+        
+        return column, column_profile
     
     def _count_duplicates(self, data: pd.DataFrame) -> int:
         """
-        Count duplicate rows with adaptive performance.
+        Count duplicate rows exactly.
         
-        Uses different strategies based on dataset size.
+        Each row is hashed to a single uint64 and duplicates are found on
+        that 1-D array, which avoids the per-column factorization that
+        DataFrame.duplicated() performs on wide frames.
         """
-        total_rows = len(data)
-        
-        if total_rows == 0:
+        if len(data) == 0 or len(data.columns) == 0:
             return 0
         
-        # For small datasets, count directly
-        if total_rows <= 50000:
-            return int(data.duplicated().sum())
-        
-        # For medium datasets (50k-100k), use a larger sample
-        if total_rows <= 100000:
-            sample_size = min(20000, total_rows)
-            sample = data.sample(n=sample_size, random_state=42)
-            sample_duplicates = sample.duplicated().sum()
-            # Extrapolate to full dataset
-            return int(sample_duplicates * (total_rows / sample_size))
-        
-        # For large datasets (>100k), use hash-based sampling
-        # Sample 10% of data, up to 20k rows
-        sample_size = min(20000, max(5000, total_rows // 10))
-        sample = data.sample(n=sample_size, random_state=42)
-        sample_duplicates = sample.duplicated().sum()
-        return int(sample_duplicates * (total_rows / sample_size))
+        hashes = pd.util.hash_pandas_object(data, index=False)
+        return int(hashes.duplicated().sum())
     
     def _get_unique_count(self, series: pd.Series, inferred_type: str) -> Optional[int]:
         """
-        Get unique count with adaptive sampling based on column size.
+        Get unique count, exact up to HLL_MIN_ROWS non-null values and
+        estimated with HyperLogLog above that.
         """
-        if inferred_type not in ('numeric', 'categorical', 'text', 'datetime', 'boolean'):
+        if inferred_type not in _UNIQUE_COUNT_TYPES:
             return None
+        
+        # Categoricals: count the codes that actually occur, no value hashing
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes = series.cat.codes.to_numpy()
+            codes = codes[codes >= 0]
+            return int(np.count_nonzero(np.bincount(codes))) if len(codes) else 0
             
         non_null = series.dropna()
         if len(non_null) == 0:
             return 0
         
-        total_rows = len(non_null)
+        # Count directly unless the column is large (bool dtype has at most
+        # 2 values); unique().size skips the extra work nunique() does
+        if len(non_null) <= HLL_MIN_ROWS or pd.api.types.is_bool_dtype(series):
+            return int(non_null.unique().size)
+        
+        # Larger columns: HyperLogLog over the full column, no sampling bias
+        return hll_nunique(non_null)
+    
+    @staticmethod
+    def _arrow_unique_count(col: Any) -> int:
+        """
+        Count distinct non-null values of an Arrow column.
+        
+        count_distinct has no kernel for the null type or for dictionary
+        columns (how categoricals round-trip through Parquet), so all-null
+        columns count 0 and dictionaries are decoded first.
+        """
+        if pa.types.is_null(col.type):
+            return 0
+        if pa.types.is_dictionary(col.type):
+            col = col.combine_chunks().dictionary_decode()
+        return pc.count_distinct(col, mode='only_valid').as_py()
+    
+    def profile_parquet(self, path: str) -> DataProfile:
+        """
+        Profile a Parquet file, reading what the footer already records.
+        
+        Row count, null counts and numeric min/max come from the row-group
+        statistics. The data is read once as an Arrow table for what the
+        footer does not hold: unique counts, mean/std, empty strings and
+        duplicates are computed with Arrow kernels, and only string-like
+        columns are converted to pandas for schema detection.
         
-        # For small columns, count directly
-        if total_rows <= 5000:
-            return int(non_null.nunique())
+        Args:
+            path: Path to the Parquet file.
+            
+        Returns:
+            DataProfile for the file contents.
+            
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        if pq is None:
+            raise ImportError("profile_parquet requires pyarrow")
+        
+        parquet_file = pq.ParquetFile(path)
+        footer = _parquet_footer_stats(parquet_file.metadata)
+        table = parquet_file.read()
+        row_count = table.num_rows
+        pandas_dtypes = table.slice(0, 0).to_pandas().dtypes
+        
+        # A stored pandas index is not part of the profiled data
+        pandas_metadata = table.schema.pandas_metadata or {}
+        index_columns = [c for c in pandas_metadata.get('index_columns', []) if isinstance(c, str)]
+        if index_columns:
+            table = table.drop_columns(index_columns)
         
-        # For medium columns (5k-50k), use moderate sampling
-        if total_rows <= 50000:
-            sample_size = min(2000, total_rows)
-            sample = non_null.sample(n=sample_size, random_state=42)
-            unique_ratio = sample.nunique() / sample_size
-            return int(unique_ratio * total_rows)
+        # Typed Arrow columns map straight to a type; the rest are detected
+        inferred_types: Dict[str, str] = {}
+        probe_columns = []
+        for field in table.schema:
+            arrow_type = field.type
+            if table.column(field.name).null_count == row_count:
+                probe_columns.append(field.name)  # all-null: let the detector decide
+            elif pa.types.is_boolean(arrow_type):
+                inferred_types[field.name] = 'boolean'
+            elif pa.types.is_integer(arrow_type):
+                col_min, col_max = self._arrow_min_max(table.column(field.name), footer.get(field.name))
+                is_flag = col_min >= 0 and col_max <= 1
+                inferred_types[field.name] = 'boolean' if is_flag else 'numeric'
+            elif pa.types.is_floating(arrow_type) or pa.types.is_decimal(arrow_type):
+                inferred_types[field.name] = 'numeric'
+            elif pa.types.is_timestamp(arrow_type) or pa.types.is_date(arrow_type):
+                inferred_types[field.name] = 'datetime'
+            else:
+                probe_columns.append(field.name)
+        if probe_columns:
+            probe_frame = table.select(probe_columns).to_pandas()
+            inferred_types.update(self.schema_detector.detect(probe_frame))
         
-        # For large columns (>50k), use larger sample for better accuracy
-        sample_size = min(5000, total_rows)
-        sample = non_null.sample(n=sample_size, random_state=42)
-        unique_ratio = sample.nunique() / sample_size
-        return int(unique_ratio * total_rows)
+        columns: Dict[str, ColumnProfile] = {}
+        total_missing = 0
+        for field in table.schema:
+            name = field.name
+            col = table.column(name)
+            inferred_type = inferred_types[name]
+            column_footer = footer.get(name, {})
+            
+            null_count = column_footer.get('null_count')
+            if null_count is None:
+                null_count = col.null_count
+            if pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+                # Empty strings count as missing; a non-empty footer min rules them out
+                if column_footer.get('min') in (None, '', b''):
+                    null_count += pc.sum(pc.equal(col, '')).as_py() or 0
+            total_missing += null_count
+            
+            min_value = max_value = mean = std = None
+            if inferred_type == 'numeric':
+                if pa.types.is_integer(field.type) or pa.types.is_floating(field.type):
+                    min_value, max_value = self._arrow_min_max(col, column_footer)
+                    mean = pc.mean(col).as_py()
+                    std = pc.stddev(col, ddof=0).as_py()
+                else:
+                    values = pd.to_numeric(col.to_pandas(), errors='coerce').to_numpy(
+                        dtype=np.float64, na_value=np.nan
+                    )
+                    col_min, col_max, col_mean, col_std, count = numeric_stats(values)
+                    if count:
+                        min_value, max_value, mean, std = col_min, col_max, col_mean, col_std
+            
+            unique_count = None
+            if inferred_type in _UNIQUE_COUNT_TYPES:
+                unique_count = self._arrow_unique_count(col)
+            
+            columns[name] = ColumnProfile(
+                name=name,
+                dtype=str(pandas_dtypes[name]),
+                null_count=null_count,
+                null_percentage=(null_count / row_count * 100) if row_count else 0.0,
+                unique_count=unique_count,
+                min_value=None if min_value is None else float(min_value),
+                max_value=None if max_value is None else float(max_value),
+                mean=mean,
+                std=std,
+                inferred_type=inferred_type
+            )
+        
+        # Distinct rows via an Arrow group-by; hash in pandas if a type can't be grouped
+        duplicate_rows = 0
+        if row_count and table.num_columns:
+            try:
+                distinct_rows = table.group_by(table.column_names).aggregate([]).num_rows
+                duplicate_rows = row_count - distinct_rows
+            except (pa.ArrowNotImplementedError, pa.ArrowInvalid):
+                duplicate_rows = self._count_duplicates(table.to_pandas())
+        
+        total_cells = row_count * table.num_columns
+        return DataProfile(
+            timestamp=datetime.now(),
+            row_count=row_count,
+            column_count=table.num_columns,
+            columns=columns,
+            overall_missing_percentage=(total_missing / total_cells * 100) if total_cells else 0.0,
+            duplicate_rows=duplicate_rows
+        )
+    
+    @staticmethod
+    def _arrow_min_max(column: Any, footer: Optional[Dict[str, Any]]) -> Tuple[Any, Any]:
+        """Return (min, max) of an Arrow column, from the footer when recorded."""
+        if footer and footer.get('min') is not None:
+            return footer['min'], footer['max']
+        result = pc.min_max(column)
+        return result['min'].as_py(), result['max'].as_py()
     
-    def profile_with_details(self, data: pd.DataFrame) -> Dict[str, Any]:
+    def profile_with_details(self, data: pd.DataFrame, dump_profile: bool = True) -> Dict[str, Any]:
         """
         Profile a DataFrame with additional details.
         
@@ -176,21 +641,30 @@ class DataProfilerService:
         
         Args:
             data: The pandas DataFrame to profile.
+            dump_profile: Return the profile as a plain dict. Pass False to
+                get the DataProfile model itself and skip walking every
+                ColumnProfile into a new dict.
             
         Returns:
             Dictionary containing the DataProfile and additional details.
         """
-        # Get the standard profile
-        profile = self.profile(data)
+        # Get the standard profile along with the results it was built from
+        profile, intermediates = self._profile_with_intermediates(data)
         
-        # Get additional details
-        missing_analysis = self.missing_value_analyzer.analyze(data)
-        overall_missing = self.missing_value_analyzer.get_overall_missing_stats(data)
-        stats = self.statistical_summarizer.summarize(data)
+        # The polars path does not produce the per-service details
+        if 'statistics' not in intermediates:
+            masks = self.missing_value_analyzer.missing_masks(data)
+            intermediates['missing_analysis'] = self.missing_value_analyzer.analyze(data, masks)
+            intermediates['overall_missing'] = self.missing_value_analyzer.get_overall_missing_stats(
+                data, masks
+            )
+            intermediates['statistics'] = self.statistical_summarizer.summarize(
+                data, intermediates['inferred_types']
+            )
         
         return {
-            'profile': profile.model_dump(),
-            'missing_analysis': missing_analysis,
-            'overall_missing': overall_missing,
-            'statistics': stats
+            'profile': profile.model_dump() if dump_profile else profile,
+            'missing_analysis': intermediates['missing_analysis'],
+            'overall_missing': intermediates['overall_missing'],
+            'statistics': intermediates['statistics']
         }
@@ -1,11 +1,26 @@
 """Schema detection module for inferring column types."""
 
+import os
+import threading
+import weakref
+from collections import OrderedDict
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, Dict, Tuple
 import re
-from functools import lru_cache
+from functools import cached_property, lru_cache
+
+from ._kernels import HLL_MIN_ROWS, hll_nunique
+
+try:
+    import pyarrow  # noqa: F401 - only needed for the Arrow string dtype
+except ImportError:  # pragma: no cover - exercised when pyarrow is absent
+    pyarrow = None
+
+HAS_PYARROW = pyarrow is not None
 
 
 # Type inference constants
@@ -19,23 +34,42 @@ INFERRED_MIXED = "mixed"  # New: for columns with mixed types
 # Thresholds for type inference
 UNIQUE_RATIO_CATEGORICAL = 0.6  # If unique values < 60% of total, consider categorical
 MIN_UNIQUE_FOR_TEXT = 10  # Minimum unique values to consider text
-BOOLEAN_TRUE_VALUES = {'true', 'false', '1', '0', 'yes', 'no', 't', 'f', 'y', 'n'}
-DATETIME_FORMATS = [
-    '%Y-%m-%d',
-    '%Y/%m/%d',
-    '%d-%m-%Y',
-    '%d/%m/%Y',
-    '%Y-%m-%d %H:%M:%S',
-    '%Y/%m/%d %H:%M:%S',
-    '%Y-%m-%dT%H:%M:%S',
-    '%Y-%m-%d %H:%M:%S.%f',
-]
+BOOLEAN_TRUE_VALUES = frozenset({'true', 'false', '1', '0', 'yes', 'no', 't', 'f', 'y', 'n'})
+BOOLEAN_PREFILTER_ROWS = 100  # Values checked before the distinct-value pass
+# Cheap shape check for common date strings: 2023-01-31, 31/01/2023, 12:30,
+# 20230131, Jan 31 2023, 31 Jan 2023. Other forms are parsed on a small head
+# sample before the column is rejected.
+DATETIME_PREFIX_PATTERN = re.compile(
+    r'^\d{1,4}[-/:.]\d{1,2}|^\d{8}$|^[A-Za-z]{3,9}\.?\s+\d{1,2}|^\d{1,2}\s+[A-Za-z]{3,9}'
+)
+DATETIME_PREFILTER_ROWS = 100  # Values inspected by the prefilter
+# A run of 4+ letters that is not a month or weekday name marks prose
+# ("12 people attended"), which the prefix check alone lets through. Prose
+# values are parsed on the head sample before the column is rejected.
+_DATE_WORDS = (
+    'january|february|march|april|june|july|august|september|sept|october|'
+    'november|december|monday|tuesday|wednesday|thursday|friday|saturday|sunday'
+)
+DATETIME_PROSE_PATTERN = re.compile(
+    r'(?i)(?<![a-z])(?!(?:' + _DATE_WORDS + r')(?![a-z]))[a-z]{4,}'
+)
+DATETIME_PROSE_RATIO = 0.3  # Above this share of prose values, skip parsing
+# Superset of the strings float() accepts but pd.to_numeric does not, such
+# as 'nan', '-inf' and '1_000'; matches are confirmed with float()
+FLOAT_LIKE_PATTERN = re.compile(
+    r'(?i)^\s*[-+]?(?:nan|inf(?:inity)?|[\d_.]+(?:e[-+]?[\d_]+)?)\s*$'
+)
 
 # Performance thresholds
 LARGE_DATASET_THRESHOLD = 50000  # Rows threshold for using sampling
 SAMPLE_SIZE_SMALL = 1000  # Sample size for small-medium datasets
 SAMPLE_SIZE_LARGE = 5000  # Sample size for large datasets
 MIXED_TYPE_THRESHOLD = 0.15  # If >15% values don't match main type, consider mixed
+PARALLEL_COLUMN_THRESHOLD = 8  # Fan columns out to threads from this many columns
+TYPE_CACHE_SIZE = 4096  # Column fingerprints remembered by the shared type cache
+ADAPTIVE_SAMPLE_INITIAL = 200  # First chunk coerced by the adaptive numeric probe
+ADAPTIVE_RATE_LOW = 0.3  # Below this numeric success rate the probe stops early
+ADAPTIVE_RATE_HIGH = 0.99  # Above this numeric success rate the probe stops early
 
 
 def _get_sample_size(total_rows: int) -> int:
@@ -45,24 +79,133 @@ def _get_sample_size(total_rows: int) -> int:
     return SAMPLE_SIZE_SMALL
 
 
-def is_mixed_type(series: pd.Series, sample_size: int = 1000) -> Tuple[bool, str]:
+@lru_cache(maxsize=32)
+def sample_positions(n: int, size: int) -> np.ndarray:
+    """
+    Draw the row positions that Series.sample(n=size, random_state=42)
+    would pick from n rows.
+    
+    The draw is cached, so every column with the same number of non-null
+    values reuses one permutation instead of seeding and shuffling its
+    own. The returned array is read-only.
+    """
+    positions = np.random.RandomState(42).choice(n, size=size, replace=False)
+    positions.flags.writeable = False
+    return positions
+
+
+@dataclass
+class ColumnStats:
+    """
+    Per-column values shared by the type probes.
+    
+    Built once per column so that the probes do not each drop nulls, count
+    uniques, draw samples or coerce to numeric on their own. The unique
+    count, samples and numeric coercions are computed on first use.
+    """
+    
+    non_null: pd.Series
+    n: int
+    dtype_kind: str
+    _samples: Dict[int, pd.Series] = field(default_factory=dict, repr=False)
+    _numeric: Dict[int, pd.Series] = field(default_factory=dict, repr=False)
+    _adaptive: Dict[int, pd.Series] = field(default_factory=dict, repr=False)
+    
+    @classmethod
+    def from_series(cls, series: pd.Series) -> "ColumnStats":
+        """Build the stats for a Series."""
+        non_null = series.dropna()
+        return cls(non_null=non_null, n=len(non_null), dtype_kind=series.dtype.kind)
+    
+    @cached_property
+    def n_unique(self) -> int:
+        """Number of distinct non-null values, estimated for long columns."""
+        if self.n > HLL_MIN_ROWS:
+            return hll_nunique(self.non_null)
+        return int(self.non_null.nunique())
+    
+    def sample(self, size: int) -> pd.Series:
+        """Return up to `size` non-null values, sampled deterministically."""
+        if self.n <= size:
+            return self.non_null
+        if size not in self._samples:
+            self._samples[size] = self.non_null.iloc[sample_positions(self.n, size)]
+        return self._samples[size]
+    
+    def numeric(self, size: int) -> pd.Series:
+        """Return sample(size) coerced to numeric, with failures as NaN."""
+        key = min(size, self.n)
+        if key not in self._numeric:
+            self._numeric[key] = pd.to_numeric(self.sample(size), errors='coerce')
+        return self._numeric[key]
+    
+    def numeric_adaptive(self, size: int) -> pd.Series:
+        """
+        Coerce a growing prefix of sample(size) to numeric, stopping early
+        once the success rate is clearly low or clearly high.
+        
+        The prefix starts at ADAPTIVE_SAMPLE_INITIAL values and doubles up
+        to `size`; only the newly added values are coerced at each step.
+        Unsampled columns, and columns whose full sample is already coerced,
+        return numeric(size).
+        """
+        key = min(size, self.n)
+        if self.n <= size or key in self._numeric:
+            return self.numeric(size)
+        if key in self._adaptive:
+            return self._adaptive[key]
+        
+        sample = self.sample(size)
+        parts = []
+        done = valid = 0
+        step = ADAPTIVE_SAMPLE_INITIAL
+        while done < key:
+            end = min(step, key)
+            part = pd.to_numeric(sample.iloc[done:end], errors='coerce')
+            parts.append(part)
+            valid += int(part.notna().sum())
+            done = end
+            rate = valid / done
+            if done < key and (rate < ADAPTIVE_RATE_LOW or rate > ADAPTIVE_RATE_HIGH):
+                self._adaptive[key] = pd.concat(parts)
+                return self._adaptive[key]
+            step *= 2
+        
+        self._numeric[key] = pd.concat(parts)
+        return self._numeric[key]
+    
+    @property
+    def numeric_coerced(self) -> pd.Series:
+        """The adaptive numeric coercion shared by the numeric and datetime probes."""
+        return self.numeric_adaptive(_get_sample_size(self.n))
+
+
+# Element-wise type checks for object arrays, applied in one ufunc pass each
+_is_bool = np.frompyfunc(lambda x: isinstance(x, bool), 1, 1)
+_is_number = np.frompyfunc(
+    lambda x: isinstance(x, (int, float)) and not isinstance(x, bool), 1, 1
+)
+_is_str = np.frompyfunc(lambda x: isinstance(x, str), 1, 1)
+
+
+def is_mixed_type(
+    series: pd.Series, sample_size: int = 1000, stats: Optional[ColumnStats] = None
+) -> Tuple[bool, str]:
     """
     Check if a series contains mixed types (e.g., numbers and strings).
     
     Returns:
         Tuple of (is_mixed, primary_type)
     """
-    non_null = series.dropna()
-    if len(non_null) == 0:
+    if stats is None:
+        stats = ColumnStats.from_series(series)
+    if stats.n == 0:
         return False, INFERRED_TEXT
     
     # Sample for efficiency
-    if len(non_null) > sample_size:
-        sample = non_null.sample(n=sample_size, random_state=42)
-    else:
-        sample = non_null
+    sample = stats.sample(sample_size)
     
-    # Analyze type distribution
+    # Analyze type distribution with whole-array masks
     type_counts = {
         'numeric': 0,
         'string': 0,
@@ -71,22 +214,33 @@ def is_mixed_type(series: pd.Series, sample_size: int = 1000) -> Tuple[bool, str
         'other': 0
     }
     
-    for val in sample:
-        if val is None or (isinstance(val, float) and pd.isna(val)):
-            continue
-        elif isinstance(val, bool):
-            type_counts['boolean'] += 1
-        elif isinstance(val, (int, float)) and not isinstance(val, bool):
-            type_counts['numeric'] += 1
-        elif isinstance(val, str):
-            # Check if string looks like numeric
-            try:
-                float(val)
-                type_counts['numeric'] += 1
-            except (ValueError, TypeError):
-                type_counts['string'] += 1
-        else:
-            type_counts['other'] += 1
+    kind = sample.dtype.kind
+    if kind == 'b':
+        type_counts['boolean'] = len(sample)
+    elif kind in 'iuf':
+        type_counts['numeric'] = int(sample.notna().sum())
+    else:
+        values = sample.to_numpy(dtype=object)
+        valid = ~pd.isna(values)
+        bool_mask = _is_bool(values).astype(bool) & valid
+        num_mask = _is_number(values).astype(bool) & valid
+        str_mask = _is_str(values).astype(bool) & valid
+        # Strings that parse as numbers count as numeric, as float() decides
+        parsed = stats.numeric(sample_size).notna().to_numpy() & str_mask
+        retry = np.flatnonzero(str_mask & ~parsed)
+        if len(retry):
+            float_like = pd.Series(values[retry], dtype=object).str.match(FLOAT_LIKE_PATTERN)
+            for i in retry[float_like.to_numpy(dtype=bool)]:
+                try:
+                    float(values[i])
+                except ValueError:
+                    continue
+                parsed[i] = True
+        
+        type_counts['boolean'] = int(bool_mask.sum())
+        type_counts['numeric'] = int(num_mask.sum() + parsed.sum())
+        type_counts['string'] = int(str_mask.sum() - parsed.sum())
+        type_counts['other'] = int(valid.sum() - bool_mask.sum() - num_mask.sum() - str_mask.sum())
     
     total = sum(type_counts.values())
     if total == 0:
@@ -110,30 +264,47 @@ def is_mixed_type(series: pd.Series, sample_size: int = 1000) -> Tuple[bool, str
     return is_mixed, type_mapping.get(primary_type, INFERRED_TEXT)
 
 
-def is_boolean(series: pd.Series) -> Tuple[bool, float]:
+def is_boolean(series: pd.Series, stats: Optional[ColumnStats] = None) -> Tuple[bool, float]:
     """
     Check if a series represents boolean values with confidence score.
     
     Args:
         series: The pandas Series to check.
+        stats: Optional precomputed ColumnStats for the series.
         
     Returns:
         Tuple of (is_boolean, confidence_score)
     """
     # Get non-null values
-    non_null = series.dropna()
-    if len(non_null) == 0:
+    if stats is None:
+        stats = ColumnStats.from_series(series)
+    non_null = stats.non_null
+    if stats.n == 0:
         return False, 0.0
     
-    # Convert to string and lowercase for comparison
-    string_values = non_null.astype(str).str.lower().str.strip()
+    # bool dtype holds at most True/False
+    if stats.dtype_kind == 'b':
+        return True, 1.0
     
-    # Check if all values are in boolean true/false values
-    unique_values = set(string_values.unique())
+    # Any value outside the boolean vocabulary rejects the column, so check
+    # the leading rows before hashing the whole column
+    for value in non_null.head(BOOLEAN_PREFILTER_ROWS):
+        if str(value).strip().lower() not in BOOLEAN_TRUE_VALUES:
+            return False, 0.0
     
-    # Must be a subset of boolean values
-    if not unique_values.issubset(BOOLEAN_TRUE_VALUES):
-        return False, 0.0
+    # Normalize only the distinct values, not every row
+    try:
+        distinct = non_null.unique()
+    except TypeError:  # unhashable values: fall back to their string form
+        distinct = non_null.astype(str).unique()
+    
+    unique_values = set()
+    for value in distinct:
+        normalized = str(value).strip().lower()
+        # Must be a subset of boolean values; stop at the first miss
+        if normalized not in BOOLEAN_TRUE_VALUES:
+            return False, 0.0
+        unique_values.add(normalized)
     
     # Calculate confidence based on unique value count
     # Boolean columns typically have only 2 unique values
@@ -142,20 +313,60 @@ def is_boolean(series: pd.Series) -> Tuple[bool, float]:
     return True, confidence
 
 
-def is_datetime(series: pd.Series, sample_size: int = 1000) -> Tuple[bool, float]:
+def to_datetime_unique(values: pd.Series) -> pd.Series:
+    """
+    Equivalent to pd.to_datetime(values, errors='coerce'), parsing each
+    distinct value once.
+    
+    Date columns repeat values heavily, so parsing the uniques and mapping
+    the results back by position is much cheaper than parsing every row.
+    
+    Args:
+        values: The pandas Series to parse.
+        
+    Returns:
+        Series of parsed datetimes aligned with values, NaT where parsing failed.
+    """
+    dtype = values.dtype
+    if dtype.kind == 'M':
+        return values
+    if dtype.kind in 'iuf':
+        # Numbers are converted arithmetically; only strings benefit from
+        # parsing uniques. to_datetime is far slower on unsigned ints than
+        # on int64 (pandas GH 42606), so cast when every value fits.
+        if isinstance(dtype, np.dtype) and dtype.kind == 'u' and (
+            dtype != np.uint64 or len(values) == 0 or values.max() <= np.iinfo(np.int64).max
+        ):
+            values = values.astype(np.int64)
+        return pd.to_datetime(values, errors='coerce')
+    codes, uniques = pd.factorize(values)
+    parsed = pd.to_datetime(uniques, errors='coerce')
+    return pd.Series(
+        parsed.take(codes, allow_fill=True, fill_value=pd.NaT),
+        index=values.index,
+        name=values.name,
+    )
+
+
+def is_datetime(
+    series: pd.Series, sample_size: int = 1000, stats: Optional[ColumnStats] = None
+) -> Tuple[bool, float]:
     """
     Check if a series represents datetime values with confidence.
     
     Args:
         series: The pandas Series to check.
         sample_size: Number of values to sample.
+        stats: Optional precomputed ColumnStats for the series.
         
     Returns:
         Tuple of (is_datetime, confidence_score)
     """
     # Get non-null values
-    non_null = series.dropna()
-    if len(non_null) == 0:
+    if stats is None:
+        stats = ColumnStats.from_series(series)
+    non_null = stats.non_null
+    if stats.n == 0:
         return False, 0.0
     
     # Check if already datetime dtype
@@ -163,26 +374,39 @@ def is_datetime(series: pd.Series, sample_size: int = 1000) -> Tuple[bool, float
         return True, 1.0
     
     # Use adaptive sample size
-    actual_sample_size = min(sample_size, len(non_null))
-    sample = non_null.sample(n=actual_sample_size, random_state=42) if len(non_null) > sample_size else non_null
+    sample = stats.sample(sample_size)
     
     # First check if it looks numeric - if so, skip datetime check
     try:
-        numeric_converted = pd.to_numeric(sample, errors='coerce')
-        if numeric_converted.notna().sum() / len(sample) > 0.8:
+        numeric_converted = stats.numeric_coerced
+        if numeric_converted.notna().mean() > 0.8:
             return False, 0.0
     except Exception:
         pass
     
+    # The shape check only decides how much to parse: values that look like
+    # dates go straight to the full parse, anything else must first parse
+    # on the head. The sample is in random order for large columns, so its
+    # head is representative.
+    head = sample.head(DATETIME_PREFILTER_ROWS).astype(str).str.strip()
+    looks_like_dates = (
+        head.str.match(DATETIME_PREFIX_PATTERN).mean() >= 0.5
+        and head.str.contains(DATETIME_PROSE_PATTERN).mean() <= DATETIME_PROSE_RATIO
+    )
+    if not looks_like_dates:
+        head_rate = float(to_datetime_unique(head).notna().mean())
+        if head_rate < 0.5:
+            return False, head_rate
+    
     # Try to parse as datetime
     try:
-        parsed = pd.to_datetime(sample, errors='coerce')
+        parsed = to_datetime_unique(sample)
         success_rate = parsed.notna().sum() / len(sample)
         
         if success_rate > 0.8:
             # Do full check for large datasets
             if len(non_null) > sample_size * 2:
-                full_parsed = pd.to_datetime(non_null, errors='coerce')
+                full_parsed = to_datetime_unique(non_null)
                 full_success_rate = full_parsed.notna().sum() / len(non_null)
                 return full_success_rate > 0.8, full_success_rate
             
@@ -192,37 +416,35 @@ def is_datetime(series: pd.Series, sample_size: int = 1000) -> Tuple[bool, float
         return False, 0.0
 
 
-def is_numeric(series: pd.Series, sample_size: int = 1000) -> Tuple[bool, float]:
+def is_numeric(
+    series: pd.Series, sample_size: int = 1000, stats: Optional[ColumnStats] = None
+) -> Tuple[bool, float]:
     """
     Check if a series represents numeric values with confidence.
     
     Args:
         series: The pandas Series to check.
         sample_size: Number of values to sample for quick check.
+        stats: Optional precomputed ColumnStats for the series.
         
     Returns:
         Tuple of (is_numeric, confidence_score)
     """
     # Get non-null values
-    non_null = series.dropna()
-    if len(non_null) == 0:
+    if stats is None:
+        stats = ColumnStats.from_series(series)
+    non_null = stats.non_null
+    if stats.n == 0:
         return False, 0.0
     
     # Check if already numeric dtype
     if pd.api.types.is_numeric_dtype(series):
         return True, 1.0
     
-    # Use adaptive sample size based on dataset size
-    actual_sample_size = _get_sample_size(len(non_null))
-    if len(non_null) > actual_sample_size:
-        sample = non_null.sample(n=actual_sample_size, random_state=42)
-    else:
-        sample = non_null
-    
     # Try to convert sample to numeric
     try:
-        converted = pd.to_numeric(sample, errors='coerce')
-        success_rate = converted.notna().sum() / len(sample)
+        converted = stats.numeric_coerced
+        success_rate = converted.notna().sum() / len(converted)
         
         if success_rate < 0.8:
             return False, success_rate
@@ -232,31 +454,33 @@ def is_numeric(series: pd.Series, sample_size: int = 1000) -> Tuple[bool, float]
             return success_rate > 0.9, success_rate
         
         # For smaller columns, do full check
-        full_converted = pd.to_numeric(non_null, errors='coerce')
+        full_converted = stats.numeric(stats.n)
         full_success_rate = full_converted.notna().sum() / len(non_null)
         return full_success_rate > 0.8, full_success_rate
     except Exception:
         return False, 0.0
 
 
-def is_categorical(series: pd.Series) -> Tuple[bool, float]:
+def is_categorical(series: pd.Series, stats: Optional[ColumnStats] = None) -> Tuple[bool, float]:
     """
     Check if a series represents categorical values with confidence.
     
     Args:
         series: The pandas Series to check.
+        stats: Optional precomputed ColumnStats for the series.
         
     Returns:
         Tuple of (is_categorical, confidence_score)
     """
     # Get non-null values
-    non_null = series.dropna()
-    if len(non_null) == 0:
+    if stats is None:
+        stats = ColumnStats.from_series(series)
+    if stats.n == 0:
         return False, 0.0
     
     # Calculate unique ratio
-    total_values = len(non_null)
-    unique_count = non_null.nunique()
+    total_values = stats.n
+    unique_count = stats.n_unique
     unique_ratio = unique_count / total_values
     
     # Higher confidence when ratio is lower
@@ -268,25 +492,27 @@ def is_categorical(series: pd.Series) -> Tuple[bool, float]:
     return is_categorical, confidence
 
 
-def is_text(series: pd.Series) -> Tuple[bool, float]:
+def is_text(series: pd.Series, stats: Optional[ColumnStats] = None) -> Tuple[bool, float]:
     """
     Check if a series represents text values with confidence.
     
     Args:
         series: The pandas Series to check.
+        stats: Optional precomputed ColumnStats for the series.
         
     Returns:
         Tuple of (is_text, confidence_score)
     """
     # Get non-null values
-    non_null = series.dropna()
-    if len(non_null) == 0:
+    if stats is None:
+        stats = ColumnStats.from_series(series)
+    if stats.n == 0:
         return False, 0.0
     
     # Check if already string/object dtype
     if pd.api.types.is_string_dtype(series) or series.dtype == 'object':
         # Check if it has enough unique values to be considered text
-        unique_count = non_null.nunique()
+        unique_count = stats.n_unique
         is_text = unique_count >= MIN_UNIQUE_FOR_TEXT
         # Confidence based on unique count
         confidence = min(1.0, unique_count / 100)
@@ -295,7 +521,73 @@ def is_text(series: pd.Series) -> Tuple[bool, float]:
     return False, 0.0
 
 
-def infer_column_type(series: pd.Series, detect_mixed: bool = True) -> str:
+# Inferred type by dtype kind for dtypes that need no value probing; covers
+# NumPy, nullable and Arrow-backed variants alike
+_DTYPE_FAST = {
+    'M': INFERRED_DATETIME,
+    'b': INFERRED_BOOLEAN,
+    'i': INFERRED_NUMERIC,
+    'u': INFERRED_NUMERIC,
+    'f': INFERRED_NUMERIC,
+}
+_TYPED_KINDS = ''.join(_DTYPE_FAST)
+
+
+def _infer_from_dtype(series: pd.Series, stats: Optional[ColumnStats] = None) -> Optional[str]:
+    """
+    Infer the type of a bool/int/float/datetime64 column from its dtype alone.
+    
+    These dtypes can only come out as boolean, numeric or datetime, so the
+    string based probes are skipped. Integer columns holding only 0/1 stay
+    boolean.
+    
+    Returns:
+        The inferred type, or None if the dtype has no fast path or the
+        column has no non-null values.
+    """
+    kind = series.dtype.kind
+    inferred = _DTYPE_FAST.get(kind)
+    if inferred is None:
+        return None
+    
+    n = stats.n if stats is not None else series.count()
+    if n == 0:
+        return None
+    
+    # min/max avoid hashing the column to see whether it only holds 0/1
+    if kind in 'iu' and series.min() >= 0 and series.max() <= 1:
+        return INFERRED_BOOLEAN
+    return inferred
+
+
+def _arrow_string_view(series: pd.Series) -> pd.Series:
+    """
+    Return an Arrow-backed copy of a pure-string column for the type probes.
+    
+    Lowercasing, stripping, unique counts and hashing then run in Arrow's
+    C++ kernels instead of per Python object. Columns that hold anything
+    other than strings are returned unchanged so that the probes see the
+    same values, as is everything when pyarrow is not installed.
+    """
+    if not HAS_PYARROW:
+        return series
+    
+    dtype = series.dtype
+    if isinstance(dtype, pd.StringDtype):
+        if dtype.storage == 'pyarrow':
+            return series
+    elif dtype != object or pd.api.types.infer_dtype(series, skipna=True) != 'string':
+        return series
+    
+    try:
+        return series.astype(pd.StringDtype('pyarrow'))
+    except (TypeError, ValueError):
+        return series
+
+
+def infer_column_type(
+    series: pd.Series, detect_mixed: bool = True, stats: Optional[ColumnStats] = None
+) -> str:
     """
     Infer the type of a column with improved handling for mixed data.
     
@@ -307,41 +599,53 @@ def infer_column_type(series: pd.Series, detect_mixed: bool = True) -> str:
     5. Text (high cardinality strings)
     6. Mixed (columns with multiple types)
     
+    Bool, integer, float and datetime64 columns (including the nullable and
+    tz-aware variants) skip this sequence and are typed from their dtype.
+    
     Args:
         series: The pandas Series to infer type for.
         detect_mixed: Whether to detect mixed type columns.
+        stats: Optional precomputed ColumnStats for the series.
         
     Returns:
         One of: 'numeric', 'categorical', 'datetime', 'text', 'boolean', 'mixed'
     """
+    # Bool/int/float/datetime64 dtypes need no value probing
+    dtype_type = _infer_from_dtype(series, stats)
+    if dtype_type is not None:
+        return dtype_type
+    
+    if stats is None:
+        stats = ColumnStats.from_series(series)
+    
     # Check for mixed types first (if enabled)
     if detect_mixed:
-        is_mixed, primary_type = is_mixed_type(series)
+        is_mixed, primary_type = is_mixed_type(series, stats=stats)
         if is_mixed:
             return INFERRED_MIXED
     
     # Check for boolean first
-    is_bool, _ = is_boolean(series)
+    is_bool, _ = is_boolean(series, stats)
     if is_bool:
         return INFERRED_BOOLEAN
     
     # Check for datetime (before numeric since datetime can be confused with numeric)
-    is_datetime_val, _ = is_datetime(series)
+    is_datetime_val, _ = is_datetime(series, stats=stats)
     if is_datetime_val:
         return INFERRED_DATETIME
     
     # Check for numeric
-    is_numeric_val, _ = is_numeric(series)
+    is_numeric_val, _ = is_numeric(series, stats=stats)
     if is_numeric_val:
         return INFERRED_NUMERIC
     
     # Check for categorical (low cardinality)
-    is_cat, _ = is_categorical(series)
+    is_cat, _ = is_categorical(series, stats)
     if is_cat:
         return INFERRED_CATEGORICAL
     
     # Check for text (high cardinality strings)
-    is_text_val, _ = is_text(series)
+    is_text_val, _ = is_text(series, stats)
     if is_text_val:
         return INFERRED_TEXT
     
@@ -349,18 +653,100 @@ def infer_column_type(series: pd.Series, detect_mixed: bool = True) -> str:
     return INFERRED_TEXT
 
 
+def _type_with_confidence(series: pd.Series) -> Tuple[str, float]:
+    """
+    Infer the type of a column together with the confidence of that probe.
+    
+    The probes run in priority order (boolean, datetime, numeric,
+    categorical, text) and the first that accepts the column wins, so the
+    later, unneeded probes are never run. The probes share one ColumnStats.
+    
+    Returns:
+        Tuple of (inferred_type, confidence).
+    """
+    # Bool/int/float/datetime64 dtypes are certain from the dtype alone
+    dtype_type = _infer_from_dtype(series)
+    if dtype_type is not None:
+        return dtype_type, 1.0
+    
+    stats = ColumnStats.from_series(series)
+    if stats.n == 0:
+        return INFERRED_TEXT, 0.5
+    
+    # Check each type and get confidence
+    is_bool, bool_conf = is_boolean(series, stats)
+    if is_bool:
+        return INFERRED_BOOLEAN, bool_conf
+    
+    is_dt, dt_conf = is_datetime(series, stats=stats)
+    if is_dt:
+        return INFERRED_DATETIME, dt_conf
+    
+    is_num, num_conf = is_numeric(series, stats=stats)
+    if is_num:
+        return INFERRED_NUMERIC, num_conf
+    
+    is_cat, cat_conf = is_categorical(series, stats)
+    if is_cat:
+        return INFERRED_CATEGORICAL, cat_conf
+    
+    is_txt, txt_conf = is_text(series, stats)
+    if is_txt:
+        return INFERRED_TEXT, txt_conf
+    
+    # Default
+    return INFERRED_TEXT, 0.5
+
+
+# Inferred types of probed columns keyed by content fingerprint, shared by
+# every SchemaDetector so that copies and slices of a frame hit the cache
+_type_cache: "OrderedDict[tuple, str]" = OrderedDict()
+_type_cache_lock = threading.Lock()
+
+
+def _column_fingerprint(series: pd.Series) -> Optional[tuple]:
+    """
+    Fingerprint a column by dtype, value kind, length and a hash of its values.
+    
+    The index and name do not affect inference and are left out. Object
+    values are hashed through their string form, so True and 'True' hash
+    alike: the inferred value kind tells pure columns apart, and columns
+    mixing kinds are not fingerprinted. Returns None for columns that
+    cannot be fingerprinted.
+    """
+    values = series.cat.categories if isinstance(series.dtype, pd.CategoricalDtype) else series
+    value_kind = pd.api.types.infer_dtype(values, skipna=True)
+    if value_kind.startswith('mixed'):
+        return None
+    try:
+        hashed = pd.util.hash_pandas_object(series, index=False).to_numpy()
+    except TypeError:
+        return None
+    return str(series.dtype), value_kind, len(series), hash(hashed.tobytes())
+
+
+def clear_type_cache() -> None:
+    """Clear the column type cache shared by all SchemaDetector instances."""
+    with _type_cache_lock:
+        _type_cache.clear()
+
+
 class SchemaDetector:
     """Detects and infers column types for a DataFrame with caching."""
     
     def __init__(self):
         """Initialize the schema detector with caching."""
-        self._cache: Dict[str, str] = {}
+        self._detect_cache: Dict[tuple, Tuple[weakref.ref, Dict[str, str]]] = {}
     
     def detect(self, data: pd.DataFrame) -> dict[str, str]:
         """
         Detect column types for all columns in a DataFrame.
         
-        Uses caching to avoid redundant computation.
+        Results are cached per DataFrame, keyed by a fingerprint of its
+        identity, shape, dtypes and column labels. An entry is dropped when
+        its DataFrame is garbage collected. Probed columns are additionally
+        cached by content in a bounded cache shared by all instances, so a
+        copy or slice of a frame reuses the types of unchanged columns.
         
         Args:
             data: The pandas DataFrame to detect types for.
@@ -368,25 +754,64 @@ class SchemaDetector:
         Returns:
             Dictionary mapping column names to inferred types.
         """
-        inferred_types = {}
-        cache_key_base = f"{id(data)}"
+        key = (
+            id(data),
+            data.shape,
+            tuple(data.dtypes.astype(str)),
+            tuple(data.columns),
+        )
         
-        for column in data.columns:
-            cache_key = f"{cache_key_base}_{column}"
-            
-            # Check cache
-            if cache_key in self._cache:
-                inferred_types[column] = self._cache[cache_key]
-                continue
-            
-            # Detect type
-            col_type = infer_column_type(data[column])
+        cached = self._detect_cache.get(key)
+        if cached is not None and cached[0]() is data:
+            return dict(cached[1])
+        
+        # Typed columns are resolved from their dtype kind; only the rest
+        # (object, string, category, ...) go through the value probes
+        inferred_types = {}
+        pending = []
+        for column, dtype in zip(data.columns, data.dtypes):
+            col_type = None
+            if dtype.kind in _TYPED_KINDS:
+                col_type = _infer_from_dtype(data[column])
             inferred_types[column] = col_type
-            
-            # Store in cache
-            self._cache[cache_key] = col_type
+            if col_type is None:
+                pending.append(column)
         
-        return inferred_types
+        # Reuse types of columns with identical content seen before. Hash
+        # outside the lock; it is only held for the cache lookups.
+        fingerprints = {column: _column_fingerprint(data[column]) for column in pending}
+        with _type_cache_lock:
+            for column in list(pending):
+                fingerprint = fingerprints[column]
+                if fingerprint is not None and fingerprint in _type_cache:
+                    _type_cache.move_to_end(fingerprint)
+                    inferred_types[column] = _type_cache[fingerprint]
+                    pending.remove(column)
+        
+        # Probe the remaining columns, in parallel on wide frames
+        series_list = [_arrow_string_view(data[column]) for column in pending]
+        if len(series_list) >= PARALLEL_COLUMN_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=min(len(series_list), os.cpu_count() or 1)) as ex:
+                col_types = list(ex.map(infer_column_type, series_list))
+        else:
+            col_types = [infer_column_type(series) for series in series_list]
+        inferred_types.update(zip(pending, col_types))
+        
+        with _type_cache_lock:
+            for column, col_type in zip(pending, col_types):
+                fingerprint = fingerprints[column]
+                if fingerprint is not None:
+                    _type_cache[fingerprint] = col_type
+            while len(_type_cache) > TYPE_CACHE_SIZE:
+                _type_cache.popitem(last=False)
+        
+        def _evict(ref: weakref.ref, key: tuple = key) -> None:
+            entry = self._detect_cache.get(key)
+            if entry is not None and entry[0] is ref:
+                del self._detect_cache[key]
+        
+        self._detect_cache[key] = (weakref.ref(data, _evict), inferred_types)
+        return dict(inferred_types)
     
     def detect_with_confidence(self, data: pd.DataFrame) -> dict[str, tuple[str, float]]:
         """
@@ -398,42 +823,18 @@ class SchemaDetector:
         Returns:
             Dictionary mapping column names to (inferred_type, confidence) tuples.
         """
-        results = {}
-        
-        for column in data.columns:
-            series = data[column]
-            
-            # Check each type and get confidence
-            is_bool, bool_conf = is_boolean(series)
-            if is_bool:
-                results[column] = (INFERRED_BOOLEAN, bool_conf)
-                continue
-            
-            is_dt, dt_conf = is_datetime(series)
-            if is_dt:
-                results[column] = (INFERRED_DATETIME, dt_conf)
-                continue
-            
-            is_num, num_conf = is_numeric(series)
-            if is_num:
-                results[column] = (INFERRED_NUMERIC, num_conf)
-                continue
-            
-            is_cat, cat_conf = is_categorical(series)
-            if is_cat:
-                results[column] = (INFERRED_CATEGORICAL, cat_conf)
-                continue
-            
-            is_txt, txt_conf = is_text(series)
-            if is_txt:
-                results[column] = (INFERRED_TEXT, txt_conf)
-                continue
-            
-            # Default
-            results[column] = (INFERRED_TEXT, 0.5)
+        # Probe columns in parallel on wide frames; the to_numeric and
+        # to_datetime parses inside the probes release the GIL
+        series_list = [_arrow_string_view(data[column]) for column in data.columns]
+        if len(series_list) >= PARALLEL_COLUMN_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=min(len(series_list), os.cpu_count() or 1)) as ex:
+                results = list(ex.map(_type_with_confidence, series_list))
+        else:
+            results = [_type_with_confidence(series) for series in series_list]
         
-        return results
+        return dict(zip(data.columns, results))
     
     def clear_cache(self) -> None:
-        """Clear the type detection cache."""
-        self._cache.clear()
+        """Clear the type detection cache, including the shared column cache."""
+        self._detect_cache.clear()
+        clear_type_cache()
@@ -1,16 +1,31 @@
 """Statistical summarization module."""
 
+import math
+import os
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Any, Tuple
 from .schema_detector import (
     INFERRED_NUMERIC,
     INFERRED_CATEGORICAL,
     INFERRED_DATETIME,
     INFERRED_TEXT,
     INFERRED_BOOLEAN,
-    infer_column_type
+    PARALLEL_COLUMN_THRESHOLD,
+    _arrow_string_view,
+    infer_column_type,
+    sample_positions,
+    to_datetime_unique,
 )
+from ._kernels import HLL_MIN_ROWS, column_moments, hll_nunique, numeric_moments
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover - exercised when pyarrow is absent
+    pa = pc = None
 
 
 # Adaptive sampling thresholds
@@ -22,6 +37,111 @@ SAMPLE_SIZE_SMALL = 2000
 SAMPLE_SIZE_MEDIUM = 5000
 SAMPLE_SIZE_LARGE = 10000
 
+# Below this many cells the thread pool costs more than it saves
+PARALLEL_MIN_CELLS = 100_000
+
+# Numeric columns are summarized as one 2-D block from this many columns
+BATCH_MIN_COLUMNS = 8
+
+# Normalized boolean spellings and the value each one stands for
+_BOOLEAN_CODES = {
+    'true': True, '1': True, 'yes': True, 't': True, 'y': True,
+    'false': False, '0': False, 'no': False, 'f': False, 'n': False,
+}
+
+
+def _skew_kurtosis(
+    n: int, m2: float, m3: float, m4: float
+) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Bias-corrected skewness and excess kurtosis from central moments.
+    
+    Uses the same estimators as pandas' Series.skew() and Series.kurt().
+    
+    Args:
+        n: Number of values.
+        m2, m3, m4: Mean 2nd, 3rd and 4th powers of the deviations, as
+            Python floats.
+        
+    Returns:
+        Tuple of (skewness, kurtosis); each is None when there are too few
+        values (3 for skewness, 4 for kurtosis) and 0.0 for a constant column.
+    """
+    skewness = kurtosis = None
+    if n >= 3:
+        skewness = 0.0 if m2 == 0 else math.sqrt(n * (n - 1)) / (n - 2) * m3 / m2 ** 1.5
+    if n >= 4:
+        if m2 == 0:
+            kurtosis = 0.0
+        else:
+            adj = 3 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+            kurtosis = (n + 1) * (n - 1) * m4 / ((n - 2) * (n - 3) * m2 ** 2) - adj
+    return skewness, kurtosis
+
+
+def _numeric_summary(
+    count: int,
+    valid_count: int,
+    moments: Optional[tuple] = None,
+    quartiles: Optional[List[float]] = None,
+    sample_size: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Build the summarize_numeric result from the moments and quartiles.
+    
+    The inputs are Python scalars already (kernel results, tolist() of the
+    NumPy arrays), so the dict is filled without boxing each field.
+    
+    Args:
+        count: Length of the column including missing values.
+        valid_count: Number of valid numeric values.
+        moments: (min, max, mean, m2, m3, m4, n) as returned by
+            numeric_moments; None when there are no valid values.
+        quartiles: The 0.25, 0.5 and 0.75 quantiles.
+        sample_size: Number of values summarized if the column was sampled.
+        
+    Returns:
+        Dictionary with min, max, mean, std, median, q25, q75, etc.
+    """
+    if moments is None:
+        return {
+            'min': None,
+            'max': None,
+            'mean': None,
+            'std': None,
+            'median': None,
+            'q25': None,
+            'q75': None,
+            'variance': None,
+            'skewness': None,
+            'kurtosis': None,
+            'count': count,
+            'valid_count': 0,
+            'sampled': False
+        }
+    
+    minimum, maximum, mean, m2, m3, m4, n = moments
+    q25, median, q75 = quartiles
+    skewness, kurtosis = _skew_kurtosis(n, m2, m3, m4)
+    stats = {
+        'min': minimum,
+        'max': maximum,
+        'mean': mean,
+        'std': math.sqrt(m2) if n > 1 else 0.0,
+        'median': median,
+        'q25': q25,
+        'q75': q75,
+        'variance': m2 if n > 1 else 0.0,
+        'skewness': skewness,
+        'kurtosis': kurtosis,
+        'count': count,
+        'valid_count': valid_count,
+        'sampled': sample_size is not None
+    }
+    if sample_size is not None:
+        stats['sample_size'] = sample_size
+    return stats
+
 
 def _get_sample_size(total_rows: int) -> int:
     """Get appropriate sample size based on dataset size."""
@@ -34,6 +154,56 @@ def _get_sample_size(total_rows: int) -> int:
     return total_rows  # No sampling for small datasets
 
 
+def _drop_missing(series: pd.Series) -> pd.Series:
+    """
+    Return the non-missing values of a column, copying only when needed.
+    
+    NumPy bool and integer columns cannot hold missing values, and other
+    columns are checked with one null-mask pass, so dropna only copies a
+    column that actually has gaps.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in 'biu':
+        return series
+    if not series.hasnans:
+        return series
+    return series.dropna()
+
+
+# Length of each string in one ufunc pass over an object array
+_str_len = np.frompyfunc(len, 1, 1)
+
+
+def _arrow_strings(values: pd.Series):
+    """Return the Arrow array behind an Arrow-backed string column, else None."""
+    dtype = values.dtype
+    if pa is None or not pd.api.types.is_string_dtype(dtype):
+        return None
+    if isinstance(dtype, pd.ArrowDtype) or (
+        isinstance(dtype, pd.StringDtype) and dtype.storage == 'pyarrow'
+    ):
+        # Zero-copy: the column already holds an Arrow buffer
+        return pa.array(values.array)
+    return None
+
+
+def _string_lengths(values: pd.Series) -> np.ndarray:
+    """
+    Return the string length of each value, as astype(str).str.len() would.
+    
+    String dtypes are measured in place (Arrow-backed ones by Arrow's
+    utf8_length kernel), and object columns holding only Python strings in
+    one ufunc pass, so neither builds an intermediate string array. Other
+    columns are converted with astype(str) first.
+    """
+    dtype = values.dtype
+    if isinstance(dtype, (pd.StringDtype, pd.ArrowDtype)) and pd.api.types.is_string_dtype(dtype):
+        return values.str.len().to_numpy(dtype=np.int64)
+    if dtype == object and pd.api.types.infer_dtype(values, skipna=False) == 'string':
+        return _str_len(values.to_numpy()).astype(np.int64)
+    return values.astype(str).str.len().to_numpy(dtype=np.int64)
+
+
 class StatisticalSummarizer:
     """Computes descriptive statistics for DataFrame columns."""
     
@@ -49,91 +219,40 @@ class StatisticalSummarizer:
         Returns:
             Dictionary with min, max, mean, std, median, q25, q75, etc.
         """
-        # Get non-null values
-        non_null = series.dropna()
-        
-        if len(non_null) == 0:
-            return {
-                'min': None,
-                'max': None,
-                'mean': None,
-                'std': None,
-                'median': None,
-                'q25': None,
-                'q75': None,
-                'variance': None,
-                'skewness': None,
-                'kurtosis': None,
-                'count': int(len(series)),
-                'valid_count': 0,
-                'sampled': False
-            }
-        
-        # Try to convert to numeric - this handles string columns that should be numeric
-        numeric_series = pd.to_numeric(non_null, errors='coerce')
-        
-        # Check if we have valid numeric data after conversion
-        valid_numeric = numeric_series.dropna()
+        # Numeric dtypes go straight to a float array with NaN for missing
+        # values; other columns are coerced first - this handles string
+        # columns that should be numeric
+        if series.dtype.kind in 'iufb':
+            arr = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            numeric_series = pd.to_numeric(series, errors='coerce')
+            arr = numeric_series.to_numpy(dtype=np.float64, na_value=np.nan)
+        valid = arr[~np.isnan(arr)]
         
-        if len(valid_numeric) == 0:
+        if len(valid) == 0:
             # No valid numeric data - return empty stats
-            return {
-                'min': None,
-                'max': None,
-                'mean': None,
-                'std': None,
-                'median': None,
-                'q25': None,
-                'q75': None,
-                'variance': None,
-                'skewness': None,
-                'kurtosis': None,
-                'count': int(len(series)),
-                'valid_count': 0,
-                'sampled': False
-            }
+            return _numeric_summary(len(series), 0)
         
         # Use adaptive sampling based on dataset size
-        sample_size = _get_sample_size(len(valid_numeric))
+        sample_size = _get_sample_size(len(valid))
         
-        if len(valid_numeric) > sample_size:
+        sampled = len(valid) > sample_size
+        if sampled:
             # Use sampled data for stats calculation
-            sampled = valid_numeric.sample(n=sample_size, random_state=42)
-            stats = {
-                'min': float(sampled.min()),
-                'max': float(sampled.max()),
-                'mean': float(sampled.mean()),
-                'std': float(sampled.std(ddof=0)) if len(sampled) > 1 else 0.0,
-                'median': float(sampled.median()),
-                'q25': float(sampled.quantile(0.25)),
-                'q75': float(sampled.quantile(0.75)),
-                'variance': float(sampled.var(ddof=0)) if len(sampled) > 1 else 0.0,
-                'skewness': None,
-                'kurtosis': None,
-                'count': int(len(series)),
-                'valid_count': int(len(valid_numeric)),
-                'sampled': True,
-                'sample_size': sample_size
-            }
+            values = valid[sample_positions(len(valid), sample_size)]
         else:
             # Calculate full statistics for smaller datasets
-            stats = {
-                'min': float(valid_numeric.min()),
-                'max': float(valid_numeric.max()),
-                'mean': float(valid_numeric.mean()),
-                'std': float(valid_numeric.std(ddof=0)) if len(valid_numeric) > 1 else 0.0,
-                'median': float(valid_numeric.median()),
-                'q25': float(valid_numeric.quantile(0.25)),
-                'q75': float(valid_numeric.quantile(0.75)),
-                'variance': float(valid_numeric.var(ddof=0)) if len(valid_numeric) > 1 else 0.0,
-                'skewness': None,
-                'kurtosis': None,
-                'count': int(len(series)),
-                'valid_count': int(len(valid_numeric)),
-                'sampled': False
-            }
-        
-        return stats
+            values = valid
+        
+        # Moments in one fused kernel and all quartiles in one partition,
+        # on the raw array instead of a pandas reduction per statistic.
+        # values is always a fresh copy here, so the quartiles partition it
+        # in place rather than copying it again.
+        moments = numeric_moments(values)
+        quartiles = np.quantile(values, [0.25, 0.5, 0.75], overwrite_input=True).tolist()
+        return _numeric_summary(
+            len(series), len(valid), moments, quartiles, sample_size if sampled else None
+        )
     
     def summarize_categorical(self, series: pd.Series) -> Dict[str, Any]:
         """
@@ -148,7 +267,7 @@ class StatisticalSummarizer:
             Dictionary with unique count, mode, frequencies, etc.
         """
         # Get non-null values
-        non_null = series.dropna()
+        non_null = _drop_missing(series)
         
         if len(non_null) == 0:
             return {
@@ -160,35 +279,41 @@ class StatisticalSummarizer:
                 'valid_count': 0
             }
         
-        # Calculate unique count - use sampling for very large columns
+        # Sample frequencies for very large columns
         sample_size = 5000
-        if len(non_null) > sample_size:
-            # Sample for unique count estimation
-            sample = non_null.sample(n=sample_size, random_state=42)
-            unique_count = int(sample.nunique() * (len(non_null) / sample_size))
-            
-            # Get frequency distribution from sample (top 10)
-            value_counts = sample.value_counts()
-            frequency_distribution = {
-                str(k): int(v) for k, v in value_counts.head(10).items()
-            }
-            
-            # Estimate mode from sample
-            mode_value = value_counts.index[0] if len(value_counts) > 0 else None
-            mode_frequency = int(value_counts.iloc[0]) if len(value_counts) > 0 else 0
+        sampled = len(non_null) > sample_size
+        if sampled:
+            values = non_null.iloc[sample_positions(len(non_null), sample_size)]
         else:
-            # Full calculation for smaller columns
-            unique_count = int(non_null.nunique())
-            
-            # Get frequency distribution (top 10)
-            value_counts = non_null.value_counts()
-            frequency_distribution = {
-                str(k): int(v) for k, v in value_counts.head(10).items()
-            }
-            
-            # Get mode
-            mode_value = value_counts.index[0] if len(value_counts) > 0 else None
-            mode_frequency = int(value_counts.iloc[0]) if len(value_counts) > 0 else 0
+            values = non_null
+        
+        # One hash pass into integer codes, counted with bincount; the unique
+        # count, mode and top 10 all come from the one counts array.
+        # Categoricals reuse their codes, so unused categories get a count
+        # of zero.
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            uniques = values.cat.categories
+            counts = np.bincount(values.cat.codes.to_numpy(), minlength=len(uniques))
+        else:
+            codes, uniques = pd.factorize(values)
+            counts = np.bincount(codes, minlength=len(uniques))
+        # Stable sort keeps ties in first-seen order, as value_counts does
+        top = np.argsort(-counts, kind='stable')[:10]
+        if sampled:
+            # HyperLogLog over the full column; scaling the sample's count
+            # overestimates low-cardinality columns
+            unique_count = hll_nunique(non_null)
+        else:
+            unique_count = int(np.count_nonzero(counts))
+        
+        # Get frequency distribution (top 10)
+        frequency_distribution = {
+            str(uniques[i]): int(counts[i]) for i in top
+        }
+        
+        # Get mode (estimated from the sample for large columns)
+        mode_value = uniques[top[0]] if len(top) > 0 else None
+        mode_frequency = int(counts[top[0]]) if len(top) > 0 else 0
         
         return {
             'unique_count': unique_count,
@@ -209,8 +334,30 @@ class StatisticalSummarizer:
         Returns:
             Dictionary with min, max, range, etc.
         """
+        if series.dtype.kind == 'M':
+            # Already datetime64 (naive or tz-aware): nothing to parse, and
+            # min/max skip NaT without copying out the valid values
+            valid_count = int(series.count())
+            if valid_count == 0:
+                return {
+                    'min': None,
+                    'max': None,
+                    'range_days': None,
+                    'count': 0,
+                    'valid_count': 0
+                }
+            min_date = series.min()
+            max_date = series.max()
+            return {
+                'min': min_date.isoformat(),
+                'max': max_date.isoformat(),
+                'range_days': (max_date - min_date).days,
+                'count': int(len(series)),
+                'valid_count': valid_count
+            }
+        
         # Get non-null values and convert to datetime
-        non_null = series.dropna()
+        non_null = _drop_missing(series)
         
         if len(non_null) == 0:
             return {
@@ -221,10 +368,10 @@ class StatisticalSummarizer:
                 'valid_count': 0
             }
         
-        # Try to parse as datetime
+        # Try to parse as datetime; only string and numeric columns get here
         try:
-            datetime_series = pd.to_datetime(non_null, errors='coerce')
-            valid_datetimes = datetime_series.dropna()
+            datetime_series = to_datetime_unique(non_null)
+            valid_datetimes = _drop_missing(datetime_series)
             
             if len(valid_datetimes) == 0:
                 return {
@@ -268,7 +415,7 @@ class StatisticalSummarizer:
             Dictionary with true_count, false_count, true_percentage, etc.
         """
         # Get non-null values
-        non_null = series.dropna()
+        non_null = _drop_missing(series)
         
         if len(non_null) == 0:
             return {
@@ -280,16 +427,38 @@ class StatisticalSummarizer:
                 'valid_count': 0
             }
         
-        # Convert to string and count true/false
-        string_values = non_null.astype(str).str.lower().str.strip()
-        
-        true_values = {'true', '1', 'yes', 't', 'y'}
-        false_values = {'false', '0', 'no', 'f', 'n'}
-        
-        true_count = int(string_values.isin(true_values).sum())
-        false_count = int(string_values.isin(false_values).sum())
+        kind = non_null.dtype.kind
+        if kind in 'bi':
+            # Bool and integer columns are counted directly: only 1/True and
+            # 0/False match a boolean spelling, no strings involved
+            arr = non_null.to_numpy()
+            true_count = int(np.count_nonzero(arr == 1))
+            false_count = int(np.count_nonzero(arr == 0))
+            return self._boolean_result(true_count, false_count, len(series), len(non_null))
         
-        valid_count = len(non_null)
+        # Normalize only the distinct values and weight them by their counts
+        try:
+            codes, uniques = pd.factorize(non_null)
+        except TypeError:  # unhashable values: fall back to their string form
+            codes, uniques = pd.factorize(non_null.astype(str))
+        counts = np.bincount(codes, minlength=len(uniques))
+        
+        true_count = 0
+        false_count = 0
+        for value, count in zip(uniques, counts.tolist()):
+            code = _BOOLEAN_CODES.get(str(value).lower().strip())
+            if code is True:
+                true_count += count
+            elif code is False:
+                false_count += count
+        
+        return self._boolean_result(true_count, false_count, len(series), len(non_null))
+    
+    @staticmethod
+    def _boolean_result(
+        true_count: int, false_count: int, count: int, valid_count: int
+    ) -> Dict[str, Any]:
+        """Build the summarize_boolean result from the counts."""
         true_percentage = (true_count / valid_count * 100) if valid_count > 0 else 0.0
         false_percentage = (false_count / valid_count * 100) if valid_count > 0 else 0.0
         
@@ -298,7 +467,7 @@ class StatisticalSummarizer:
             'false_count': false_count,
             'true_percentage': true_percentage,
             'false_percentage': false_percentage,
-            'count': int(len(series)),
+            'count': int(count),
             'valid_count': valid_count
         }
     
@@ -313,7 +482,7 @@ class StatisticalSummarizer:
             Dictionary with min_length, max_length, avg_length, etc.
         """
         # Get non-null values
-        non_null = series.dropna()
+        non_null = _drop_missing(series)
         
         if len(non_null) == 0:
             return {
@@ -325,16 +494,33 @@ class StatisticalSummarizer:
                 'valid_count': 0
             }
         
-        # Calculate string lengths
-        string_lengths = non_null.astype(str).str.len()
-        
-        unique_count = int(non_null.nunique())
+        arrow_strings = _arrow_strings(non_null)
+        if arrow_strings is not None:
+            # Lengths, their min/max/mean and the exact distinct count all
+            # run as Arrow C++ kernels over the string buffer
+            string_lengths = pc.utf8_length(arrow_strings)
+            min_max = pc.min_max(string_lengths)
+            min_length = min_max['min'].as_py()
+            max_length = min_max['max'].as_py()
+            avg_length = pc.mean(string_lengths).as_py()
+            unique_count = pc.count_distinct(arrow_strings).as_py()
+        else:
+            # Calculate string lengths
+            string_lengths = _string_lengths(non_null)
+            min_length = string_lengths.min()
+            max_length = string_lengths.max()
+            avg_length = string_lengths.mean()
+            
+            if len(non_null) > HLL_MIN_ROWS:
+                unique_count = hll_nunique(non_null)
+            else:
+                unique_count = int(non_null.nunique())
         
         return {
             'unique_count': unique_count,
-            'min_length': int(string_lengths.min()),
-            'max_length': int(string_lengths.max()),
-            'avg_length': float(string_lengths.mean()),
+            'min_length': int(min_length),
+            'max_length': int(max_length),
+            'avg_length': float(avg_length),
             'count': int(len(series)),
             'valid_count': int(len(non_null))
         }
@@ -351,32 +537,155 @@ class StatisticalSummarizer:
         Returns:
             Dictionary mapping column names to their statistical summaries.
         """
-        results = {}
-        
         # Use provided inferred types or infer them
         if inferred_types is None:
             inferred_types = {}
-            for column in data.columns:
-                inferred_types[column] = infer_column_type(data[column])
+        columns = list(data.columns)
+        series_list = [data[column] for column in columns]
+        hints = [inferred_types] * len(columns)
+        
+        # Fan columns out to threads on wide, non-trivial frames; the pandas
+        # and NumPy kernels behind each summary release the GIL. A single
+        # worker would only add hand-off overhead.
+        workers = min(len(columns), os.cpu_count() or 1)
+        if (
+            workers > 1
+            and len(columns) >= PARALLEL_COLUMN_THRESHOLD
+            and data.size >= PARALLEL_MIN_CELLS
+        ):
+            pool = ThreadPoolExecutor(max_workers=workers)
+        else:
+            pool = None
         
-        for column in data.columns:
-            series = data[column]
-            
-            # First check if it's a datetime dtype directly
-            if pd.api.types.is_datetime64_any_dtype(series):
-                inferred_type = INFERRED_DATETIME
-            else:
-                inferred_type = inferred_types.get(column, infer_column_type(series))
+        with pool or nullcontext():
+            column_map = pool.map if pool is not None else map
+            # Resolve every column's type once; the block and per-column
+            # paths below only look it up
+            types = dict(zip(columns, column_map(self._resolve_type, series_list, hints, columns)))
             
-            if inferred_type == INFERRED_NUMERIC:
-                results[column] = self.summarize_numeric(series)
-            elif inferred_type == INFERRED_CATEGORICAL:
-                results[column] = self.summarize_categorical(series)
-            elif inferred_type == INFERRED_DATETIME:
-                results[column] = self.summarize_datetime(series)
-            elif inferred_type == INFERRED_BOOLEAN:
-                results[column] = self.summarize_boolean(series)
-            else:  # text
-                results[column] = self.summarize_text(series)
+            results = self._summarize_numeric_block(data, types)
+            pending = [
+                (column, series) for column, series in zip(columns, series_list)
+                if column not in results
+            ]
+            summaries = column_map(
+                self._summarize_one,
+                [series for _, series in pending],
+                [types[column] for column, _ in pending],
+            )
+            results.update(zip([column for column, _ in pending], summaries))
+        
+        return {column: results[column] for column in columns}
+    
+    def _summarize_numeric_block(
+        self, data: pd.DataFrame, types: Dict[Any, str]
+    ) -> Dict[Any, Dict[str, Any]]:
+        """
+        Summarize the numeric-dtype columns of a frame in one pass.
+        
+        The columns are stacked into a single float block so the moments
+        come from one column_moments call and the quartiles from one
+        nanquantile call. Frames long enough to be sampled only batch their
+        complete columns: summarize_numeric samples positions among a
+        column's valid values, which are the same rows for every column
+        only when nothing is missing. Either way the results match
+        summarize_numeric exactly.
         
+        Args:
+            data: The pandas DataFrame to summarize.
+            types: Resolved type of every column.
+            
+        Returns:
+            Dictionary of summaries for the batched columns; empty when too
+            few columns qualify.
+        """
+        if not data.columns.is_unique:
+            return {}
+        
+        columns = [
+            column for column, dtype in data.dtypes.items()
+            if dtype.kind in 'iufb'
+            and types[column] == INFERRED_NUMERIC
+        ]
+        if len(columns) < BATCH_MIN_COLUMNS:
+            return {}
+        
+        n_rows = len(data)
+        sample_size = _get_sample_size(n_rows)
+        if n_rows > sample_size:
+            numeric = data[columns]
+            complete = numeric.notna().all().to_numpy()
+            if np.count_nonzero(complete) < BATCH_MIN_COLUMNS:
+                return {}
+            columns = [column for column, keep in zip(columns, complete) if keep]
+            # Only the sampled rows are materialized
+            rows = numeric.iloc[sample_positions(n_rows, sample_size), complete]
+            block = rows.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            sample_size = None
+            block = data[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        
+        moments = column_moments(block)
+        counts = moments[-1]
+        quartile_levels = [0.25, 0.5, 0.75]
+        if np.all(counts == len(block)):
+            # No missing values: one vectorized partition over the block.
+            # The block may be a read-only view of the frame, so quantile
+            # partitions its own copy.
+            quartiles = np.quantile(block, quartile_levels, axis=0)
+        else:
+            quartiles = np.empty((3, len(columns)))
+            nonempty = counts > 0
+            if nonempty.any():
+                # Boolean indexing copies, so the partition may work in place
+                quartiles[:, nonempty] = np.nanquantile(
+                    block[:, nonempty], quartile_levels, axis=0, overwrite_input=True
+                )
+        
+        # One tolist() per statistic converts the whole block to Python
+        # scalars instead of boxing each field of each column
+        moment_rows = zip(*(stat.tolist() for stat in moments))
+        results = {}
+        for column, moment_row, quartile_row in zip(columns, moment_rows, quartiles.T.tolist()):
+            if sample_size is not None:
+                results[column] = _numeric_summary(
+                    n_rows, n_rows, moment_row, quartile_row, sample_size
+                )
+            elif moment_row[-1] == 0:
+                results[column] = _numeric_summary(n_rows, 0)
+            else:
+                results[column] = _numeric_summary(
+                    n_rows, moment_row[-1], moment_row, quartile_row
+                )
         return results
+    
+    def _resolve_type(
+        self, series: pd.Series, inferred_types: Dict[str, str], column: Any
+    ) -> str:
+        """Return the type a column is summarized as."""
+        # First check if it's a datetime dtype directly
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return INFERRED_DATETIME
+        # Only infer columns the caller did not type
+        inferred_type = inferred_types.get(column)
+        if inferred_type is None:
+            inferred_type = infer_column_type(series)
+        return inferred_type
+    
+    # Summary method for each inferred type; anything else is text
+    _SUMMARIZERS = {
+        INFERRED_NUMERIC: 'summarize_numeric',
+        INFERRED_CATEGORICAL: 'summarize_categorical',
+        INFERRED_DATETIME: 'summarize_datetime',
+        INFERRED_BOOLEAN: 'summarize_boolean',
+    }
+    
+    def _summarize_one(self, series: pd.Series, inferred_type: str) -> Dict[str, Any]:
+        """Summarize one column according to its resolved type."""
+        # String columns are summarized through Arrow's C++ kernels for
+        # value_counts, nunique and lengths when pyarrow is installed
+        if inferred_type in (INFERRED_CATEGORICAL, INFERRED_TEXT):
+            series = _arrow_string_view(series)
+        
+        method = self._SUMMARIZERS.get(inferred_type, 'summarize_text')
+        return getattr(self, method)(series)
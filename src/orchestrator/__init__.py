@@ -4,29 +4,34 @@ This module provides the core orchestration functionality for the
 Multi-Agent Data Wrangler system.
 """
 
-from .interfaces import Orchestrator, PipelineResult, Agent
-from .state_manager import StateManager
-from .agent_coordinator import (
-    AgentCoordinator,
-    ProfilerAgent,
-    TransformationAgent,
-    ExecutionAgent,
-    ValidationAgent,
-    QualityScoringAgent,
-    RankingAgent,
-)
-from .pipeline_manager import PipelineManager
-from .failure_recovery import (
-    FailureRecovery,
-    FailureStrategy,
-    RetryConfig,
-    RecoveryAction,
-    CircuitBreaker,
-    with_retry,
-    with_fallback,
-)
-from .cli import main, run_pipeline, profile_data
+import importlib
 
+# Public name -> defining submodule; resolved lazily on first access so that
+# importing the package does not import pandas or the engines until needed
+_LAZY_ATTRS = {
+    "Orchestrator": ".interfaces",
+    "PipelineResult": ".interfaces",
+    "Agent": ".interfaces",
+    "StateManager": ".state_manager",
+    "AgentCoordinator": ".agent_coordinator",
+    "ProfilerAgent": ".agent_coordinator",
+    "TransformationAgent": ".agent_coordinator",
+    "ExecutionAgent": ".agent_coordinator",
+    "ValidationAgent": ".agent_coordinator",
+    "QualityScoringAgent": ".agent_coordinator",
+    "RankingAgent": ".agent_coordinator",
+    "PipelineManager": ".pipeline_manager",
+    "FailureRecovery": ".failure_recovery",
+    "FailureStrategy": ".failure_recovery",
+    "RetryConfig": ".failure_recovery",
+    "RecoveryAction": ".failure_recovery",
+    "CircuitBreaker": ".failure_recovery",
+    "with_retry": ".failure_recovery",
+    "with_fallback": ".failure_recovery",
+    "main": ".cli",
+    "run_pipeline": ".cli",
+    "profile_data": ".cli",
+}
 
 __all__ = [
     # Interfaces
@@ -61,3 +66,16 @@ __all__ = [
 
 
 __version__ = "1.0.0"
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
@@ -1,13 +1,13 @@
 """Agent coordination module."""
 
-from typing import Dict, List, Optional, Any, Protocol
+from typing import Callable, Dict, List, Optional, Any
 import pandas as pd
 import logging
 
 from src.common.types.data_profile import DataProfile
 from src.common.types.transformation import Transformation, TransformationResult
 from src.common.types.validation import ValidationResult
-from src.common.types.quality import QualityMetrics, QualityDelta
+from src.common.types.quality import QualityMetrics
 from src.common.types.ranking import TransformationCandidate, RankedTransformation
 
 
@@ -52,7 +52,7 @@ class ExecutionAgent:
 
     def execute(self, data: pd.DataFrame, transformation: Transformation) -> TransformationResult:
         """Execute a transformation."""
-        logger.info(f"Executing transformation: {transformation.id}")
+        logger.info("Executing transformation: %s", transformation.id)
         return self.engine.execute(data, transformation)
 
     def get_name(self) -> str:
@@ -142,6 +142,10 @@ class AgentCoordinator:
             "quality_scoring": self.quality_scoring,
             "ranking": self.ranking,
         }
+        # Bound execute methods, resolved once instead of on every call
+        self._execute_fns: Dict[str, Callable[..., Any]] = {
+            name: agent.execute for name, agent in self._agents.items()
+        }
 
     def get_agent(self, name: str) -> Optional[Any]:
         """Get an agent by name.
@@ -176,9 +180,9 @@ class AgentCoordinator:
         Raises:
             ValueError: If agent not found
         """
-        agent = self.get_agent(name)
-        if agent is None:
+        execute = self._execute_fns.get(name)
+        if execute is None:
             raise ValueError(f"Agent not found: {name}")
 
-        logger.info(f"Executing agent: {name}")
-        return agent.execute(*args, **kwargs)
+        logger.info("Executing agent: %s", name)
+        return execute(*args, **kwargs)
@@ -1,36 +1,307 @@
 """Command-line interface for the data wrangler."""
 
 import argparse
+import functools
+import importlib.util
 import logging
+import multiprocessing
+import os
 import sys
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterable, Iterator, Optional
 
-import pandas as pd
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
 
-from src.common.config.loader import ConfigLoader
-from src.common.types.pipeline import PipelineConfig
-
-# Import agent modules - these need to be instantiated
-from .pipeline_manager import PipelineManager
-from .agent_coordinator import AgentCoordinator
-from .state_manager import StateManager
+# pandas, the config loader and the pipeline/agent modules are imported
+# inside the command functions, so --help and argument errors return
+# without loading them
 
 
 logger = logging.getLogger(__name__)
 
+# Below this many rows pandas writes CSV faster than the Arrow conversion
+ARROW_CSV_MIN_ROWS = 10_000
+
+# Candidate x row pairs each validation worker must have to pay for its
+# startup: pickling the data and building its own coordinator
+VALIDATE_WORK_PER_WORKER = 200_000
+
 
 def setup_logging(level: str = "INFO") -> None:
-    """Setup logging configuration."""
+    """Setup logging configuration.
+
+    At ERROR the root logger gets a bare stderr handler that prints only
+    the message, so quiet and scripted runs skip the full formatter setup.
+    """
+    if logging.root.handlers:
+        return
+    if level.upper() == "ERROR":
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logging.root.addHandler(handler)
+        logging.root.setLevel(logging.ERROR)
+        return
     logging.basicConfig(
         level=getattr(logging, level.upper()),
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
 
+def _dump_json(obj: Any, path) -> None:
+    """Write obj to path as indented JSON.
+
+    Uses orjson when it is installed. Values JSON cannot represent,
+    datetimes included, are written with str() either way, so the output
+    matches json.dump(obj, f, indent=2, default=str).
+
+    Args:
+        obj: JSON-compatible object to write
+        path: Output file path
+    """
+    if orjson is not None:
+        data = orjson.dumps(
+            obj,
+            default=str,
+            option=(
+                orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_SERIALIZE_NUMPY
+                | orjson.OPT_PASSTHROUGH_DATETIME
+            ),
+        )
+        Path(path).write_bytes(data)
+    else:
+        Path(path).write_text(json.dumps(obj, indent=2, default=str))
+
+
+def _model_json(model: Any, indent: Optional[int] = None) -> str:
+    """Serialize a pydantic model to a JSON string.
+
+    pydantic-core encodes the model directly, without building a dict
+    first. Models holding values it cannot encode, such as numpy integers
+    in free-form params, go through model_dump with the _dump_json
+    conventions instead.
+
+    Args:
+        model: Pydantic model to serialize
+        indent: Indentation width, or None for compact output
+
+    Returns:
+        The JSON document
+    """
+    from pydantic_core import PydanticSerializationError
+
+    try:
+        return model.model_dump_json(indent=indent)
+    except PydanticSerializationError:
+        pass
+    if orjson is not None:
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(model.model_dump(), default=str, option=option).decode()
+    return json.dumps(model.model_dump(), indent=indent, default=str)
+
+
+def _write_model(model: Any, path) -> None:
+    """Write a pydantic model to path as indented JSON.
+
+    Args:
+        model: Pydantic model to write
+        path: Output file path
+    """
+    Path(path).write_text(_model_json(model, indent=2))
+
+
+def _write_records(models: Iterable[Any], path) -> None:
+    """Write pydantic models as JSON Lines (.jsonl) or an indented JSON array.
+
+    JSON Lines are streamed one record at a time, so the whole list of
+    documents is never held in memory.
+
+    Args:
+        models: Pydantic models to write
+        path: Output file path; the .jsonl suffix selects JSON Lines
+    """
+    if Path(path).suffix == ".jsonl":
+        with open(path, "w") as f:
+            for model in models:
+                f.write(_model_json(model))
+                f.write("\n")
+    else:
+        documents = ",\n".join(_model_json(model, indent=2) for model in models)
+        Path(path).write_text(f"[\n{documents}\n]" if documents else "[]")
+
+
+def _load_json(path) -> Any:
+    """Parse a JSON file.
+
+    orjson parses the raw bytes without decoding them to a str first.
+    Files it rejects, such as ones holding the NaN literals the stdlib
+    encoder writes, are parsed with the json module instead.
+
+    Args:
+        path: Input file path
+
+    Returns:
+        The parsed JSON value
+    """
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _load_jsonl(path) -> Iterator[Any]:
+    """Yield the records of a JSON Lines file one at a time.
+
+    Args:
+        path: Input file path
+
+    Yields:
+        One parsed record per non-blank line
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+
+def _load_records(path) -> Iterable[Any]:
+    """Load the records of a JSON Lines (.jsonl) file or a JSON array.
+
+    Args:
+        path: Input file path
+
+    Returns:
+        Iterable of parsed records; lazy for JSON Lines
+    """
+    if Path(path).suffix == ".jsonl":
+        return _load_jsonl(path)
+    return _load_json(path)
+
+
+def _read_csv(path, dtype: Optional[dict] = None, engine: str = "c"):
+    """Read a CSV file into a DataFrame.
+
+    The default C parser reads a memory-mapped file. engine="pyarrow"
+    selects pyarrow's multithreaded parser instead, which infers some
+    columns differently: ISO timestamps become datetime64 rather than
+    strings. Downstream type detection can therefore differ between the
+    two, so pyarrow is only used when asked for.
+
+    Args:
+        path: Input CSV file path
+        dtype: Optional column -> dtype hints that skip type inference
+        engine: "c" or "pyarrow"
+
+    Returns:
+        pd.DataFrame: The loaded data
+    """
+    import pandas as pd
+
+    if engine == "pyarrow":
+        try:
+            return pd.read_csv(path, engine="pyarrow", dtype=dtype)
+        except (ValueError, TypeError) as e:
+            # Options or content the pyarrow parser rejects
+            logger.debug("pyarrow CSV reader failed, using the C parser: %s", e)
+    try:
+        return pd.read_csv(path, memory_map=True, low_memory=False, dtype=dtype)
+    except (ValueError, TypeError):
+        if dtype is None:
+            raise
+        # The hints do not fit this file; infer the types instead
+        return pd.read_csv(path, memory_map=True, low_memory=False)
+
+
+def _write_csv(df, path) -> None:
+    """Write a DataFrame to CSV without its index.
+
+    Frames of ARROW_CSV_MIN_ROWS rows or more are written by pyarrow's
+    CSV writer when pyarrow is installed; below that the conversion costs
+    more than it saves, so pandas writes them.
+
+    Args:
+        df: DataFrame to write
+        path: Output CSV file path
+    """
+    if len(df) >= ARROW_CSV_MIN_ROWS and importlib.util.find_spec("pyarrow") is not None:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            # Quote only where needed, as pandas does
+            pa_csv.write_csv(table, path, pa_csv.WriteOptions(quoting_style="needed"))
+            return
+        except (TypeError, ValueError, NotImplementedError) as e:
+            # Columns Arrow cannot convert, e.g. mixed-type objects
+            logger.debug("pyarrow CSV writer failed, using pandas: %s", e)
+    df.to_csv(path, index=False)
+
+
+def _profile_dtypes(profile) -> dict:
+    """Return the numeric and boolean column dtypes recorded in a profile.
+
+    Args:
+        profile: DataProfile of the data about to be read
+
+    Returns:
+        Mapping of column name to dtype string, usable as read_csv hints
+    """
+    import numpy as np
+
+    dtypes = {}
+    for name, column in profile.columns.items():
+        try:
+            kind = np.dtype(column.dtype).kind
+        except TypeError:
+            continue
+        if kind in "iufb":
+            dtypes[name] = column.dtype
+    return dtypes
+
+
+class CombinedTransformationEngine:
+    """Candidate generator and executor behind one transformation engine."""
+
+    __slots__ = ("generator", "executor")
+
+    def __init__(self, generator, executor):
+        self.generator = generator
+        self.executor = executor
+    
+    def generate_candidates(self, profile):
+        return self.generator.generate_candidates(profile)
+    
+    def execute(self, data, transformation):
+        return self.executor.execute(data, transformation)
+    
+    def reverse(self, data, transformation):
+        return data  # Default implementation
+
+
+@functools.lru_cache(maxsize=1)
 def load_modules():
-    """Load and instantiate all required modules."""
+    """Load and instantiate all required modules.
+
+    The services hold no per-input state, so they are built once per
+    process and shared by every later call.
+    """
     # Import modules from the package
     from src.data_profiling.profiler import DataProfilerService as ProfilerImpl
     from src.transformation.candidate_generator import CandidateGenerator
@@ -49,20 +320,6 @@ def load_modules():
     ranking_engine = RankerImpl(policy=ImprovementPolicy())
     
     # Create combined transformation engine
-    class CombinedTransformationEngine:
-        def __init__(self, generator, executor):
-            self.generator = generator
-            self.executor = executor
-        
-        def generate_candidates(self, profile):
-            return self.generator.generate_candidates(profile)
-        
-        def execute(self, data, transformation):
-            return self.executor.execute(data, transformation)
-        
-        def reverse(self, data, transformation):
-            return data  # Default implementation
-    
     transformation_combined = CombinedTransformationEngine(
         transformation_engine, executor
     )
@@ -76,20 +333,29 @@ def load_modules():
     }
 
 
+@functools.lru_cache(maxsize=1)
+def _get_coordinator():
+    """Return the process-wide AgentCoordinator over load_modules()."""
+    from .agent_coordinator import AgentCoordinator
+
+    return AgentCoordinator(**load_modules())
+
+
 def run_pipeline(args):
     """Run the full data wrangling pipeline."""
     setup_logging(args.log_level)
     logger.info("Starting data wrangling pipeline")
     
     try:
+        from src.common.config.loader import ConfigLoader
+        from .pipeline_manager import PipelineManager
+        from .state_manager import StateManager
+        
         # Load configuration
         config = ConfigLoader.load(args.config)
         
-        # Load modules
-        modules = load_modules()
-        
         # Create coordinator
-        coordinator = AgentCoordinator(**modules)
+        coordinator = _get_coordinator()
         
         # Create state manager
         state_manager = StateManager(args.state_dir)
@@ -98,8 +364,8 @@ def run_pipeline(args):
         pipeline = PipelineManager(coordinator, state_manager)
         
         # Load input data
-        data = pd.read_csv(args.input)
-        logger.info(f"Loaded data with {len(data)} rows")
+        data = _read_csv(args.input, engine=args.csv_engine)
+        logger.info("Loaded data with %d rows", len(data))
         
         # Run pipeline
         result = pipeline.run(data, config, args.state_name)
@@ -107,14 +373,13 @@ def run_pipeline(args):
         if result.success:
             # Save output
             if result.data is not None and args.output:
-                result.data.to_csv(args.output, index=False)
-                logger.info(f"Output saved to {args.output}")
+                _write_csv(result.data, args.output)
+                logger.info("Output saved to %s", args.output)
             
             # Save profile
             if result.profile and args.profile:
-                with open(args.profile, "w") as f:
-                    json.dump(result.profile.model_dump(), f, indent=2)
-                logger.info(f"Profile saved to {args.profile}")
+                _write_model(result.profile, args.profile)
+                logger.info("Profile saved to %s", args.profile)
             
             # Save report
             if args.report:
@@ -123,18 +388,17 @@ def run_pipeline(args):
                     "execution_time_seconds": result.execution_time_seconds,
                     "candidates_count": len(result.ranked_transformations),
                 }
-                with open(args.report, "w") as f:
-                    json.dump(report, f, indent=2)
-                logger.info(f"Report saved to {args.report}")
+                _dump_json(report, args.report)
+                logger.info("Report saved to %s", args.report)
             
-            logger.info(f"Pipeline completed in {result.execution_time_seconds:.2f}s")
+            logger.info("Pipeline completed in %.2fs", result.execution_time_seconds)
             return 0
         else:
-            logger.error(f"Pipeline failed: {result.error}")
+            logger.error("Pipeline failed: %s", result.error)
             return 1
             
     except Exception as e:
-        logger.error(f"Error running pipeline: {str(e)}")
+        logger.error("Error running pipeline: %s", e)
         return 1
 
 
@@ -144,27 +408,25 @@ def profile_data(args):
     logger.info("Starting data profiling")
     
     try:
-        # Load modules
-        modules = load_modules()
+        from .pipeline_manager import PipelineManager
         
         # Create coordinator
-        coordinator = AgentCoordinator(**modules)
+        coordinator = _get_coordinator()
         
         # Create pipeline manager
         pipeline = PipelineManager(coordinator)
         
         # Load input data
-        data = pd.read_csv(args.input)
-        logger.info(f"Loaded data with {len(data)} rows")
+        data = _read_csv(args.input, engine=args.csv_engine)
+        logger.info("Loaded data with %d rows", len(data))
         
         # Profile data
         profile = pipeline.run_profile_only(data)
         
         # Save profile
         if args.output:
-            with open(args.output, "w") as f:
-                json.dump(profile.model_dump(), f, indent=2, default=str)
-            logger.info(f"Profile saved to {args.output}")
+            _write_model(profile, args.output)
+            logger.info("Profile saved to %s", args.output)
         
         # Print profile summary
         print(f"\nData Profile Summary:")
@@ -176,7 +438,7 @@ def profile_data(args):
         return 0
         
     except Exception as e:
-        logger.error(f"Error profiling data: {str(e)}")
+        logger.error("Error profiling data: %s", e)
         return 1
 
 
@@ -186,21 +448,17 @@ def generate_candidates(args):
     logger.info("Generating transformation candidates")
     
     try:
-        # Load modules
-        modules = load_modules()
+        from .pipeline_manager import PipelineManager
         
         # Create coordinator
-        coordinator = AgentCoordinator(**modules)
+        coordinator = _get_coordinator()
         
         # Create pipeline manager
         pipeline = PipelineManager(coordinator)
         
         # Load profile
-        with open(args.profile, "r") as f:
-            profile_dict = json.load(f)
-        
         from src.common.types.data_profile import DataProfile
-        profile = DataProfile(**profile_dict)
+        profile = DataProfile.model_validate(_load_json(args.profile))
         
         # Generate candidates
         candidates = pipeline.run_generate_only(profile)
@@ -209,64 +467,108 @@ def generate_candidates(args):
         output_dir = Path(args.output)
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        candidates_data = [c.model_dump() for c in candidates]
-        with open(output_dir / "candidates.json", "w") as f:
-            json.dump(candidates_data, f, indent=2, default=str)
+        _write_records(candidates, output_dir / "candidates.jsonl")
         
-        logger.info(f"Generated {len(candidates)} candidates")
+        logger.info("Generated %d candidates", len(candidates))
         print(f"\nGenerated {len(candidates)} transformation candidates")
         
         return 0
         
     except Exception as e:
-        logger.error(f"Error generating candidates: {str(e)}")
+        logger.error("Error generating candidates: %s", e)
         return 1
 
 
+# Per-process state for _validate_one, set by _init_validate_worker
+_validate_state: dict = {}
+
+
+def _init_validate_worker(data, profile) -> None:
+    """Give a validation worker the data, profile and pipeline it shares."""
+    from .pipeline_manager import PipelineManager
+
+    _validate_state["data"] = data
+    _validate_state["profile"] = profile
+    _validate_state["pipeline"] = PipelineManager(_get_coordinator())
+
+
+def _validate_one(candidate):
+    """Apply one candidate to the data and validate the result.
+
+    Args:
+        candidate: Transformation to validate
+
+    Returns:
+        Tuple of (ValidationResult, None), or (None, error message) if the
+        transformation failed to execute
+    """
+    data = _validate_state["data"]
+    pipeline = _validate_state["pipeline"]
+    result = pipeline.coordinator.execution.execute(data, candidate)
+    if not result.success:
+        return None, result.error_message
+    validation = pipeline.run_validate_only(data, result.output_data, _validate_state["profile"])
+    return validation, None
+
+
 def validate_candidates(args):
     """Validate transformation candidates."""
     setup_logging(args.log_level)
     logger.info("Validating candidates")
     
     try:
-        # Load modules
-        modules = load_modules()
-        
-        # Create coordinator
-        coordinator = AgentCoordinator(**modules)
-        
-        # Create pipeline manager
-        pipeline = PipelineManager(coordinator)
-        
-        # Load data
-        data = pd.read_csv(args.data)
-        
         # Load profile
-        with open(args.profile, "r") as f:
-            profile_dict = json.load(f)
-        
         from src.common.types.data_profile import DataProfile
-        profile = DataProfile(**profile_dict)
+        profile = DataProfile.model_validate(_load_json(args.profile))
         
-        # Load candidates
-        with open(args.candidates, "r") as f:
-            candidates_data = json.load(f)
+        # Load data, typed from the profile instead of inferred
+        data = _read_csv(args.data, dtype=_profile_dtypes(profile), engine=args.csv_engine)
         
+        # Load candidates; JSON Lines are parsed one line at a time
         from src.common.types.transformation import Transformation
-        candidates = [Transformation(**c) for c in candidates_data]
+        candidates = [Transformation(**c) for c in _load_records(args.candidates)]
+        
+        # Candidates are independent: spread them over worker processes,
+        # each given the data and profile once by its initializer, when
+        # there is enough work to pay for starting them
+        workers = min(
+            len(candidates),
+            os.cpu_count() or 1,
+            len(candidates) * len(data) // VALIDATE_WORK_PER_WORKER,
+        )
+        if workers > 1:
+            chunksize = max(1, len(candidates) // (workers * 4))
+            # Spawned, not forked: forking after numba's parallel kernels
+            # have started their threads hangs this process at exit
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_validate_worker,
+                initargs=(data, profile),
+            ) as ex:
+                outcomes = list(ex.map(_validate_one, candidates, chunksize=chunksize))
+        else:
+            _init_validate_worker(data, profile)
+            outcomes = [_validate_one(candidate) for candidate in candidates]
         
-        # Validate each candidate
+        # Candidates whose transformation failed to execute are reported
+        # and left out of the validated count
         results = []
-        for candidate in candidates:
-            result = pipeline.run_validate_only(data, data, profile)  # Simplified
-            results.append(result)
+        for candidate, (result, error) in zip(candidates, outcomes):
+            if result is None:
+                logger.warning("Skipped candidate %s: execution failed: %s", candidate.id, error)
+            else:
+                results.append(result)
         
-        print(f"\nValidated {len(results)} candidates")
+        skipped = len(candidates) - len(results)
+        print(f"\nValidated {len(results)} of {len(candidates)} candidates")
+        if skipped:
+            print(f"Skipped {skipped} candidates that failed to execute")
         
         return 0
         
     except Exception as e:
-        logger.error(f"Error validating candidates: {str(e)}")
+        logger.error("Error validating candidates: %s", e)
         return 1
 
 
@@ -276,54 +578,46 @@ def rank_candidates(args):
     logger.info("Ranking candidates")
     
     try:
-        # Load modules
-        modules = load_modules()
+        from .pipeline_manager import PipelineManager
         
         # Create coordinator
-        coordinator = AgentCoordinator(**modules)
+        coordinator = _get_coordinator()
         
         # Create pipeline manager
         pipeline = PipelineManager(coordinator)
         
         # Load candidates
-        with open(args.candidates, "r") as f:
-            candidates_data = json.load(f)
-        
         from src.common.types.ranking import TransformationCandidate
-        candidates = [TransformationCandidate(**c) for c in candidates_data]
+        candidates = [TransformationCandidate(**c) for c in _load_records(args.candidates)]
         
         # Rank candidates
         ranked = pipeline.run_rank_only(candidates)
         
         # Save ranked results
         if args.output:
-            ranked_data = [r.model_dump() for r in ranked]
-            with open(args.output, "w") as f:
-                json.dump(ranked_data, f, indent=2, default=str)
+            _write_records(ranked, args.output)
         
         print(f"\nRanked {len(ranked)} candidates")
         
         return 0
         
     except Exception as e:
-        logger.error(f"Error ranking candidates: {str(e)}")
+        logger.error("Error ranking candidates: %s", e)
         return 1
 
 
 def run_agent(args):
     """Run a specific agent."""
     setup_logging(args.log_level)
-    logger.info(f"Running agent: {args.name}")
+    logger.info("Running agent: %s", args.name)
     
     try:
-        # Load modules
-        modules = load_modules()
         
         # Create coordinator
-        coordinator = AgentCoordinator(**modules)
+        coordinator = _get_coordinator()
         
         # Load input data
-        data = pd.read_csv(args.input)
+        data = _read_csv(args.input, engine=args.csv_engine)
         
         # Execute agent
         result = coordinator.execute_agent(args.name, data)
@@ -334,7 +628,7 @@ def run_agent(args):
         return 0
         
     except Exception as e:
-        logger.error(f"Error running agent: {str(e)}")
+        logger.error("Error running agent: %s", e)
         return 1
 
 
@@ -344,11 +638,11 @@ def recover_pipeline(args):
     logger.info("Recovering pipeline")
     
     try:
-        # Load modules
-        modules = load_modules()
+        from .pipeline_manager import PipelineManager
+        from .state_manager import StateManager
         
         # Create coordinator
-        coordinator = AgentCoordinator(**modules)
+        coordinator = _get_coordinator()
         
         # Create state manager
         state_manager = StateManager(args.state_dir)
@@ -363,29 +657,15 @@ def recover_pipeline(args):
             logger.info("Pipeline recovered successfully")
             return 0
         else:
-            logger.error(f"Recovery failed: {result.error}")
+            logger.error("Recovery failed: %s", result.error)
             return 1
             
     except Exception as e:
-        logger.error(f"Error recovering pipeline: {str(e)}")
+        logger.error("Error recovering pipeline: %s", e)
         return 1
 
 
-def main():
-    """Main entry point for the CLI."""
-    parser = argparse.ArgumentParser(
-        description="Multi-Agent Data Wrangler - Orchestrate data wrangling pipeline"
-    )
-    parser.add_argument(
-        "--log-level",
-        default="INFO",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
-        help="Logging level",
-    )
-    
-    subparsers = parser.add_subparsers(dest="command", help="Command to run")
-    
-    # Run pipeline command
+def _add_run_parser(subparsers) -> None:
     run_parser = subparsers.add_parser("run", help="Run full pipeline")
     run_parser.add_argument("--config", required=True, help="Pipeline configuration file")
     run_parser.add_argument("--input", required=True, help="Input CSV file")
@@ -394,53 +674,132 @@ def main():
     run_parser.add_argument("--report", help="Report JSON output file")
     run_parser.add_argument("--state-dir", default=".state", help="State directory")
     run_parser.add_argument("--state-name", default="default", help="State name")
-    run_parser.set_defaults(func=run_pipeline)
-    
-    # Profile command
+
+
+def _add_profile_parser(subparsers) -> None:
     profile_parser = subparsers.add_parser("profile", help="Profile data only")
     profile_parser.add_argument("--input", required=True, help="Input CSV file")
     profile_parser.add_argument("--output", help="Profile JSON output file")
-    profile_parser.set_defaults(func=profile_data)
-    
-    # Generate command
+
+
+def _add_generate_parser(subparsers) -> None:
     generate_parser = subparsers.add_parser("generate", help="Generate candidates")
     generate_parser.add_argument("--profile", required=True, help="Profile JSON file")
     generate_parser.add_argument("--output", required=True, help="Output directory")
-    generate_parser.set_defaults(func=generate_candidates)
-    
-    # Validate command
+
+
+def _add_validate_parser(subparsers) -> None:
     validate_parser = subparsers.add_parser("validate", help="Validate candidates")
     validate_parser.add_argument("--candidates", required=True, help="Candidates JSON file")
     validate_parser.add_argument("--data", required=True, help="Original data CSV file")
     validate_parser.add_argument("--profile", required=True, help="Profile JSON file")
-    validate_parser.set_defaults(func=validate_candidates)
-    
-    # Rank command
+
+
+def _add_rank_parser(subparsers) -> None:
     rank_parser = subparsers.add_parser("rank", help="Rank candidates")
     rank_parser.add_argument("--candidates", required=True, help="Candidates JSON file")
     rank_parser.add_argument("--profile", help="Profile JSON file")
     rank_parser.add_argument("--output", help="Ranked output JSON file")
-    rank_parser.set_defaults(func=rank_candidates)
-    
-    # Agent command
+
+
+def _add_agent_parser(subparsers) -> None:
     agent_parser = subparsers.add_parser("agent", help="Run specific agent")
     agent_parser.add_argument("--name", required=True, help="Agent name")
     agent_parser.add_argument("--input", required=True, help="Input CSV file")
-    agent_parser.set_defaults(func=run_agent)
-    
-    # Recover command
+
+
+def _add_recover_parser(subparsers) -> None:
     recover_parser = subparsers.add_parser("recover", help="Recover pipeline")
     recover_parser.add_argument("--state-dir", default=".state", help="State directory")
     recover_parser.add_argument("--state-name", default="default", help="State name")
-    recover_parser.set_defaults(func=recover_pipeline)
+
+
+# Subcommand name -> function adding its subparser, in help order
+_SUBPARSERS = {
+    "run": _add_run_parser,
+    "profile": _add_profile_parser,
+    "generate": _add_generate_parser,
+    "validate": _add_validate_parser,
+    "rank": _add_rank_parser,
+    "agent": _add_agent_parser,
+    "recover": _add_recover_parser,
+}
+
+
+# Subcommand name -> function running it
+_DISPATCH = {
+    "run": run_pipeline,
+    "profile": profile_data,
+    "generate": generate_candidates,
+    "validate": validate_candidates,
+    "rank": rank_candidates,
+    "agent": run_agent,
+    "recover": recover_pipeline,
+}
+
+
+def _sniff_subcommand(argv: list) -> Optional[str]:
+    """Return the first subcommand name in argv, or None if there is none.
+
+    Args:
+        argv: Command-line arguments without the program name
+
+    Returns:
+        The subcommand name, or None
+    """
+    for arg in argv:
+        if arg in _SUBPARSERS:
+            return arg
+    return None
+
+
+def main(argv: Optional[list] = None):
+    """Main entry point for the CLI."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(
+        description="Multi-Agent Data Wrangler - Orchestrate data wrangling pipeline"
+    )
+    parser.add_argument(
+        "--log-level",
+        default="INFO",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="Logging level",
+    )
+    parser.add_argument(
+        "--quiet",
+        "-q",
+        dest="log_level",
+        action="store_const",
+        const="ERROR",
+        help="Only log errors (same as --log-level ERROR)",
+    )
+    parser.add_argument(
+        "--csv-engine",
+        default="c",
+        choices=["c", "pyarrow"],
+        help="CSV parser for input files (pyarrow must be installed)",
+    )
+    
+    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+    
+    # Only the invoked subcommand needs its parser; top-level help and
+    # unknown commands get all of them so usage and errors list every choice
+    command = _sniff_subcommand(argv)
+    if command is not None:
+        _SUBPARSERS[command](subparsers)
+    else:
+        for add_parser in _SUBPARSERS.values():
+            add_parser(subparsers)
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if args.command is None:
         parser.print_help()
         return 1
     
-    return args.func(args)
+    return _DISPATCH[args.command](args)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,12 @@
 """Error handling and recovery mechanisms."""
 
+import asyncio
+import inspect
 import logging
-from typing import Optional, Callable, Any, TypeVar, Generic
+import random
+import time
+from collections import deque
+from typing import Optional, Callable, Any, Iterator, TypeVar
 from enum import Enum
 from functools import wraps
 
@@ -10,6 +15,10 @@ from src.common.types.pipeline import PipelineState, PipelineStep
 
 logger = logging.getLogger(__name__)
 
+# Bound once: the retry and circuit-breaker paths call these per attempt
+_sleep = time.sleep
+_monotonic = time.monotonic
+
 
 class FailureStrategy(str, Enum):
     """Strategy for handling failures."""
@@ -21,6 +30,10 @@ class FailureStrategy(str, Enum):
 
 T = TypeVar('T')
 
+# Step that follows each pipeline step, in declaration order
+_STEPS = tuple(PipelineStep)
+_NEXT_STEP: dict[PipelineStep, PipelineStep] = dict(zip(_STEPS, _STEPS[1:]))
+
 
 class RetryConfig:
     """Configuration for retry behavior."""
@@ -31,11 +44,13 @@ class RetryConfig:
         initial_delay: float = 1.0,
         backoff_factor: float = 2.0,
         max_delay: float = 60.0,
+        jitter: float = 0.0,
     ):
         self.max_retries = max_retries
         self.initial_delay = initial_delay
         self.backoff_factor = backoff_factor
         self.max_delay = max_delay
+        self.jitter = jitter
 
 
 class RecoveryAction:
@@ -61,16 +76,19 @@ class FailureRecovery:
         self,
         strategy: FailureStrategy = FailureStrategy.SKIP,
         retry_config: Optional[RetryConfig] = None,
+        history_size: Optional[int] = None,
     ):
         """Initialize failure recovery.
         
         Args:
             strategy: Default failure strategy
             retry_config: Configuration for retry behavior
+            history_size: Maximum number of recovery actions kept, oldest
+                dropped first; None keeps all of them
         """
         self.strategy = strategy
         self.retry_config = retry_config or RetryConfig()
-        self._recovery_history: list[RecoveryAction] = []
+        self._recovery_history: deque[RecoveryAction] = deque(maxlen=history_size)
     
     def handle_failure(
         self,
@@ -88,7 +106,7 @@ class FailureRecovery:
         Returns:
             Tuple of (strategy to use, updated state or None)
         """
-        logger.error(f"Failure in step {step.value}: {str(error)}")
+        logger.error("Failure in step %s: %s", step.value, error)
         
         # Record the failure
         action = RecoveryAction(
@@ -107,7 +125,7 @@ class FailureRecovery:
             return FailureStrategy.ABORT, state
             
         elif self.strategy == FailureStrategy.SKIP:
-            logger.warning(f"Skipping step {step.value} due to failure")
+            logger.warning("Skipping step %s due to failure", step.value)
             # Move to next step
             next_step = self._get_next_step(step)
             if next_step:
@@ -115,29 +133,32 @@ class FailureRecovery:
             return FailureStrategy.SKIP, state
             
         elif self.strategy == FailureStrategy.RETRY:
-            logger.info(f"Retrying step {step.value}")
+            logger.info("Retrying step %s", step.value)
             return FailureStrategy.RETRY, None  # Signal to retry
             
         elif self.strategy == FailureStrategy.FALLBACK:
-            logger.warning(f"Using fallback for step {step.value}")
+            logger.warning("Using fallback for step %s", step.value)
             return FailureStrategy.FALLBACK, state
             
         return FailureStrategy.ABORT, state
     
     def _get_next_step(self, current: PipelineStep) -> Optional[PipelineStep]:
         """Get the next step in the pipeline."""
-        steps = list(PipelineStep)
-        try:
-            current_idx = steps.index(current)
-            if current_idx + 1 < len(steps):
-                return steps[current_idx + 1]
-        except ValueError:
-            pass
-        return None
+        return _NEXT_STEP.get(current)
     
     def get_recovery_history(self) -> list[RecoveryAction]:
-        """Get the history of recovery actions."""
-        return self._recovery_history.copy()
+        """Get a snapshot copy of the history of recovery actions.
+        
+        Prefer iter_recovery_history when the actions are only read once.
+        """
+        return list(self._recovery_history)
+    
+    def iter_recovery_history(self) -> Iterator[RecoveryAction]:
+        """Iterate over the recovery actions without copying them.
+        
+        The history must not change while the iterator is in use.
+        """
+        return iter(self._recovery_history)
     
     def clear_history(self) -> None:
         """Clear the recovery history."""
@@ -149,19 +170,72 @@ def with_retry(
     delay: float = 1.0,
     backoff: float = 2.0,
     exceptions: tuple = (Exception,),
+    max_delay: float = 60.0,
+    jitter: float = 0.0,
+    config: Optional[RetryConfig] = None,
 ):
     """Decorator to add retry logic to a function.
     
+    Coroutine functions get an async wrapper that backs off with
+    asyncio.sleep, so retries in one task do not block the event loop.
+    
     Args:
         max_retries: Maximum number of retries
         delay: Initial delay between retries in seconds
         backoff: Backoff factor for delay
         exceptions: Tuple of exceptions to catch
+        max_delay: Upper bound on the delay between retries in seconds
+        jitter: Each pause is scaled by a random factor in
+            [1 - jitter, 1 + jitter] so concurrent callers spread out
+        config: Retry settings that override max_retries, delay, backoff,
+            max_delay and jitter
         
     Returns:
         Decorated function
     """
+    if config is not None:
+        max_retries = config.max_retries
+        delay = config.initial_delay
+        backoff = config.backoff_factor
+        max_delay = config.max_delay
+        jitter = config.jitter
+    delay = min(delay, max_delay)
+    
+    def _on_failure(attempt: int, error: Exception, current_delay: float) -> Optional[float]:
+        """Log a failed attempt and return the pause before the next one."""
+        if attempt < max_retries:
+            pause = current_delay
+            if jitter:
+                pause *= random.uniform(1 - jitter, 1 + jitter)
+            logger.warning(
+                "Attempt %d/%d failed: %s. Retrying in %.3gs...",
+                attempt + 1, max_retries, error, pause,
+            )
+            return pause
+        logger.error("All %d attempts failed", max_retries + 1)
+        return None
+    
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs) -> T:
+                current_delay = delay
+                last_exception = None
+                
+                for attempt in range(max_retries + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions as e:
+                        last_exception = e
+                        pause = _on_failure(attempt, e, current_delay)
+                        if pause is not None:
+                            await asyncio.sleep(pause)
+                            current_delay = min(current_delay * backoff, max_delay)
+                
+                raise last_exception
+            
+            return async_wrapper
+        
         @wraps(func)
         def wrapper(*args, **kwargs) -> T:
             current_delay = delay
@@ -172,18 +246,10 @@ def with_retry(
                     return func(*args, **kwargs)
                 except exceptions as e:
                     last_exception = e
-                    if attempt < max_retries:
-                        logger.warning(
-                            f"Attempt {attempt + 1}/{max_retries} failed: {str(e)}. "
-                            f"Retrying in {current_delay}s..."
-                        )
-                        import time
-                        time.sleep(current_delay)
-                        current_delay *= backoff
-                    else:
-                        logger.error(
-                            f"All {max_retries + 1} attempts failed"
-                        )
+                    pause = _on_failure(attempt, e, current_delay)
+                    if pause is not None:
+                        _sleep(pause)
+                        current_delay = min(current_delay * backoff, max_delay)
             
             raise last_exception
         
@@ -211,8 +277,7 @@ def with_fallback(
                 return func(*args, **kwargs)
             except exception as e:
                 logger.warning(
-                    f"Function {func.__name__} failed: {str(e)}. "
-                    f"Using fallback value."
+                    "Function %s failed: %s. Using fallback value.", func.__name__, e
                 )
                 return fallback_value
         
@@ -236,12 +301,10 @@ class CircuitBreaker:
     
     def call(self, func: Callable[..., T], *args, **kwargs) -> T:
         """Execute a function through the circuit breaker."""
-        import time
-        
         # Check if circuit is open
         if self.is_open:
             if self.last_failure_time:
-                elapsed = time.time() - self.last_failure_time
+                elapsed = _monotonic() - self.last_failure_time
                 if elapsed >= self.recovery_timeout:
                     # Try to close the circuit
                     logger.info("Circuit breaker: attempting to close")
@@ -257,10 +320,10 @@ class CircuitBreaker:
             return result
         except Exception as e:
             self.failure_count += 1
-            self.last_failure_time = time.time()
+            self.last_failure_time = _monotonic()
             
             if self.failure_count >= self.failure_threshold:
-                logger.error(f"Circuit breaker opened after {self.failure_count} failures")
+                logger.error("Circuit breaker opened after %d failures", self.failure_count)
                 self.is_open = True
             
             raise
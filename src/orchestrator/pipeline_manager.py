@@ -7,9 +7,9 @@ import pandas as pd
 
 from src.common.types.pipeline import PipelineConfig, PipelineState, PipelineStep
 from src.common.types.data_profile import DataProfile
-from src.common.types.transformation import Transformation, TransformationResult
+from src.common.types.transformation import Transformation
 from src.common.types.ranking import TransformationCandidate, RankedTransformation
-from src.transformation.dag import TransformationDAG, TransformationDAGBuilder
+from src.transformation.dag import TransformationDAG
 
 from .agent_coordinator import AgentCoordinator
 from .state_manager import StateManager
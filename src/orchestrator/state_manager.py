@@ -1,7 +1,6 @@
 """Pipeline state management."""
 
 import json
-import pickle
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
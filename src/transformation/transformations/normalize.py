@@ -88,9 +88,8 @@ class NormalizeTransformation(BaseTransformation):
         
         elif method == "robust":
             # Robust normalization using median and IQR
-            median = valid_values.median()
-            q75 = valid_values.quantile(0.75)
-            q25 = valid_values.quantile(0.25)
+            # One quantile call partitions the values once for all three
+            q25, median, q75 = valid_values.quantile([0.25, 0.5, 0.75])
             iqr = q75 - q25
             
             if pd.isna(iqr) or iqr == 0:
@@ -37,8 +37,7 @@ class RemoveOutliersTransformation(BaseTransformation):
 
         if method == "iqr":
             # IQR-based outlier detection
-            Q1 = numeric_col.quantile(0.25)
-            Q3 = numeric_col.quantile(0.75)
+            Q1, Q3 = numeric_col.quantile([0.25, 0.75])
             IQR = Q3 - Q1
 
             lower_bound = Q1 - threshold * IQR
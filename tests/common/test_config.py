@@ -1,5 +1,6 @@
 """Tests for common configuration."""
 
+import pydantic
 import pytest
 import tempfile
 import os
@@ -79,6 +80,30 @@ class TestConfigSchemas:
         assert config.version == "1.0.0"
         assert config.max_iterations == 10
 
+    def test_config_is_frozen_and_ignores_extras(self):
+        """Test that configs reject assignment and drop unknown fields."""
+        config = PipelineConfig(
+            data_source=DataSourceConfig(type="csv"),
+            unknown_field="ignored",
+        )
+        assert not hasattr(config, "unknown_field")
+        with pytest.raises(pydantic.ValidationError):
+            config.name = "changed"
+
+    def test_pipeline_config_builds_section_dataclasses(self):
+        """Test that plain sections are built and type-checked from mappings."""
+        config = PipelineConfig.model_validate(
+            {"data_source": {"type": "csv"}, "ranking": {"top_k": 5}}
+        )
+        assert isinstance(config.ranking, RankingConfig)
+        assert config.ranking.top_k == 5
+        assert config.model_dump()["ranking"] == {"enabled": True, "top_k": 5}
+
+        with pytest.raises(pydantic.ValidationError):
+            PipelineConfig.model_validate(
+                {"data_source": {"type": "csv"}, "ranking": {"top_k": "many"}}
+            )
+
 
 class TestConfigLoader:
     """Tests for configuration loader."""
@@ -133,6 +158,33 @@ data_source:
         finally:
             os.unlink(temp_path)
 
+    def test_load_returns_independent_copies(self):
+        """Test that cached loads do not share mutable state."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = os.path.join(tmpdir, "config.yaml")
+            with open(config_path, "w") as f:
+                f.write("name: cached\ndata_source:\n  type: csv\n")
+
+            first = ConfigLoader.load(config_path)
+            first.data_source.options["key"] = "mutated"
+            second = ConfigLoader.load(config_path)
+            assert second.data_source.options == {}
+
+    def test_load_picks_up_file_changes(self):
+        """Test that editing a config file invalidates the cache."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = os.path.join(tmpdir, "config.yaml")
+            with open(config_path, "w") as f:
+                f.write("name: before\ndata_source:\n  type: csv\n")
+            assert ConfigLoader.load(config_path).name == "before"
+
+            with open(config_path, "w") as f:
+                f.write("name: after_edit\ndata_source:\n  type: csv\n")
+            assert ConfigLoader.load(config_path).name == "after_edit"
+
+            ConfigLoader.clear_cache()
+            assert ConfigLoader.load(config_path).name == "after_edit"
+
     def test_save_config(self):
         """Test saving configuration to a YAML file."""
         config = PipelineConfig(
@@ -149,3 +201,18 @@ data_source:
             loaded = ConfigLoader.load(config_path)
             assert loaded.name == "save_test"
             assert loaded.data_source.type == "csv"
+
+    def test_fast_path_matches_pydantic(self, monkeypatch):
+        """Test that the msgspec fast path yields the same configuration."""
+        pytest.importorskip("msgspec")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = os.path.join(tmpdir, "config.yaml")
+            with open(config_path, "w") as f:
+                f.write("name: fast\ndata_source:\n  type: csv\nranking:\n  top_k: 3\n")
+
+            expected = ConfigLoader.load(config_path)
+            monkeypatch.setenv("DATA_WRANGLER_FAST_CONFIG", "1")
+            config = ConfigLoader.load(config_path)
+
+        assert isinstance(config, PipelineConfig)
+        assert config.model_dump() == expected.model_dump()
@@ -6,6 +6,7 @@ from datetime import datetime
 from src.common.types import (
     DataProfile,
     ColumnProfile,
+    ColumnProfileTable,
     Transformation,
     TransformationType,
     TransformationResult,
@@ -93,6 +94,47 @@ class TestDataProfileTypes:
         assert profile_restored.columns["age"].name == "age"
 
 
+    def test_column_profile_table(self):
+        """Test the columnar view of column profiles."""
+        columns = {
+            "age": ColumnProfile(
+                name="age",
+                dtype="int64",
+                null_count=2,
+                null_percentage=20.0,
+                unique_count=8,
+                min_value=18.0,
+                max_value=65.0,
+                mean=35.5,
+                std=12.3,
+                inferred_type="numeric",
+            ),
+            "name": ColumnProfile(
+                name="name",
+                dtype="object",
+                null_count=0,
+                null_percentage=0.0,
+                inferred_type="text",
+            ),
+        }
+        profile = DataProfile(
+            timestamp=datetime.now(),
+            row_count=10,
+            column_count=2,
+            columns=columns,
+            overall_missing_percentage=10.0,
+            duplicate_rows=0,
+        )
+
+        table = profile.column_table()
+        assert isinstance(table, ColumnProfileTable)
+        assert len(table) == 2
+        assert int((table.null_percentages > 0).sum()) == 1
+        assert table.row(0) == columns["age"]
+        assert table.get("name") == columns["name"]
+        assert table.get("missing") is None
+
+
 class TestTransformationTypes:
     """Tests for transformation types."""
 
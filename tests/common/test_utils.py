@@ -0,0 +1,26 @@
+"""Tests for common utilities."""
+
+import random
+
+from src.common.utils import sample_without_replacement
+
+
+class TestSampleWithoutReplacement:
+    """Tests for sample_without_replacement."""
+
+    def test_seeded_sample_is_reproducible(self):
+        """Test that the same seed gives the same sample."""
+        population = list(range(100))
+        first = sample_without_replacement(population, 10, seed=42)
+        second = sample_without_replacement(population, 10, seed=42)
+        assert first == second
+        assert len(set(first)) == 10
+
+    def test_seeded_sample_leaves_global_state_alone(self):
+        """Test that seeding a sample does not disturb the global generator."""
+        random.seed(7)
+        expected = random.random()
+
+        random.seed(7)
+        sample_without_replacement(list(range(100)), 10, seed=42)
+        assert random.random() == expected
@@ -0,0 +1,121 @@
+"""Tests for the data profiling kernels."""
+
+import pytest
+import numpy as np
+
+from src.data_profiling import _kernels
+
+
+class TestRowMissingAndHist:
+    """Tests for row_missing_and_hist."""
+    
+    def test_counts_and_histogram(self):
+        """Test per-row counts and histogram on a small mask."""
+        mask = np.array([[0, 0, 0], [1, 0, 1], [1, 1, 1], [0, 1, 0]], dtype=np.uint8)
+        per_row, hist = _kernels.row_missing_and_hist(mask)
+        
+        assert per_row.tolist() == [0, 2, 3, 1]
+        assert hist.tolist() == [1, 1, 1, 1]
+    
+    @pytest.mark.skipif(not _kernels.HAS_NUMBA, reason="numba not installed")
+    def test_numba_matches_numpy(self):
+        """Test the compiled kernel against the NumPy fallback."""
+        rng = np.random.default_rng(0)
+        mask = (rng.random((500, _kernels.WIDE_FRAME_COLUMNS)) < 0.1).astype(np.uint8)
+        
+        per_row, hist = _kernels._row_missing_and_hist_numba(mask)
+        expected_per_row, expected_hist = _kernels._row_missing_and_hist_numpy(mask)
+        
+        np.testing.assert_array_equal(per_row, expected_per_row)
+        np.testing.assert_array_equal(hist, expected_hist)
+
+
+class TestNumericStats:
+    """Tests for numeric_stats."""
+    
+    def test_stats_skip_nan(self):
+        """Test min/max/mean/std/count with missing values."""
+        values = np.array([1.0, np.nan, 3.0, 5.0])
+        minimum, maximum, mean, std, count = _kernels.numeric_stats(values)
+        
+        assert (minimum, maximum, mean, count) == (1.0, 5.0, 3.0, 3)
+        assert std == pytest.approx(np.std([1.0, 3.0, 5.0]))
+    
+    def test_all_nan(self):
+        """Test that an all-missing column has count 0 and NaN stats."""
+        minimum, _, _, _, count = _kernels.numeric_stats(np.array([np.nan, np.nan]))
+        assert count == 0
+        assert np.isnan(minimum)
+    
+    @pytest.mark.skipif(not _kernels.HAS_NUMBA, reason="numba not installed")
+    def test_numba_matches_numpy(self):
+        """Test the compiled kernel against the NumPy fallback."""
+        rng = np.random.default_rng(0)
+        values = rng.normal(1e6, 3.0, 10000)
+        values[::7] = np.nan
+        
+        result = _kernels._numeric_stats_numba(values)
+        expected = _kernels._numeric_stats_numpy(values)
+        
+        np.testing.assert_allclose(result[:4], expected[:4], rtol=1e-9)
+        assert result[4] == expected[4]
+
+
+class TestNumericMoments:
+    """Tests for numeric_moments."""
+    
+    def test_moments_skip_nan(self):
+        """Test central moments with missing values."""
+        values = np.array([1.0, np.nan, 2.0, 3.0, 10.0])
+        minimum, maximum, mean, m2, m3, m4, count = _kernels.numeric_moments(values)
+        
+        valid = np.array([1.0, 2.0, 3.0, 10.0])
+        dev = valid - valid.mean()
+        assert (minimum, maximum, mean, count) == (1.0, 10.0, 4.0, 4)
+        np.testing.assert_allclose([m2, m3, m4], [np.mean(dev ** 2), np.mean(dev ** 3), np.mean(dev ** 4)])
+    
+    @pytest.mark.skipif(not _kernels.HAS_NUMBA, reason="numba not installed")
+    def test_numba_matches_numpy(self):
+        """Test the compiled kernel against the NumPy fallback."""
+        rng = np.random.default_rng(0)
+        values = rng.exponential(2.0, 10000) + 1e3
+        values[::5] = np.nan
+        
+        result = _kernels._numeric_moments_numba(values)
+        expected = _kernels._numeric_moments_numpy(values)
+        
+        np.testing.assert_allclose(result[:6], expected[:6], rtol=1e-8)
+        assert result[6] == expected[6]
+
+
+class TestColumnMoments:
+    """Tests for column_moments."""
+    
+    def test_matches_numeric_moments(self):
+        """Test each column against the single-column kernel."""
+        block = np.array([
+            [1.0, np.nan, 5.0],
+            [np.nan, np.nan, 5.0],
+            [2.0, np.nan, 5.0],
+            [3.0, np.nan, 5.0],
+            [10.0, np.nan, 5.0],
+        ])
+        result = _kernels.column_moments(block)
+        
+        for j in range(block.shape[1]):
+            expected = _kernels.numeric_moments(block[:, j])
+            np.testing.assert_allclose([stat[j] for stat in result], expected, equal_nan=True)
+    
+    @pytest.mark.skipif(not _kernels.HAS_NUMBA, reason="numba not installed")
+    def test_numba_matches_numpy(self):
+        """Test the compiled kernel against the NumPy fallback."""
+        rng = np.random.default_rng(0)
+        block = rng.normal(size=(1000, 20)) * 3 + 50
+        block[::7, 3] = np.nan
+        block[:, 5] = np.nan
+        
+        result = _kernels._column_moments_numba(np.asfortranarray(block))
+        expected = _kernels._column_moments_numpy(block)
+        
+        for got, want in zip(result, expected):
+            np.testing.assert_allclose(got, want, rtol=1e-9, equal_nan=True)
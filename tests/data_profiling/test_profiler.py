@@ -5,7 +5,8 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 
-from src.data_profiling import DataProfilerService
+from src.data_profiling import DataProfilerService, MissingValueAnalyzer
+from src.data_profiling._kernels import HLL_MIN_ROWS, hll_nunique
 from src.common.types import DataProfile
 
 
@@ -129,6 +130,18 @@ class TestDataProfilerService:
         
         assert profile.duplicate_rows == 2
     
+    def test_profile_duplicate_rows_large_frame_is_exact(self):
+        """Test that duplicate counting on large frames is exact, not sampled."""
+        data = pd.DataFrame({
+            'a': np.arange(120000) % 100000,
+            'b': ['x'] * 120000,
+        })
+        
+        profiler = DataProfilerService()
+        profile = profiler.profile(data)
+        
+        assert profile.duplicate_rows == 20000
+    
     def test_profile_overall_missing_percentage(self):
         """Test overall missing percentage calculation."""
         data = pd.DataFrame({
@@ -158,6 +171,30 @@ class TestDataProfilerService:
         assert 'overall_missing' in details
         assert 'statistics' in details
     
+    def test_profile_with_details_without_dump(self):
+        """Test that the profile model can be returned without dumping it."""
+        data = pd.DataFrame({'col': [1, 2, 3]})
+        details = DataProfilerService().profile_with_details(data, dump_profile=False)
+        assert isinstance(details['profile'], DataProfile)
+    
+    def test_profile_with_details_summarizes_once(self, monkeypatch):
+        """Test that details reuse the profile's intermediate results."""
+        data = pd.DataFrame({'col': [1, 2, 3]})
+        profiler = DataProfilerService()
+        
+        calls = []
+        original = profiler.statistical_summarizer.summarize
+        monkeypatch.setattr(
+            profiler.statistical_summarizer,
+            'summarize',
+            lambda *args, **kwargs: calls.append(1) or original(*args, **kwargs),
+        )
+        
+        details = profiler.profile_with_details(data)
+        
+        assert len(calls) == 1
+        assert details['statistics']['col']['max'] == 3.0
+    
     def test_profile_mixed_types(self):
         """Test profiling a DataFrame with mixed column types."""
         data = pd.DataFrame({
@@ -175,6 +212,45 @@ class TestDataProfilerService:
         assert profile.columns['bool'].inferred_type == 'boolean'
         assert profile.columns['dates'].inferred_type == 'datetime'
     
+    def test_profile_wide_dataframe(self):
+        """Test that wide frames profiled in parallel keep column order and types."""
+        data = pd.DataFrame({
+            f'col{i}': ([1.5, 2.5, 3.5, 4.5, 5.5] if i % 2 else ['x', 'y', 'z', 'w', 'v'])
+            for i in range(12)
+        })
+        
+        profiler = DataProfilerService()
+        profile = profiler.profile(data)
+        
+        assert list(profile.columns) == list(data.columns)
+        assert profile.columns['col1'].inferred_type == 'numeric'
+        assert profile.columns['col1'].max_value == 5.5
+        assert profile.columns['col0'].inferred_type == 'text'
+    
+    def test_profile_with_downcast_keeps_original_dtypes(self):
+        """Test that downcasting for profiling does not change reported values."""
+        data = pd.DataFrame({
+            'ints': np.arange(100),
+            'halves': np.arange(100) * 0.5,
+            'cats': ['a', 'b', 'c', 'd'] * 25,
+        })
+        
+        plain = DataProfilerService().profile(data)
+        downcast = DataProfilerService(downcast_for_profiling=True).profile(data)
+        
+        for column in data.columns:
+            assert downcast.columns[column].dtype == plain.columns[column].dtype
+            assert downcast.columns[column].unique_count == plain.columns[column].unique_count
+            assert downcast.columns[column].inferred_type == plain.columns[column].inferred_type
+        assert downcast.columns['ints'].max_value == 99
+        assert downcast.duplicate_rows == plain.duplicate_rows
+    
+    def test_unique_count_of_categorical_ignores_unused_categories(self):
+        """Test that unused categories and nulls are not counted as values."""
+        series = pd.Series(pd.Categorical(['a', 'b', None, 'a'], categories=['a', 'b', 'z']))
+        profiler = DataProfilerService()
+        assert profiler._get_unique_count(series, 'categorical') == 2
+    
     def test_profile_empty_dataframe(self):
         """Test profiling an empty DataFrame."""
         data = pd.DataFrame()
@@ -196,3 +272,130 @@ class TestDataProfilerService:
         after = datetime.now()
         
         assert before <= profile.timestamp <= after
+
+
+class TestMissingValueAnalyzer:
+    """Tests for MissingValueAnalyzer."""
+    
+    def test_reanalyzing_frame_after_in_place_edit(self):
+        """Test that an in-place edit shows up when the same frame is analyzed again."""
+        data = pd.DataFrame({'a': [1.0, 2.0, 3.0], 'b': ['x', 'y', 'z']})
+        analyzer = MissingValueAnalyzer()
+        assert analyzer.analyze(data)['a']['null_count'] == 0
+        assert analyzer.get_overall_missing_stats(data)['total_missing'] == 0
+        
+        data.loc[0, 'a'] = np.nan
+        data.loc[1, 'b'] = ''
+        
+        assert analyzer.analyze(data)['a']['null_count'] == 1
+        assert analyzer.get_overall_missing_stats(data)['total_missing'] == 2
+        assert analyzer.get_missing_patterns(data)['num_rows'].tolist() == [1, 2]
+    
+    def test_shared_masks_match_fresh_analysis(self):
+        """Test that passing precomputed masks gives the same results."""
+        data = pd.DataFrame({'a': [1.0, np.nan, 3.0], 'b': ['x', '', None]})
+        analyzer = MissingValueAnalyzer()
+        masks = analyzer.missing_masks(data)
+        assert analyzer.analyze(data, masks) == analyzer.analyze(data)
+        assert analyzer.get_overall_missing_stats(data, masks) == analyzer.get_overall_missing_stats(data)
+        pd.testing.assert_frame_equal(
+            analyzer.get_missing_patterns(data, masks), analyzer.get_missing_patterns(data)
+        )
+
+
+class TestProfilingBackends:
+    """Tests for the optional polars and cudf profiling backends."""
+    
+    def test_unknown_backend_rejected(self):
+        """Test that an unknown backend name raises ValueError."""
+        with pytest.raises(ValueError):
+            DataProfilerService(backend='spark')
+    
+    def test_cudf_backend_requires_cudf(self):
+        """Test that requesting cudf without it installed raises ImportError."""
+        try:
+            import cudf  # noqa: F401
+            pytest.skip("cudf is installed")
+        except ImportError:
+            pass
+        with pytest.raises(ImportError):
+            DataProfilerService(backend='cudf')
+    
+    def test_polars_backend_matches_pandas(self):
+        """Test that the polars backend reports the same profile values."""
+        pytest.importorskip("polars")
+        data = pd.DataFrame({
+            'num': [1.0, 2.0, np.nan, 4.0, 4.0],
+            'cat': ['a', 'b', '', 'a', 'a'],
+        })
+        
+        expected = DataProfilerService().profile(data)
+        profile = DataProfilerService(backend='polars').profile(data)
+        
+        assert profile.duplicate_rows == expected.duplicate_rows
+        assert profile.overall_missing_percentage == pytest.approx(expected.overall_missing_percentage)
+        for column in data.columns:
+            got = profile.columns[column]
+            want = expected.columns[column]
+            assert got.null_count == want.null_count
+            assert got.inferred_type == want.inferred_type
+        assert profile.columns['num'].mean == pytest.approx(expected.columns['num'].mean)
+
+
+class TestHllNunique:
+    """Tests for the HyperLogLog unique count estimate."""
+    
+    def test_hll_estimate_close_to_exact(self):
+        """Test that the estimate is within a few percent of nunique."""
+        series = pd.Series([f'value_{i % 20000}' for i in range(60000)])
+        estimate = hll_nunique(series)
+        assert abs(estimate - 20000) / 20000 < 0.03
+    
+    def test_hll_ignores_nulls(self):
+        """Test that nulls are not counted as a distinct value."""
+        assert hll_nunique(pd.Series([None, None], dtype=object)) == 0
+        assert hll_nunique(pd.Series([1.0, np.nan, 2.0, 1.0])) == 2
+    
+    def test_moderate_column_is_counted_exactly(self):
+        """Test that columns up to HLL_MIN_ROWS values get an exact count."""
+        data = pd.DataFrame({'id': np.arange(60000)})
+        profile = DataProfilerService().profile(data)
+        assert profile.columns['id'].unique_count == 60000
+    
+    def test_large_column_uses_estimate(self):
+        """Test that large all-unique columns are not underestimated."""
+        n = HLL_MIN_ROWS + 20000
+        data = pd.DataFrame({'id': np.arange(n)})
+        profile = DataProfilerService().profile(data)
+        assert abs(profile.columns['id'].unique_count - n) / n < 0.03
+
+
+class TestProfileParquet:
+    """Tests for profiling Parquet files from their footer statistics."""
+    
+    def test_profile_parquet_matches_dataframe_profile(self, tmp_path):
+        """Test that the Parquet profile agrees with profiling the DataFrame."""
+        pytest.importorskip("pyarrow")
+        data = pd.DataFrame({
+            'amount': [1.5, 2.5, np.nan, 4.5, 4.5],
+            'flag': [0, 1, 1, 0, 0],
+            'label': ['a', 'b', '', 'a', 'a'],
+            'grade': pd.Categorical(['x', 'y', None, 'x', 'x'], categories=['x', 'y', 'z']),
+            'empty': [None] * 5,
+        })
+        path = tmp_path / 'data.parquet'
+        data.to_parquet(path, row_group_size=2)
+        
+        expected = DataProfilerService().profile(data)
+        profile = DataProfilerService().profile_parquet(str(path))
+        
+        assert profile.row_count == 5
+        assert profile.duplicate_rows == expected.duplicate_rows
+        for column in data.columns:
+            got = profile.columns[column]
+            want = expected.columns[column]
+            assert got.inferred_type == want.inferred_type
+            assert got.null_count == want.null_count
+            assert got.unique_count == want.unique_count
+        assert profile.columns['amount'].max_value == 4.5
+        assert profile.columns['amount'].mean == pytest.approx(expected.columns['amount'].mean)
@@ -5,13 +5,18 @@ import pandas as pd
 import numpy as np
 
 from src.data_profiling.schema_detector import (
+    ColumnStats,
     SchemaDetector,
+    _arrow_string_view,
     infer_column_type,
     is_numeric,
     is_boolean,
     is_datetime,
     is_categorical,
     is_text,
+    is_mixed_type,
+    sample_positions,
+    to_datetime_unique,
     INFERRED_NUMERIC,
     INFERRED_BOOLEAN,
     INFERRED_DATETIME,
@@ -73,6 +78,158 @@ class TestSchemaDetector:
         assert result['numeric'] == INFERRED_NUMERIC
         assert result['text'] == INFERRED_TEXT
         assert result['bool'] == INFERRED_BOOLEAN
+    
+    def test_detect_resolves_typed_columns_from_dtype(self, monkeypatch):
+        """Test that typed columns skip the value probes entirely."""
+        from src.data_profiling import schema_detector
+        
+        schema_detector.clear_type_cache()
+        probed = []
+        original = schema_detector.infer_column_type
+        monkeypatch.setattr(
+            schema_detector,
+            'infer_column_type',
+            lambda series, *args, **kwargs: probed.append(series.name) or original(series, *args, **kwargs),
+        )
+        data = pd.DataFrame({
+            'flag': [0, 1, 1],
+            'amount': [1.5, 2.5, np.nan],
+            'when': pd.date_range('2023-01-01', periods=3, tz='UTC'),
+            'label': ['a', 'b', 'c'],
+        })
+        
+        result = SchemaDetector().detect(data)
+        
+        assert result == {
+            'flag': INFERRED_BOOLEAN,
+            'amount': INFERRED_NUMERIC,
+            'when': INFERRED_DATETIME,
+            'label': INFERRED_TEXT,
+        }
+        assert probed == ['label']
+    
+    def test_detect_cache_follows_dtype_changes(self):
+        """Test that cached results are reused but refreshed when dtypes change."""
+        data = pd.DataFrame({'col': list('abcdefghij')})
+        detector = SchemaDetector()
+        first = detector.detect(data)
+        first['col'] = 'tampered'
+        assert detector.detect(data)['col'] == INFERRED_TEXT
+        
+        data['col'] = np.arange(10, dtype=float)
+        assert detector.detect(data)['col'] == INFERRED_NUMERIC
+    
+    def test_detect_reuses_types_of_copied_columns(self, monkeypatch):
+        """Test that a copy of a frame reuses the shared column type cache."""
+        from src.data_profiling import schema_detector
+        
+        schema_detector.clear_type_cache()
+        data = pd.DataFrame({'label': list('abcdefghij'), 'code': list('aabbccddee')})
+        first = SchemaDetector().detect(data)
+        
+        probed = []
+        original = schema_detector.infer_column_type
+        monkeypatch.setattr(
+            schema_detector,
+            'infer_column_type',
+            lambda series, *args, **kwargs: probed.append(series.name) or original(series, *args, **kwargs),
+        )
+        copy = data.copy()
+        copy.loc[0, 'code'] = 'z'
+        
+        assert SchemaDetector().detect(copy)['label'] == first['label']
+        assert probed == ['code']
+    
+    def test_type_cache_separates_values_with_same_string_form(self):
+        """Test that True and 'True' columns do not share a cached type."""
+        from src.data_profiling import schema_detector
+        
+        schema_detector.clear_type_cache()
+        strings = pd.DataFrame({'col': pd.Series(['True', 'yes', 'no'] * 10, dtype=object)})
+        expected = SchemaDetector().detect(strings)['col']
+        
+        schema_detector.clear_type_cache()
+        mixed = pd.DataFrame({'col': pd.Series([True, 'yes', 'no'] * 10, dtype=object)})
+        SchemaDetector().detect(mixed)
+        assert SchemaDetector().detect(strings)['col'] == expected == INFERRED_BOOLEAN
+        
+        schema_detector.clear_type_cache()
+        SchemaDetector().detect(pd.DataFrame({'col': [1, 2, 3] * 10}, dtype=object))
+        assert SchemaDetector().detect(pd.DataFrame({'col': ['1', '2', '3'] * 10}))['col'] == (
+            infer_column_type(pd.Series(['1', '2', '3'] * 10))
+        )
+    
+    def test_type_cache_is_bounded(self, monkeypatch):
+        """Test that the shared column type cache evicts its oldest entries."""
+        from src.data_profiling import schema_detector
+        
+        schema_detector.clear_type_cache()
+        monkeypatch.setattr(schema_detector, 'TYPE_CACHE_SIZE', 2)
+        detector = SchemaDetector()
+        for i in range(4):
+            detector.detect(pd.DataFrame({'col': [f'{i}-{j}' for j in range(10)]}))
+        
+        assert len(schema_detector._type_cache) == 2
+
+
+class TestColumnStats:
+    """Tests for the shared per-column stats."""
+    
+    def test_column_stats_values(self):
+        """Test that stats hold the non-null values and unique count."""
+        stats = ColumnStats.from_series(pd.Series(['1', '2', None, '2']))
+        assert stats.n == 3
+        assert stats.n_unique == 2
+    
+    def test_column_stats_reuses_numeric_coercion(self):
+        """Test that the numeric coercion of a sample is computed once."""
+        stats = ColumnStats.from_series(pd.Series([str(i) for i in range(3000)]))
+        assert len(stats.sample(1000)) == 1000
+        assert stats.numeric(1000) is stats.numeric(1000)
+    
+    def test_n_unique_is_estimated_on_long_columns(self):
+        """Test that long columns get a close HyperLogLog unique count."""
+        stats = ColumnStats.from_series(pd.Series([f'v{i % 40000}' for i in range(150000)]))
+        assert abs(stats.n_unique - 40000) / 40000 < 0.05
+    
+    def test_sample_matches_series_sample_and_shares_positions(self):
+        """Test that samples match Series.sample and reuse one draw per size."""
+        series = pd.Series([str(i) for i in range(3000)])
+        stats = ColumnStats.from_series(series)
+        pd.testing.assert_series_equal(stats.sample(1000), series.sample(n=1000, random_state=42))
+        assert sample_positions(3000, 1000) is sample_positions(3000, 1000)
+    
+    def test_numeric_adaptive_stops_early_on_clear_columns(self):
+        """Test that clearly numeric or clearly text columns coerce a small prefix."""
+        numbers = ColumnStats.from_series(pd.Series([str(i) for i in range(3000)]))
+        words = ColumnStats.from_series(pd.Series([f'w{i}' for i in range(3000)]))
+        assert len(numbers.numeric_adaptive(1000)) == 200
+        assert len(words.numeric_adaptive(1000)) == 200
+    
+    def test_numeric_adaptive_grows_in_uncertain_band(self):
+        """Test that a half-numeric column is coerced over the full sample."""
+        values = [str(i) if i % 2 else f'w{i}' for i in range(3000)]
+        stats = ColumnStats.from_series(pd.Series(values))
+        converted = stats.numeric_adaptive(1000)
+        assert len(converted) == 1000
+        assert converted is stats.numeric(1000)
+
+
+class TestArrowStringView:
+    """Tests for the Arrow-backed string view used during detection."""
+    
+    def test_pure_string_column_is_converted(self):
+        """Test that object columns of strings get an Arrow string dtype."""
+        pytest.importorskip("pyarrow")
+        series = pd.Series(['a', 'b', None], dtype=object)
+        view = _arrow_string_view(series)
+        assert isinstance(view.dtype, pd.StringDtype)
+        assert view.dtype.storage == 'pyarrow'
+    
+    def test_mixed_object_column_is_unchanged(self):
+        """Test that columns holding non-strings are passed through."""
+        series = pd.Series(['a', 1, 2.5], dtype=object)
+        assert _arrow_string_view(series) is series
 
 
 class TestIsNumeric:
@@ -122,6 +279,16 @@ class TestIsBoolean:
         series = pd.Series(['yes', 'no', 'yes', 'no'])
         assert is_boolean(series)[0] is True
     
+    def test_is_boolean_normalizes_case_and_whitespace(self):
+        """Test that case and surrounding whitespace are ignored."""
+        series = pd.Series([' Yes', 'no ', 'YES', 'No'] * 50)
+        assert is_boolean(series) == (True, 1.0)
+    
+    def test_is_boolean_with_float_01(self):
+        """Test that float 0.0/1.0 values are not treated as boolean."""
+        series = pd.Series([0.0, 1.0, 0.0])
+        assert is_boolean(series)[0] is False
+    
     def test_is_boolean_with_text(self):
         """Test is_boolean with text values."""
         series = pd.Series(['a', 'b', 'c'])
@@ -141,10 +308,106 @@ class TestIsDatetime:
         series = pd.Series(['2023-01-01', '2023-01-02', '2023-01-03'])
         assert is_datetime(series)[0] == True
     
+    def test_is_datetime_prefilter_rejects_prose(self):
+        """Test that values that don't look like dates are rejected early."""
+        series = pd.Series(['apple pie', 'banana split', 'cherry tart'] * 10)
+        assert is_datetime(series) == (False, 0.0)
+    
+    def test_is_datetime_prefilter_uses_sampled_values(self):
+        """Test that a run of non-dates at the top does not hide a date column."""
+        dates = pd.date_range('2020-01-01', periods=2850).strftime('%Y-%m-%d').tolist()
+        series = pd.Series(['n/a text'] * 150 + dates)
+        assert is_datetime(series)[0] == True
+    
+    def test_is_datetime_sampled_forms_outside_prefix_pattern(self):
+        """Test that a sampled column of dates the shape check misses is parsed."""
+        dates = pd.date_range('2020-01-01', periods=2850).strftime('%d-%b-%Y').tolist()
+        series = pd.Series(['n/a text'] * 150 + dates)
+        detected, confidence = is_datetime(series)
+        assert detected == True
+        assert confidence > 0.9
+    
+    def test_is_datetime_prefilter_rejects_numbered_prose(self):
+        """Test that prose starting with a date-like number is rejected early."""
+        series = pd.Series(['12-15 people attended', '3/4 of votes counted'] * 10)
+        assert is_datetime(series) == (False, 0.0)
+    
+    def test_is_datetime_parses_words_flagged_as_prose(self):
+        """Test that words pandas parses as dates do not reject the column."""
+        series = pd.Series(['2023-01-05', 'today'] * 10)
+        assert is_datetime(series)[0] == True
+    
+    def test_is_datetime_with_full_month_names(self):
+        """Test that full month names are not treated as prose."""
+        series = pd.Series(['September 4 2023', 'December 5 2023'] * 5)
+        assert is_datetime(series)[0] == True
+    
+    def test_is_datetime_with_month_names(self):
+        """Test that month-name dates pass the prefilter."""
+        series = pd.Series(['Jan 5 2023', 'Feb 6 2023', 'Mar 7 2023'])
+        assert is_datetime(series)[0] == True
+    
+    @pytest.mark.parametrize('values', [
+        ['31-Jan-2023', '28-Feb-2023', '15-Mar-2023'],
+        ['Jan-2023', 'Feb-2023', 'Mar-2023'],
+        ['Monday, January 2, 2023', 'Tuesday, January 3, 2023', 'Friday, March 3, 2023'],
+    ])
+    def test_is_datetime_parses_forms_outside_prefix_pattern(self, values):
+        """Test that date forms the shape check misses are still parsed."""
+        series = pd.Series(values * 10)
+        assert is_datetime(series)[0] == True
+        detected = SchemaDetector().detect(pd.DataFrame({'col': series}))
+        assert detected['col'] == INFERRED_DATETIME
+    
     def test_is_datetime_with_numeric(self):
         """Test is_datetime with numeric values."""
         series = pd.Series([1, 2, 3, 4, 5])
         assert is_datetime(series)[0] == False
+    
+    def test_to_datetime_unique_matches_to_datetime(self):
+        """Test that parsing uniques gives the same result as parsing every row."""
+        series = pd.Series(
+            ['2023-01-01', 'bad', None, '2023-01-02', '2023-01-01'],
+            index=[10, 11, 12, 13, 14],
+            name='when',
+        )
+        expected = pd.to_datetime(series, errors='coerce')
+        pd.testing.assert_series_equal(to_datetime_unique(series), expected)
+    
+    def test_to_datetime_unique_unsigned_ints(self):
+        """Test that unsigned ints convert like to_datetime, including overflow."""
+        for values in (np.array([0, 10**18], dtype=np.uint64), np.array([2**64 - 1, 5], dtype=np.uint64)):
+            series = pd.Series(values)
+            expected = pd.to_datetime(series, errors='coerce')
+            pd.testing.assert_series_equal(to_datetime_unique(series), expected)
+
+
+class TestIsMixedType:
+    """Tests for is_mixed_type function."""
+    
+    def test_numeric_strings_count_as_numeric(self):
+        """Test that strings parsing as numbers count toward numeric."""
+        series = pd.Series(['1', '2.5', '-3', 4, 5.0, '1e3'])
+        assert is_mixed_type(series) == (False, INFERRED_NUMERIC)
+    
+    @pytest.mark.parametrize("values", [
+        ['1', '2', 'nan'],
+        ['-inf', '1', 'inf', 'NaN'],
+        ['1_000', '2_000', '3'],
+    ])
+    def test_float_only_spellings_count_as_numeric(self, values):
+        """Test that strings float() accepts but to_numeric rejects are numeric."""
+        assert is_mixed_type(pd.Series(values)) == (False, INFERRED_NUMERIC)
+    
+    def test_numbers_and_words_are_mixed(self):
+        """Test a column split between numbers and words."""
+        series = pd.Series([1, 2, 'a', 'b', None, True])
+        assert is_mixed_type(series) == (True, INFERRED_NUMERIC)
+    
+    def test_typed_column_is_not_mixed(self):
+        """Test that numeric and bool dtypes are never mixed."""
+        assert is_mixed_type(pd.Series([1.5, np.nan, 2.0])) == (False, INFERRED_NUMERIC)
+        assert is_mixed_type(pd.Series([True, False])) == (False, INFERRED_BOOLEAN)
 
 
 class TestIsCategorical:
@@ -218,3 +481,56 @@ class TestSchemaDetectorWithConfidence:
         assert len(result['col']) == 2
         assert isinstance(result['col'][0], str)  # type
         assert isinstance(result['col'][1], float)  # confidence
+    
+    def test_detect_with_confidence_typed_columns_skip_probes(self, monkeypatch):
+        """Test that typed columns are resolved from their dtype with full confidence."""
+        from src.data_profiling import schema_detector
+        
+        def fail(*args, **kwargs):
+            raise AssertionError("probe should not run")
+        
+        monkeypatch.setattr(schema_detector, 'is_datetime', fail)
+        monkeypatch.setattr(schema_detector, 'is_numeric', fail)
+        data = pd.DataFrame({
+            'flag': [0, 1, 1],
+            'amount': [1.5, 2.5, 3.5],
+            'when': pd.date_range('2023-01-01', periods=3),
+        })
+        
+        result = SchemaDetector().detect_with_confidence(data)
+        
+        assert result == {
+            'flag': (INFERRED_BOOLEAN, 1.0),
+            'amount': (INFERRED_NUMERIC, 1.0),
+            'when': (INFERRED_DATETIME, 1.0),
+        }
+    
+    def test_detect_with_confidence_coerces_to_numeric_once(self, monkeypatch):
+        """Test that the numeric and datetime probes share one coercion."""
+        from src.data_profiling import schema_detector
+        
+        calls = []
+        original = pd.to_numeric
+        monkeypatch.setattr(
+            schema_detector.pd,
+            'to_numeric',
+            lambda *args, **kwargs: calls.append(1) or original(*args, **kwargs),
+        )
+        data = pd.DataFrame({'col': [f'word{i}' for i in range(100001)]})
+        
+        result = SchemaDetector().detect_with_confidence(data)
+        
+        assert result['col'][0] == INFERRED_TEXT
+        assert len(calls) == 1
+    
+    def test_detect_with_confidence_wide_frame(self):
+        """Test that wide frames probed in parallel keep column order."""
+        data = pd.DataFrame({
+            f'col{i}': ([1, 2, 3, 4, 5] if i % 2 else ['yes', 'no', 'yes', 'no', 'yes'])
+            for i in range(10)
+        })
+        result = SchemaDetector().detect_with_confidence(data)
+        
+        assert list(result) == list(data.columns)
+        assert result['col0'] == (INFERRED_BOOLEAN, 1.0)
+        assert result['col1'][0] == INFERRED_NUMERIC
@@ -0,0 +1,116 @@
+"""Tests for the command-line interface."""
+
+import pandas as pd
+import pytest
+
+from src.common.types.transformation import Transformation, TransformationType
+from src.data_profiling import DataProfilerService
+from src.orchestrator import cli
+from src.orchestrator.cli import _read_csv, _write_model, _write_records, main
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    """A CSV file with an ISO timestamp column and an int column with a gap."""
+    path = tmp_path / "data.csv"
+    path.write_text(
+        "when,count,label\n"
+        "2023-01-01 10:00:00,1,a\n"
+        "2023-01-02 11:30:00,,b\n"
+        "2023-01-03 12:45:00,3,\n"
+    )
+    return path
+
+
+class TestReadCsv:
+    """Tests for _read_csv."""
+    
+    def test_default_engine_keeps_timestamps_as_strings(self, csv_path):
+        """Test that the C parser leaves type detection to the profiler."""
+        data = _read_csv(csv_path)
+        assert not pd.api.types.is_datetime64_any_dtype(data["when"])
+        assert data["count"].dtype == "float64"
+        assert data["label"].isna().sum() == 1
+    
+    def test_dtype_hints_that_do_not_fit_are_ignored(self, csv_path):
+        """Test that the C parser falls back to inference on bad hints."""
+        data = _read_csv(csv_path, dtype={"label": "int64"})
+        pd.testing.assert_frame_equal(data, _read_csv(csv_path))
+    
+    def test_pyarrow_engine_reads_same_values(self, csv_path):
+        """Test that the opt-in pyarrow parser reads the same cells."""
+        pytest.importorskip("pyarrow")
+        data = _read_csv(csv_path, engine="pyarrow")
+        expected = _read_csv(csv_path)
+        assert list(data.columns) == list(expected.columns)
+        assert data["count"].tolist()[::2] == expected["count"].tolist()[::2]
+        # pyarrow and to_datetime may pick different units for the same instants
+        pd.testing.assert_series_equal(
+            pd.to_datetime(data["when"]).dt.as_unit("us"),
+            pd.to_datetime(expected["when"]).dt.as_unit("us"),
+        )
+
+
+@pytest.fixture
+def validate_args(tmp_path, csv_path):
+    """Arguments for the validate command; one of three candidates fails."""
+    profile_path = tmp_path / "profile.json"
+    _write_model(DataProfilerService().profile(_read_csv(csv_path)), profile_path)
+    
+    candidates_path = tmp_path / "candidates.jsonl"
+    _write_records(
+        [
+            Transformation(
+                id=f"fill-{column}",
+                type=TransformationType.FILL_MISSING,
+                target_columns=[column],
+                params={"strategy": "mode"},
+                reversible=True,
+                description=f"Fill missing values in {column}",
+            )
+            for column in ("count", "label", "no_such_column")
+        ],
+        candidates_path,
+    )
+    return [
+        "--quiet",
+        "validate",
+        "--candidates", str(candidates_path),
+        "--data", str(csv_path),
+        "--profile", str(profile_path),
+    ]
+
+
+class TestValidateCommand:
+    """Tests for the validate command."""
+    
+    def test_serial_validation_reports_skipped_candidates(self, validate_args, capsys, monkeypatch):
+        """Test that small batches stay in process and count failed candidates."""
+        def no_pool(*args, **kwargs):
+            raise AssertionError("small batches should not start worker processes")
+        
+        monkeypatch.setattr(cli, "ProcessPoolExecutor", no_pool)
+        assert main(validate_args) == 0
+        out = capsys.readouterr().out
+        assert "Validated 2 of 3 candidates" in out
+        assert "Skipped 1 candidates that failed to execute" in out
+    
+    def test_process_pool_validation_reports_skipped_candidates(
+        self, validate_args, capsys, monkeypatch
+    ):
+        """Test that worker processes give the same outcome as the serial path."""
+        pools = []
+        
+        class RecordingPool(cli.ProcessPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                pools.append(self)
+        
+        monkeypatch.setattr(cli, "ProcessPoolExecutor", RecordingPool)
+        monkeypatch.setattr(cli, "VALIDATE_WORK_PER_WORKER", 1)
+        monkeypatch.setattr(cli.os, "cpu_count", lambda: 2)
+        assert main(validate_args) == 0
+        out = capsys.readouterr().out
+        assert len(pools) == 1
+        assert "Validated 2 of 3 candidates" in out
+        assert "Skipped 1 candidates that failed to execute" in out
@@ -1,5 +1,6 @@
 """Tests for the orchestrator pipeline."""
 
+import asyncio
 import json
 import tempfile
 from pathlib import Path
@@ -324,6 +325,23 @@ class TestFailureRecovery:
         
         assert strategy == FailureStrategy.SKIP
 
+    def test_recovery_history_bounded(self):
+        """Test that history_size keeps only the newest actions."""
+        recovery = FailureRecovery(strategy=FailureStrategy.ABORT, history_size=2)
+        state = PipelineState(
+            current_step=PipelineStep.PROFILING,
+            completed_steps=[],
+        )
+
+        for step in (PipelineStep.PROFILING, PipelineStep.GENERATION, PipelineStep.VALIDATION):
+            recovery.handle_failure(step, ValueError("Test error"), state)
+
+        history = recovery.get_recovery_history()
+        assert [action.step for action in history] == [
+            PipelineStep.GENERATION, PipelineStep.VALIDATION
+        ]
+        assert list(recovery.iter_recovery_history()) == history
+
     def test_retry_decorator(self):
         """Test retry decorator."""
         call_count = 0
@@ -339,6 +357,37 @@ class TestFailureRecovery:
         result = failing_function()
         assert result == "success"
         assert call_count == 3
+    
+    def test_retry_decorator_config_caps_delay(self):
+        """Test retry delays follow RetryConfig and stop at max_delay."""
+        config = RetryConfig(max_retries=4, initial_delay=1.0, backoff_factor=3.0, max_delay=5.0)
+        
+        @with_retry(config=config)
+        def always_failing():
+            raise ValueError("Fail")
+        
+        with patch("src.orchestrator.failure_recovery._sleep") as sleep:
+            with pytest.raises(ValueError):
+                always_failing()
+        assert [c.args[0] for c in sleep.call_args_list] == [1.0, 3.0, 5.0, 5.0]
+    
+    def test_retry_decorator_async(self):
+        """Test retry decorator on a coroutine function."""
+        call_count = 0
+        
+        @with_retry(max_retries=2, delay=0.01)
+        async def failing_coroutine():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 3:
+                raise ValueError("Fail")
+            return "success"
+        
+        with patch("src.orchestrator.failure_recovery._sleep") as blocking_sleep:
+            result = asyncio.run(failing_coroutine())
+        assert result == "success"
+        assert call_count == 3
+        blocking_sleep.assert_not_called()
 
     def test_circuit_breaker(self):
         """Test circuit breaker."""